@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Benchmark ładowania plików CSV
+==============================
+
+Porównuje konwersję komórka po komórce (infer_schema=False) z konwersją
+kolumnową na podstawie wywnioskowanego schematu (infer_schema=True)
+oraz parsowanie równoległe (workers=N).
+
+Użycie:
+    python benchmarks/bench_load_csv.py [liczba_wierszy]
+"""
+
+import os
+import sys
+import time
+import random
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from dataflow.data_utils import load_csv_data
+
+
+def generate_csv(path: str, rows: int) -> None:
+    """Generuje plik CSV z kolumnami tekstowymi, całkowitymi i zmiennoprzecinkowymi."""
+    cities = ['Warszawa', 'Kraków', 'Gdańsk', 'Wrocław', 'Poznań']
+    rng = random.Random(42)
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write('id,name,age,city,salary,balance\n')
+        for i in range(rows):
+            file.write(f"{i},user{i},{rng.randint(18, 80)},{rng.choice(cities)},"
+                       f"{rng.uniform(3000, 20000):.2f},{rng.randint(-5000, 5000)}\n")
+
+
+def measure(label: str, **kwargs) -> float:
+    """Mierzy czas ładowania pliku z podanymi opcjami."""
+    start = time.perf_counter()
+    data = load_csv_data(PATH, **kwargs)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<35} {elapsed:8.3f} s  ({len(data)} wierszy)")
+    return elapsed
+
+
+if __name__ == '__main__':
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    fd, PATH = tempfile.mkstemp(suffix='.csv')
+    os.close(fd)
+    try:
+        print(f"Generowanie pliku z {rows} wierszami...")
+        generate_csv(PATH, rows)
+        
+        print("Ładowanie:")
+        per_cell = measure('konwersja komórka po komórce', infer_schema=False)
+        inferred = measure('schemat wywnioskowany z próbki')
+        explicit = measure('schemat jawny', schema={
+            'id': int, 'name': str, 'age': int, 'city': str,
+            'salary': float, 'balance': int
+        })
+        
+        workers = os.cpu_count() or 1
+        parallel = measure(f'schemat wywnioskowany, workers={workers}', workers=workers)
+        
+        print(f"Przyspieszenie (schemat wywnioskowany): {per_cell / inferred:.2f}x")
+        print(f"Przyspieszenie (schemat jawny): {per_cell / explicit:.2f}x")
+        print(f"Przyspieszenie (workers={workers}): {per_cell / parallel:.2f}x")
+    finally:
+        os.unlink(PATH)
@@ -10,14 +10,37 @@ Biblioteka zawiera narzędzia do:
 
 from .data_utils import (
     load_csv_data,
+    iter_csv_data,
+    infer_csv_schema,
     filter_data,
     group_by_column,
     DataProcessor
 )
 
+from .columnar import ColumnStore
+
+from .aggregations import aggregate_data
+
+from .joins import join_data
+
+from .predicates import compile_conditions
+
+from .query import LazyQuery
+
+from .mapped import MappedCSV
+
+from .columnfile import ColumnarFile, write_columnar
+
+from .sketches import HyperLogLog, QuantileSketch
+
 from .math_tools import (
     calculate_statistics,
     normalize_data,
+    normalize_stream,
+    calculate_quantiles,
+    approximate_quantiles,
+    correlation_matrix,
+    RunningStatistics,
     MathCalculator
 )
 
@@ -30,7 +53,12 @@ from .text_processing import (
 
 
 __all__ = [
-    'load_csv_data', 'filter_data', 'group_by_column', 'DataProcessor',
-    'calculate_statistics', 'normalize_data', 'MathCalculator',
+    'load_csv_data', 'iter_csv_data', 'infer_csv_schema',
+    'filter_data', 'group_by_column', 'DataProcessor',
+    'aggregate_data', 'join_data', 'ColumnStore', 'compile_conditions',
+    'LazyQuery', 'MappedCSV', 'ColumnarFile', 'write_columnar', 'HyperLogLog',
+    'QuantileSketch', 'calculate_statistics', 'normalize_data', 'normalize_stream',
+    'calculate_quantiles', 'approximate_quantiles', 'correlation_matrix',
+    'RunningStatistics', 'MathCalculator',
     'clean_text', 'extract_keywords', 'TextAnalyzer'
 ]
\ No newline at end of file
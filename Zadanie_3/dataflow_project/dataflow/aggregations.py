@@ -0,0 +1,131 @@
+"""
+Moduł aggregations - agregacje w grupach
+========================================
+
+Ten moduł zawiera funkcje i klasy do:
+- Obliczania sum, średnich, minimów, maksimów i liczności w grupach
+- Agregowania danych w jednym przebiegu bez przechowywania członków grup
+- Grupowania według jednej lub wielu kolumn
+"""
+
+from typing import List, Dict, Any, Iterable, Union, Tuple
+
+AGGREGATIONS = ('count', 'sum', 'mean', 'min', 'max')
+
+
+class _Accumulator:
+    """Stan agregacji jednej kolumny w jednej grupie."""
+    
+    __slots__ = ('count', 'total', 'minimum', 'maximum')
+    
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.minimum = None
+        self.maximum = None
+    
+    def add(self, value: Any, track_sum: bool, track_range: bool) -> None:
+        """Dodaje wartość do stanu."""
+        self.count += 1
+        if track_sum:
+            self.total += value
+        if track_range:
+            if self.minimum is None or value < self.minimum:
+                self.minimum = value
+            if self.maximum is None or value > self.maximum:
+                self.maximum = value
+    
+    def result(self, name: str) -> Any:
+        """Zwraca wynik agregacji o podanej nazwie."""
+        if name == 'count':
+            return self.count
+        if name == 'sum':
+            return self.total
+        if name == 'mean':
+            return self.total / self.count if self.count else None
+        if name == 'min':
+            return self.minimum
+        return self.maximum
+
+
+def _normalize_aggs(aggs: Dict[str, Union[str, List[str]]]) -> Dict[str, List[str]]:
+    """Sprawdza nazwy agregacji i zamienia pojedyncze nazwy na listy."""
+    normalized = {}
+    for column, names in aggs.items():
+        names = [names] if isinstance(names, str) else list(names)
+        for name in names:
+            if name not in AGGREGATIONS:
+                raise ValueError(f"Nieznana agregacja '{name}'. "
+                                 f"Dostępne: {', '.join(AGGREGATIONS)}")
+        normalized[column] = names
+    return normalized
+
+
+def aggregate_data(data: Iterable[Dict[str, Any]], by: Union[str, List[str]],
+                   aggs: Dict[str, Union[str, List[str]]]) -> Dict[Any, Dict[str, Any]]:
+    """
+    Agreguje dane w grupach w jednym przebiegu.
+    
+    Dla każdej grupy przechowywane są tylko liczniki (liczność, suma,
+    minimum, maksimum), więc zużycie pamięci zależy od liczby grup,
+    a nie od liczby wierszy. Dane mogą pochodzić z iteratora
+    (np. iter_csv_data).
+    
+    Args:
+        data (Iterable[Dict[str, Any]]): Dane do agregacji (lista lub iterator)
+        by (Union[str, List[str]]): Kolumna lub lista kolumn grupowania
+        aggs (Dict[str, Union[str, List[str]]]): Agregacje dla kolumn,
+            np. {'salary': ['sum', 'mean', 'count', 'min', 'max']}
+    
+    Returns:
+        Dict[Any, Dict[str, Any]]: Słownik {klucz grupy: wyniki}. Klucz to
+            wartość kolumny (gdy by jest napisem) lub krotka wartości (gdy
+            by jest listą). Wyniki mają klucz 'count' (liczba wierszy grupy)
+            oraz '<kolumna>_<agregacja>' dla każdej agregacji. Brakujące
+            wartości kolumny są pomijane w jej agregacjach.
+    
+    Raises:
+        KeyError: Gdy kolumna grupowania nie istnieje w wierszu
+        ValueError: Gdy agregacja jest nieznana lub kolumna sumowana
+            zawiera wartości nieliczbowe
+    
+    Example:
+        >>> data = [{'city': 'A', 'salary': 10}, {'city': 'A', 'salary': 20}]
+        >>> aggregate_data(data, 'city', {'salary': ['sum', 'mean']})
+        {'A': {'count': 2, 'salary_sum': 30, 'salary_mean': 15.0}}
+    """
+    aggs = _normalize_aggs(aggs)
+    keys = [by] if isinstance(by, str) else list(by)
+    single = isinstance(by, str)
+    columns: List[Tuple[str, bool, bool]] = [
+        (column, bool({'sum', 'mean'} & set(names)), bool({'min', 'max'} & set(names)))
+        for column, names in aggs.items()
+    ]
+    
+    groups: Dict[Any, Tuple[List[int], List[_Accumulator]]] = {}
+    for row in data:
+        try:
+            key = row[keys[0]] if single else tuple(row[column] for column in keys)
+        except KeyError as e:
+            raise KeyError(f"Kolumna {e} nie istnieje w danych")
+        state = groups.get(key)
+        if state is None:
+            state = groups[key] = ([0], [_Accumulator() for _ in columns])
+        state[0][0] += 1
+        for (column, track_sum, track_range), accumulator in zip(columns, state[1]):
+            if column not in row:
+                continue
+            try:
+                accumulator.add(row[column], track_sum, track_range)
+            except TypeError:
+                raise ValueError(f"Kolumna '{column}' zawiera wartości, "
+                                 f"których nie można agregować: {row[column]!r}")
+    
+    results = {}
+    for key, (row_count, accumulators) in groups.items():
+        result = {'count': row_count[0]}
+        for (column, names), accumulator in zip(aggs.items(), accumulators):
+            for name in names:
+                result[f"{column}_{name}"] = accumulator.result(name)
+        results[key] = result
+    return results
@@ -0,0 +1,187 @@
+"""
+Moduł cache - pamięć podręczna sparsowanych plików CSV
+======================================================
+
+Ten moduł zawiera funkcje do:
+- Zapisywania sparsowanych i przekonwertowanych danych CSV w zwartym
+  binarnym formacie kolumnowym
+- Odczytywania ich zamiast ponownego parsowania pliku
+- Automatycznego unieważniania wpisu, gdy plik źródłowy się zmienił
+  (inny rozmiar lub czas modyfikacji)
+
+Format pliku: nagłówek (sygnatura, rozmiar i czas modyfikacji źródła,
+liczba wierszy i kolumn), a następnie kolejne kolumny. Kolumny int i float
+są zapisywane jako surowe bufory array('q') / array('d'), kolumny tekstowe
+jako jeden blok UTF-8 z tablicą długości, a pozostałe (mieszane typy)
+przez pickle. Plik pamięci podręcznej jest więc zaufanym plikiem lokalnym -
+katalogu nie należy współdzielić z niezaufanymi użytkownikami.
+"""
+
+import os
+import sys
+import struct
+import pickle
+import hashlib
+import tempfile
+from array import array
+from itertools import accumulate
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+
+CACHE_SUFFIX = '.dfcache'
+
+_MAGIC = b'DFCACHE1'
+_HEADER = struct.Struct('<8sqqqq')
+_COLUMN = struct.Struct('<i1sq')
+
+Columns = Dict[str, Sequence[Any]]
+
+
+def cache_path(cache_dir: str, filepath: str, options: Dict[str, Any]) -> str:
+    """
+    Wyznacza ścieżkę pliku pamięci podręcznej dla pliku CSV.
+    
+    Nazwa zależy od bezwzględnej ścieżki pliku i opcji parsowania
+    (inne opcje dają inny wynik, więc trafiają do innego wpisu).
+    
+    Args:
+        cache_dir (str): Katalog pamięci podręcznej
+        filepath (str): Ścieżka do pliku CSV
+        options (Dict[str, Any]): Opcje parsowania wpływające na wynik
+    
+    Returns:
+        str: Ścieżka pliku pamięci podręcznej
+    """
+    key = repr((os.path.abspath(filepath), sys.byteorder, sorted(options.items())))
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+    return os.path.join(cache_dir, digest + CACHE_SUFFIX)
+
+
+def source_stamp(filepath: str) -> Tuple[int, int]:
+    """
+    Zwraca rozmiar i czas modyfikacji pliku źródłowego.
+    
+    Args:
+        filepath (str): Ścieżka do pliku
+    
+    Returns:
+        Tuple[int, int]: Rozmiar w bajtach i czas modyfikacji w nanosekundach
+    
+    Raises:
+        FileNotFoundError: Gdy plik nie istnieje
+    """
+    stat = os.stat(filepath)
+    return stat.st_size, getattr(stat, 'st_mtime_ns', int(stat.st_mtime * 1e9))
+
+
+def _encode_column(values: List[Any]) -> Tuple[bytes, bytes]:
+    """Koduje kolumnę; zwraca rodzaj ('q', 'd', 's' lub 'o') i dane."""
+    types = set(map(type, values))
+    if types <= {int}:
+        try:
+            return b'q', array('q', values).tobytes()
+        except OverflowError:
+            pass
+    elif types == {float}:
+        return b'd', array('d', values).tobytes()
+    elif types == {str}:
+        lengths = array('q', map(len, values))
+        return b's', lengths.tobytes() + ''.join(values).encode('utf-8', 'surrogatepass')
+    return b'o', pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _decode_column(kind: bytes, payload: bytes, length: int) -> Sequence[Any]:
+    """Odtwarza kolumnę zapisaną przez _encode_column."""
+    if kind in (b'q', b'd'):
+        buffer = array(kind.decode())
+        buffer.frombytes(payload)
+        return buffer
+    if kind == b's':
+        lengths = array('q')
+        lengths.frombytes(payload[:length * lengths.itemsize])
+        text = payload[length * lengths.itemsize:].decode('utf-8', 'surrogatepass')
+        ends = list(accumulate(lengths))
+        starts = [0] + ends[:-1]
+        return list(map(text.__getitem__, map(slice, starts, ends)))
+    return pickle.loads(payload)
+
+
+def write_cache(path: str, stamp: Tuple[int, int], rows: List[Dict[str, Any]]) -> None:
+    """
+    Zapisuje wiersze w postaci kolumnowej do pliku pamięci podręcznej.
+    
+    Plik jest zapisywany pod tymczasową nazwą i atomowo podmieniany, więc
+    równoległe procesy nigdy nie odczytają niepełnego wpisu. Błędy zapisu
+    (np. brak uprawnień) są ignorowane - pamięć podręczna jest tylko
+    przyspieszeniem.
+    
+    Args:
+        path (str): Ścieżka pliku pamięci podręcznej
+        stamp (Tuple[int, int]): Rozmiar i czas modyfikacji pliku źródłowego
+        rows (List[Dict[str, Any]]): Wiersze o jednakowych kolumnach
+            (wynik load_csv_data)
+    """
+    names = list(rows[0]) if rows else []
+    columns = {name: [row[name] for row in rows] for name in names}
+    directory = os.path.dirname(path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(_HEADER.pack(_MAGIC, stamp[0], stamp[1], len(rows), len(columns)))
+            for name, values in columns.items():
+                kind, payload = _encode_column(values)
+                encoded_name = name.encode('utf-8', 'surrogatepass')
+                file.write(_COLUMN.pack(len(encoded_name), kind, len(payload)))
+                file.write(encoded_name)
+                file.write(payload)
+        os.replace(temp_path, path)
+    except OSError:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+
+
+def read_cache(path: str, stamp: Tuple[int, int]) -> Optional[Tuple[Columns, int]]:
+    """
+    Odczytuje kolumny z pliku pamięci podręcznej.
+    
+    Args:
+        path (str): Ścieżka pliku pamięci podręcznej
+        stamp (Tuple[int, int]): Bieżący rozmiar i czas modyfikacji pliku
+            źródłowego
+    
+    Returns:
+        Optional[Tuple[Columns, int]]: Kolumny i liczba wierszy albo None,
+            gdy wpisu brak, jest uszkodzony lub plik źródłowy się zmienił
+    """
+    try:
+        with open(path, 'rb') as file:
+            data = file.read()
+    except OSError:
+        return None
+    
+    try:
+        magic, size, mtime, length, count = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC or (size, mtime) != stamp:
+            return None
+        offset = _HEADER.size
+        columns = {}
+        for _ in range(count):
+            name_size, kind, payload_size = _COLUMN.unpack_from(data, offset)
+            offset += _COLUMN.size
+            name = data[offset:offset + name_size].decode('utf-8', 'surrogatepass')
+            offset += name_size
+            payload = data[offset:offset + payload_size]
+            if len(payload) != payload_size:
+                return None
+            offset += payload_size
+            columns[name] = _decode_column(kind, payload, length)
+    except (struct.error, ValueError, EOFError, pickle.UnpicklingError):
+        return None
+    if any(len(buffer) != length for buffer in columns.values()):
+        return None
+    return columns, length
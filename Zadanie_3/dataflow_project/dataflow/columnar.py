@@ -0,0 +1,488 @@
+"""
+Moduł columnar - kolumnowe przechowywanie danych
+================================================
+
+Ten moduł zawiera klasy do:
+- Przechowywania danych tabelarycznych kolumnami zamiast wierszami
+- Typowanych buforów liczbowych (array.array) dla kolumn int i float
+- Konwersji między reprezentacją kolumnową a listą słowników
+- Kodowania słownikowego kolumn tekstowych o małej liczbie wartości
+"""
+
+import sys
+from array import array
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Sequence
+
+
+class _Missing:
+    """Znacznik braku wartości w kolumnie obiektowej."""
+    
+    def __repr__(self) -> str:
+        return 'MISSING'
+    
+    def __reduce__(self) -> str:
+        # Po odczycie przez pickle znacznik pozostaje tym samym obiektem
+        return 'MISSING'
+
+
+MISSING = _Missing()
+
+
+class ColumnBuilder:
+    """
+    Przyrostowo buduje pojedynczą kolumnę, dobierając najwęższy typ bufora.
+    
+    Kolumna zaczyna jako array('q') (int64). Pierwsza wartość float zamienia
+    ją na array('d'), a wartość nieliczbowa, brak wartości lub int spoza
+    zakresu int64 - na zwykłą listę obiektów.
+    
+    Attributes:
+        kind (str): Rodzaj kolumny ('int', 'float' lub 'object')
+    """
+    
+    def __init__(self, missing: int = 0):
+        """
+        Inicjalizuje budowniczego kolumny.
+        
+        Args:
+            missing (int): Liczba brakujących wartości na początku kolumny
+                (dla kolumn, które pojawiają się dopiero w późniejszych wierszach)
+        """
+        if missing:
+            self.kind = 'object'
+            self.buffer = [MISSING] * missing
+        else:
+            self.kind = 'int'
+            self.buffer = array('q')
+    
+    def append(self, value: Any) -> None:
+        """
+        Dodaje wartość na koniec kolumny.
+        
+        Args:
+            value (Any): Wartość do dodania (MISSING oznacza brak klucza)
+        """
+        kind = self.kind
+        if kind == 'int':
+            if type(value) is int:
+                try:
+                    self.buffer.append(value)
+                    return
+                except OverflowError:
+                    pass
+            elif type(value) is float:
+                self.kind = 'float'
+                self.buffer = array('d', self.buffer)
+                self.buffer.append(value)
+                return
+            self._to_object()
+        elif kind == 'float':
+            if type(value) is float or type(value) is int:
+                try:
+                    self.buffer.append(value)
+                    return
+                except OverflowError:
+                    pass
+            self._to_object()
+        self.buffer.append(value)
+    
+    def _to_object(self) -> None:
+        """Zamienia typowany bufor na listę obiektów."""
+        self.kind = 'object'
+        self.buffer = list(self.buffer)
+
+
+# Kolumna tekstowa jest kodowana słownikowo, gdy liczba różnych wartości
+# nie przekracza tej części liczby wierszy
+DICTIONARY_MAX_RATIO = 0.5
+
+
+class DictionaryColumn:
+    """
+    Kolumna kodowana słownikowo: tablica kodów całkowitych i tabela wartości.
+    
+    Każda wartość jest przechowywana raz, a wiersze wskazują ją kodem
+    (array('B'), array('H') lub array('l') zależnie od liczby wartości).
+    Odtworzone wiersze współdzielą te same obiekty napisów. Kolumna
+    zachowuje się jak sekwencja wartości (len, indeksowanie, iteracja).
+    
+    Attributes:
+        codes (array): Kody wartości w kolejności wierszy
+        values (List[Any]): Tabela wartości (kod -> wartość)
+    """
+    
+    def __init__(self, codes: array, values: List[Any]):
+        """
+        Inicjalizuje kolumnę z gotowych kodów i tabeli wartości.
+        
+        Args:
+            codes (array): Kody wartości
+            values (List[Any]): Tabela wartości
+        """
+        self.codes = codes
+        self.values = values
+        self._lookup = {value: code for code, value in enumerate(values)}
+    
+    @staticmethod
+    def _code_typecode(size: int) -> str:
+        """Dobiera najwęższy typ tablicy kodów dla podanej liczby wartości."""
+        if size <= 1 << 8:
+            return 'B'
+        if size <= 1 << 16:
+            return 'H'
+        return 'l'
+    
+    @classmethod
+    def encode(cls, values: Iterable[Any]) -> 'DictionaryColumn':
+        """
+        Koduje wartości (muszą być haszowalne).
+        
+        Args:
+            values (Iterable[Any]): Wartości kolumny
+        
+        Returns:
+            DictionaryColumn: Zakodowana kolumna
+        """
+        lookup: Dict[Any, int] = {}
+        codes = [lookup.setdefault(value, len(lookup)) for value in values]
+        return cls(array(cls._code_typecode(len(lookup)), codes), list(lookup))
+    
+    def __len__(self) -> int:
+        return len(self.codes)
+    
+    def __getitem__(self, index: int) -> Any:
+        return self.values[self.codes[index]]
+    
+    def __iter__(self) -> Iterator[Any]:
+        return map(self.values.__getitem__, self.codes)
+    
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, DictionaryColumn):
+            return list(self) == list(other)
+        return list(self) == other
+    
+    def code(self, value: Any) -> Optional[int]:
+        """
+        Zwraca kod wartości.
+        
+        Args:
+            value (Any): Wartość
+        
+        Returns:
+            Optional[int]: Kod lub None, gdy wartość nie występuje w tabeli
+        """
+        try:
+            return self._lookup.get(value)
+        except TypeError:
+            return None
+    
+    def unique(self) -> List[Any]:
+        """
+        Zwraca wartości występujące w kolumnie (bez przeglądania wierszy
+        jako obiektów - tylko kodów).
+        
+        Returns:
+            List[Any]: Lista unikalnych wartości
+        """
+        return [self.values[code] for code in sorted(set(self.codes))]
+    
+    def take(self, positions: Sequence[int]) -> 'DictionaryColumn':
+        """
+        Tworzy kolumnę z wybranych wierszy, współdzieląc tabelę wartości.
+        
+        Args:
+            positions (Sequence[int]): Numery wierszy
+        
+        Returns:
+            DictionaryColumn: Nowa kolumna
+        """
+        codes = self.codes
+        return DictionaryColumn(array(codes.typecode, map(codes.__getitem__, positions)),
+                                self.values)
+
+
+def dictionary_encode(buffer: Sequence[Any],
+                      max_ratio: float = DICTIONARY_MAX_RATIO) -> Sequence[Any]:
+    """
+    Koduje słownikowo kolumnę tekstową o małej liczbie różnych wartości.
+    
+    Args:
+        buffer (Sequence[Any]): Bufor kolumny
+        max_ratio (float): Największy stosunek liczby różnych wartości
+            do liczby wierszy, przy którym kolumna jest kodowana
+    
+    Returns:
+        Sequence[Any]: DictionaryColumn lub niezmieniony bufor (kolumny
+            liczbowe, niebędące w całości tekstem lub o wielu wartościach)
+    """
+    if not isinstance(buffer, list) or not buffer:
+        return buffer
+    distinct = set()
+    limit = len(buffer) * max_ratio
+    for value in buffer:
+        if type(value) is not str:
+            return buffer
+        distinct.add(value)
+        if len(distinct) > limit:
+            return buffer
+    return DictionaryColumn.encode(buffer)
+
+
+class ColumnStore:
+    """
+    Kolumnowy magazyn danych.
+    
+    Każda kolumna jest osobnym buforem: array('q') dla liczb całkowitych,
+    array('d') dla liczb zmiennoprzecinkowych, DictionaryColumn dla
+    kolumn tekstowych o małej liczbie różnych wartości i lista dla
+    pozostałych wartości. Kolumny mieszane int/float są przechowywane
+    jako float.
+    
+    Attributes:
+        columns (List[str]): Nazwy kolumn w kolejności pojawienia się
+    """
+    
+    def __init__(self, columns: Optional[Dict[str, Sequence[Any]]] = None,
+                 length: Optional[int] = None, dictionary: bool = False):
+        """
+        Inicjalizuje magazyn z gotowych buforów kolumn.
+        
+        Args:
+            columns (Optional[Dict[str, Sequence[Any]]]): Słownik
+                {nazwa: bufor}, wszystkie bufory muszą mieć tę samą długość
+            length (Optional[int]): Liczba wierszy (wymagana, gdy brak kolumn)
+            dictionary (bool): Czy kodować słownikowo kolumny tekstowe
+                o małej liczbie różnych wartości (patrz dictionary_encode)
+        
+        Raises:
+            ValueError: Gdy kolumny mają różne długości
+        """
+        self._columns = dict(columns or {})
+        if dictionary:
+            self._columns = {key: dictionary_encode(buffer)
+                             for key, buffer in self._columns.items()}
+        lengths = {len(buffer) for buffer in self._columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("Wszystkie kolumny muszą mieć tę samą długość")
+        self._length = lengths.pop() if lengths else (length or 0)
+    
+    @classmethod
+    def from_rows(cls, rows: Iterable[Dict[str, Any]], dictionary: bool = True) -> 'ColumnStore':
+        """
+        Buduje magazyn z wierszy w jednym przebiegu.
+        
+        Args:
+            rows (Iterable[Dict[str, Any]]): Wiersze (lista lub iterator)
+            dictionary (bool): Czy kodować słownikowo kolumny tekstowe
+                o małej liczbie różnych wartości (domyślnie True)
+        
+        Returns:
+            ColumnStore: Nowy magazyn kolumnowy
+        """
+        builders: Dict[str, ColumnBuilder] = {}
+        count = 0
+        for row in rows:
+            for key, value in row.items():
+                builder = builders.get(key)
+                if builder is None:
+                    builder = builders[key] = ColumnBuilder(missing=count)
+                builder.append(value)
+            count += 1
+            # Kolumny nieobecne w tym wierszu dostają znacznik braku
+            if len(row) != len(builders):
+                for key, builder in builders.items():
+                    if key not in row:
+                        builder.append(MISSING)
+        return cls({key: builder.buffer for key, builder in builders.items()},
+                   length=count, dictionary=dictionary)
+    
+    @property
+    def columns(self) -> List[str]:
+        """Nazwy kolumn."""
+        return list(self._columns)
+    
+    def __len__(self) -> int:
+        return self._length
+    
+    def __contains__(self, column: str) -> bool:
+        return column in self._columns
+    
+    def column(self, column: str) -> Sequence[Any]:
+        """
+        Zwraca bufor kolumny (bez kopiowania).
+        
+        Args:
+            column (str): Nazwa kolumny
+        
+        Returns:
+            Sequence[Any]: array.array, DictionaryColumn lub lista wartości
+        
+        Raises:
+            KeyError: Gdy kolumna nie istnieje
+        """
+        if column not in self._columns:
+            raise KeyError(f"Kolumna '{column}' nie istnieje w danych")
+        return self._columns[column]
+    
+    def column_kind(self, column: str) -> str:
+        """
+        Zwraca rodzaj kolumny: 'int', 'float', 'dictionary' lub 'object'.
+        
+        Args:
+            column (str): Nazwa kolumny
+        
+        Returns:
+            str: Rodzaj kolumny
+        """
+        buffer = self.column(column)
+        if isinstance(buffer, array):
+            return 'int' if buffer.typecode == 'q' else 'float'
+        if isinstance(buffer, DictionaryColumn):
+            return 'dictionary'
+        return 'object'
+    
+    def get_column_values(self, column: str) -> List[Any]:
+        """
+        Zwraca wartości kolumny jako listę (pomija brakujące wartości).
+        
+        Args:
+            column (str): Nazwa kolumny
+        
+        Returns:
+            List[Any]: Lista wartości
+        """
+        buffer = self.column(column)
+        if isinstance(buffer, array):
+            return buffer.tolist()
+        if isinstance(buffer, DictionaryColumn):
+            return list(buffer)
+        return [value for value in buffer if value is not MISSING]
+    
+    def row(self, index: int) -> Dict[str, Any]:
+        """
+        Odtwarza pojedynczy wiersz jako słownik.
+        
+        Args:
+            index (int): Numer wiersza
+        
+        Returns:
+            Dict[str, Any]: Wiersz
+        """
+        row = {}
+        for key, buffer in self._columns.items():
+            value = buffer[index]
+            if value is not MISSING:
+                row[key] = value
+        return row
+    
+    def iter_rows(self, positions: Optional[Iterable[int]] = None,
+                  columns: Optional[Iterable[str]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iteruje po wierszach odtwarzanych z kolumn.
+        
+        Args:
+            positions (Optional[Iterable[int]]): Numery wierszy do odtworzenia
+                (domyślnie wszystkie)
+            columns (Optional[Iterable[str]]): Kolumny do umieszczenia
+                w wierszach (domyślnie wszystkie)
+        
+        Yields:
+            Dict[str, Any]: Kolejny wiersz
+        """
+        if columns is None:
+            keys = list(self._columns)
+        else:
+            keys = [key for key in columns if key in self._columns]
+        buffers = [self._columns[key] for key in keys]
+        
+        if positions is None:
+            for values in zip(*buffers):
+                yield {key: value for key, value in zip(keys, values)
+                       if value is not MISSING}
+            return
+        
+        for position in positions:
+            yield {key: value for key, value in 
+                   zip(keys, [buffer[position] for buffer in buffers])
+                   if value is not MISSING}
+    
+    def to_rows(self) -> List[Dict[str, Any]]:
+        """
+        Zamienia magazyn na listę słowników.
+        
+        Returns:
+            List[Dict[str, Any]]: Lista wierszy
+        """
+        return list(self.iter_rows())
+    
+    def take(self, positions: Sequence[int]) -> 'ColumnStore':
+        """
+        Tworzy nowy magazyn z wybranych wierszy.
+        
+        Args:
+            positions (Sequence[int]): Numery wierszy w docelowej kolejności
+        
+        Returns:
+            ColumnStore: Nowy magazyn
+        """
+        columns = {}
+        for key, buffer in self._columns.items():
+            if isinstance(buffer, array):
+                columns[key] = array(buffer.typecode, [buffer[i] for i in positions])
+            elif isinstance(buffer, DictionaryColumn):
+                columns[key] = buffer.take(positions)
+            else:
+                columns[key] = [buffer[i] for i in positions]
+        return ColumnStore(columns, length=len(positions))
+    
+    def find_equal(self, column: str, value: Any,
+                   positions: Optional[Sequence[int]] = None) -> List[int]:
+        """
+        Zwraca numery wierszy, w których kolumna ma podaną wartość.
+        
+        Args:
+            column (str): Nazwa kolumny
+            value (Any): Szukana wartość
+            positions (Optional[Sequence[int]]): Ogranicza przeszukiwanie
+                do podanych wierszy
+        
+        Returns:
+            List[int]: Numery pasujących wierszy (rosnąco)
+        """
+        if column not in self._columns:
+            return []
+        buffer = self._columns[column]
+        if isinstance(buffer, DictionaryColumn):
+            # Porównanie kodów zamiast napisów
+            code = buffer.code(value)
+            if code is None:
+                return []
+            codes = buffer.codes
+            if positions is None:
+                return [i for i, item in enumerate(codes) if item == code]
+            return [i for i in positions if codes[i] == code]
+        if positions is None:
+            return [i for i, item in enumerate(buffer) if item == value]
+        return [i for i in positions if buffer[i] == value]
+    
+    def memory_usage(self) -> int:
+        """
+        Szacuje zużycie pamięci przez bufory kolumn w bajtach.
+        
+        Dla kolumn obiektowych liczone są również same obiekty.
+        
+        Returns:
+            int: Przybliżona liczba bajtów
+        """
+        total = 0
+        for buffer in self._columns.values():
+            if isinstance(buffer, DictionaryColumn):
+                total += sys.getsizeof(buffer.codes) + sys.getsizeof(buffer.values)
+                total += sum(sys.getsizeof(value) for value in buffer.values)
+                continue
+            total += sys.getsizeof(buffer)
+            if not isinstance(buffer, array):
+                # Współdzielone obiekty (np. powtarzające się napisy) liczone raz
+                distinct = {id(value): value for value in buffer}
+                total += sum(sys.getsizeof(value) for value in distinct.values())
+        return total
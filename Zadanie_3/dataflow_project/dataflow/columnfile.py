@@ -0,0 +1,390 @@
+"""
+Moduł columnfile - binarny kolumnowy format plików
+==================================================
+
+Ten moduł zawiera klasy i funkcje do:
+- Zapisywania danych w binarnym formacie kolumnowym podzielonym na porcje
+  wierszy (chunks), bez ponownego parsowania tekstu przy odczycie
+- Przechowywania dla każdej porcji i kolumny wartości minimalnej
+  i maksymalnej (zone map)
+- Pomijania całych porcji, których statystyki wykluczają spełnienie
+  warunku, oraz odczytu z dysku tylko potrzebnych kolumn
+
+Format pliku: sygnatura, a następnie bloki kolumn kolejnych porcji
+(kodowane jak w pamięci podręcznej - surowe bufory array dla liczb,
+blok UTF-8 dla napisów, pickle dla pozostałych wartości). Na końcu pliku
+znajduje się stopka z położeniem bloków i statystykami porcji oraz jej
+pozycja. Stopka i kolumny obiektowe są zapisywane przez pickle, więc
+należy odczytywać tylko własne, zaufane pliki.
+"""
+
+import os
+import math
+import struct
+import pickle
+import tempfile
+from array import array
+from itertools import islice
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Sequence, Tuple, Union
+
+from .cache import _encode_column, _decode_column
+from .columnar import ColumnBuilder, ColumnStore, DictionaryColumn, MISSING
+from .predicates import Condition, Predicate
+
+CHUNK_SIZE = 65536
+
+_MAGIC = b'DFCOLS01'
+_TRAILER = struct.Struct('<q8s')
+
+Zone = Optional[Tuple[Any, Any]]
+
+
+def _zone(buffer: Sequence[Any]) -> Zone:
+    """
+    Zwraca (min, max) wartości porcji kolumny lub None, gdy brak statystyk.
+    
+    Wartości NaN są pomijane - nie spełniają żadnego warunku, który może
+    wykluczyć porcję, a porównania z nimi zawsze dają False, więc min i max
+    zależałyby od kolejności wartości.
+    """
+    if isinstance(buffer, array) and buffer.typecode not in 'fd':
+        values: Sequence[Any] = buffer
+    else:
+        values = [value for value in buffer if value is not MISSING
+                  and not (isinstance(value, float) and math.isnan(value))]
+    if not values:
+        return None
+    try:
+        return min(values), max(values)
+    except TypeError:
+        # Wartości nieporównywalne - porcji nie da się pominąć
+        return None
+
+
+def _encode_chunk(buffer: Sequence[Any]) -> Tuple[bytes, bytes]:
+    """Koduje porcję kolumny; zwraca rodzaj i dane (jak _encode_column)."""
+    if isinstance(buffer, array):
+        return buffer.typecode.encode(), buffer.tobytes()
+    values = list(buffer)
+    if any(value is MISSING for value in values):
+        return b'o', pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL)
+    return _encode_column(values)
+
+
+def _may_match(condition: Condition, zone: Zone) -> bool:
+    """
+    Sprawdza, czy wartości z przedziału zone mogą spełnić warunek.
+    
+    Zwraca False tylko wtedy, gdy statystyki porcji wykluczają wszystkie
+    jej wiersze; dla operatorów bez obsługi i wartości nieporównywalnych
+    zwraca True.
+    """
+    if zone is None:
+        return True
+    low, high = zone
+    op, operand = condition.op, condition.operand
+    try:
+        if op == '==':
+            return low <= operand <= high
+        if op == '>':
+            return high > operand
+        if op == '>=':
+            return high >= operand
+        if op == '<':
+            return low < operand
+        if op == '<=':
+            return low <= operand
+        if op == 'between':
+            return operand[0] <= high and low <= operand[1]
+        if op == 'in':
+            return any(low <= value <= high for value in operand)
+    except TypeError:
+        pass
+    return True
+
+
+def _iter_chunks(source: Union[ColumnStore, Iterable[Dict[str, Any]]],
+                 chunk_size: int) -> Iterator[Tuple[int, Dict[str, Sequence[Any]]]]:
+    """Dzieli magazyn kolumnowy lub wiersze na porcje (liczba wierszy, kolumny)."""
+    if isinstance(source, ColumnStore):
+        for start in range(0, len(source), chunk_size):
+            stop = min(start + chunk_size, len(source))
+            columns = {}
+            for name in source.columns:
+                buffer = source.column(name)
+                if isinstance(buffer, DictionaryColumn):
+                    columns[name] = list(map(buffer.values.__getitem__,
+                                             buffer.codes[start:stop]))
+                else:
+                    columns[name] = buffer[start:stop]
+            yield stop - start, columns
+        return
+    
+    rows = iter(source)
+    while True:
+        chunk = ColumnStore.from_rows(islice(rows, chunk_size), dictionary=False)
+        if not len(chunk):
+            return
+        yield len(chunk), {name: chunk.column(name) for name in chunk.columns}
+
+
+def _concat(parts: List[Sequence[Any]]) -> Sequence[Any]:
+    """Łączy porcje kolumny w jeden bufor (typowany, gdy to możliwe)."""
+    if parts and all(isinstance(part, array) for part in parts) \
+            and len({part.typecode for part in parts}) == 1:
+        buffer = array(parts[0].typecode)
+        for part in parts:
+            buffer.extend(part)
+        return buffer
+    builder = ColumnBuilder()
+    for part in parts:
+        for value in part:
+            builder.append(value)
+    return builder.buffer
+
+
+def write_columnar(path: str, source: Union[ColumnStore, Iterable[Dict[str, Any]]],
+                   chunk_size: int = CHUNK_SIZE) -> int:
+    """
+    Zapisuje dane w binarnym formacie kolumnowym.
+    
+    Wiersze są przetwarzane porcjami, więc iterator (np. strumień CSV)
+    jest zapisywany w stałej pamięci. Plik jest zapisywany pod tymczasową
+    nazwą i atomowo podmieniany.
+    
+    Args:
+        path (str): Ścieżka pliku wynikowego
+        source (Union[ColumnStore, Iterable[Dict[str, Any]]]): Magazyn
+            kolumnowy lub wiersze
+        chunk_size (int): Liczba wierszy w porcji (domyślnie CHUNK_SIZE)
+    
+    Returns:
+        int: Liczba zapisanych wierszy
+    
+    Raises:
+        ValueError: Gdy chunk_size nie jest dodatnie
+        OSError: Gdy zapis się nie powiódł
+    """
+    if chunk_size < 1:
+        raise ValueError("Rozmiar porcji musi być dodatni")
+    
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(_MAGIC)
+            names: Dict[str, None] = {}
+            chunks = []
+            total = 0
+            for length, columns in _iter_chunks(source, chunk_size):
+                blocks = {}
+                for name, buffer in columns.items():
+                    names.setdefault(name)
+                    kind, payload = _encode_chunk(buffer)
+                    blocks[name] = (kind, file.tell(), len(payload), _zone(buffer))
+                    file.write(payload)
+                chunks.append((length, blocks))
+                total += length
+            
+            footer_offset = file.tell()
+            file.write(pickle.dumps({'columns': list(names), 'rows': total, 'chunks': chunks},
+                                    protocol=pickle.HIGHEST_PROTOCOL))
+            file.write(_TRAILER.pack(footer_offset, _MAGIC))
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+    return total
+
+
+class ColumnarFile:
+    """
+    Plik w binarnym formacie kolumnowym zapisany przez write_columnar.
+    
+    Przy otwarciu odczytywana jest tylko stopka. Bloki kolumn są czytane
+    z dysku przy iteracji - wyłącznie dla potrzebnych kolumn i porcji,
+    których statystyki min/max nie wykluczają warunku.
+    
+    Attributes:
+        path (str): Ścieżka do pliku
+        columns (List[str]): Nazwy kolumn
+    """
+    
+    def __init__(self, path: str):
+        """
+        Otwiera plik i odczytuje stopkę.
+        
+        Args:
+            path (str): Ścieżka do pliku
+        
+        Raises:
+            FileNotFoundError: Gdy plik nie istnieje
+            ValueError: Gdy plik nie jest w formacie kolumnowym
+        """
+        self.path = path
+        with open(path, 'rb') as file:
+            try:
+                file.seek(-_TRAILER.size, os.SEEK_END)
+                footer_offset, magic = _TRAILER.unpack(file.read(_TRAILER.size))
+                if magic != _MAGIC:
+                    raise ValueError
+                file.seek(footer_offset)
+                footer = pickle.loads(file.read())
+            except (OSError, ValueError, struct.error, EOFError, pickle.UnpicklingError):
+                raise ValueError(f"Plik '{path}' nie jest w formacie kolumnowym")
+        self.columns: List[str] = footer['columns']
+        self._rows: int = footer['rows']
+        self._chunks: List[Tuple[int, Dict[str, Tuple[bytes, int, int, Zone]]]] = footer['chunks']
+    
+    def __len__(self) -> int:
+        return self._rows
+    
+    @property
+    def chunk_count(self) -> int:
+        """Liczba porcji w pliku."""
+        return len(self._chunks)
+    
+    def zones(self, column: str) -> List[Zone]:
+        """
+        Zwraca statystyki (min, max) kolumny dla kolejnych porcji.
+        
+        Args:
+            column (str): Nazwa kolumny
+        
+        Returns:
+            List[Zone]: Para (min, max) lub None dla każdej porcji
+        """
+        return [blocks[column][3] if column in blocks else None
+                for _, blocks in self._chunks]
+    
+    def chunks_for(self, predicate: Optional[Predicate]) -> List[int]:
+        """
+        Zwraca numery porcji, które mogą zawierać wiersze spełniające warunek.
+        
+        Args:
+            predicate (Optional[Predicate]): Warunek (None - wszystkie porcje)
+        
+        Returns:
+            List[int]: Numery porcji do odczytu
+        """
+        selected = []
+        for number, (_, blocks) in enumerate(self._chunks):
+            if predicate and any(
+                    condition.column not in blocks
+                    or not _may_match(condition, blocks[condition.column][3])
+                    for condition in predicate.conditions):
+                continue
+            selected.append(number)
+        return selected
+    
+    def _read_chunk(self, file: Any, number: int, columns: Iterable[str]) -> ColumnStore:
+        """Odczytuje wskazane kolumny porcji jako magazyn kolumnowy."""
+        length, blocks = self._chunks[number]
+        buffers = {}
+        for name in columns:
+            if name not in blocks:
+                buffers[name] = [MISSING] * length
+                continue
+            kind, offset, size, _ = blocks[name]
+            file.seek(offset)
+            payload = file.read(size)
+            if len(payload) != size:
+                raise ValueError(f"Plik '{self.path}' jest uszkodzony")
+            buffers[name] = _decode_column(kind, payload, length)
+        return ColumnStore(buffers, length=length)
+    
+    def column(self, column: str) -> List[Any]:
+        """
+        Odczytuje wartości jednej kolumny (pomija brakujące wartości).
+        
+        Args:
+            column (str): Nazwa kolumny
+        
+        Returns:
+            List[Any]: Lista wartości
+        
+        Raises:
+            KeyError: Gdy kolumna nie istnieje
+        """
+        if column not in self.columns:
+            raise KeyError(f"Kolumna '{column}' nie istnieje w danych")
+        values = []
+        with open(self.path, 'rb') as file:
+            for number in range(len(self._chunks)):
+                values.extend(self._read_chunk(file, number, [column]).get_column_values(column))
+        return values
+    
+    def iter_rows(self, columns: Optional[Iterable[str]] = None,
+                  predicate: Optional[Predicate] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iteruje po wierszach, czytając tylko potrzebne kolumny i porcje.
+        
+        Dla każdej porcji niewykluczonej przez statystyki najpierw czytane
+        są kolumny warunku, a pozostałe kolumny - tylko gdy w porcji są
+        pasujące wiersze.
+        
+        Args:
+            columns (Optional[Iterable[str]]): Kolumny wyniku (domyślnie wszystkie)
+            predicate (Optional[Predicate]): Warunek filtrowania
+        
+        Yields:
+            Dict[str, Any]: Kolejny wiersz
+        """
+        wanted = self.columns if columns is None else [
+            name for name in columns if name in self.columns]
+        tested = predicate.columns if predicate else []
+        rest = [name for name in wanted if name not in tested]
+        
+        with open(self.path, 'rb') as file:
+            for number in self.chunks_for(predicate):
+                if not predicate:
+                    yield from self._read_chunk(file, number, wanted).iter_rows()
+                    continue
+                chunk = self._read_chunk(file, number, tested)
+                positions = predicate.select(chunk)
+                if not positions:
+                    continue
+                extra = self._read_chunk(file, number, rest)
+                buffers = {name: chunk.column(name) for name in tested}
+                buffers.update((name, extra.column(name)) for name in rest)
+                yield from ColumnStore(buffers, length=len(chunk)).iter_rows(positions, wanted)
+    
+    def read(self, columns: Optional[Iterable[str]] = None,
+             predicate: Optional[Predicate] = None) -> ColumnStore:
+        """
+        Wczytuje kolumny (opcjonalnie tylko pasujące wiersze) do pamięci.
+        
+        Bufory liczbowe porcji są łączone bez tworzenia wierszy, a kolumny
+        tekstowe o małej liczbie różnych wartości kodowane słownikowo.
+        
+        Args:
+            columns (Optional[Iterable[str]]): Kolumny do wczytania
+                (domyślnie wszystkie)
+            predicate (Optional[Predicate]): Warunek filtrowania
+        
+        Returns:
+            ColumnStore: Magazyn kolumnowy z danymi
+        """
+        wanted = self.columns if columns is None else [
+            name for name in columns if name in self.columns]
+        needed = wanted + [name for name in (predicate.columns if predicate else [])
+                           if name not in wanted]
+        parts: Dict[str, List[Sequence[Any]]] = {name: [] for name in wanted}
+        total = 0
+        with open(self.path, 'rb') as file:
+            for number in self.chunks_for(predicate):
+                chunk = self._read_chunk(file, number, needed)
+                if predicate:
+                    positions = predicate.select(chunk)
+                    if not positions:
+                        continue
+                    if len(positions) < len(chunk):
+                        chunk = chunk.take(positions)
+                for name in wanted:
+                    parts[name].append(chunk.column(name))
+                total += len(chunk)
+        return ColumnStore({name: _concat(buffers) for name, buffers in parts.items()},
+                           length=total, dictionary=True)
@@ -0,0 +1,136 @@
+"""
+Moduł compression - przezroczysta dekompresja plików wejściowych
+================================================================
+
+Ten moduł zawiera funkcje do:
+- Rozpoznawania skompresowanych plików po sygnaturze (gzip, bz2, xz, zstd)
+- Strumieniowej dekompresji bez zapisywania pliku tymczasowego
+- Otwierania plików w trybie binarnym lub tekstowym niezależnie od kompresji
+
+Formaty gzip, bz2 i xz obsługuje biblioteka standardowa. Format zstd
+wymaga opcjonalnego pakietu zstandard (pip install dataflow[zstd]).
+"""
+
+import io
+import gzip
+from typing import IO, Optional
+
+try:
+    import bz2
+except ImportError:  # Python zbudowany bez obsługi bz2
+    bz2 = None
+
+try:
+    import lzma
+except ImportError:  # Python zbudowany bez obsługi xz
+    lzma = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+COMPRESSIONS = ('gzip', 'bz2', 'xz', 'zstd')
+
+_SIGNATURES = (
+    (b'\x1f\x8b', 'gzip'),
+    (b'BZh', 'bz2'),
+    (b'\xfd7zXZ\x00', 'xz'),
+    (b'\x28\xb5\x2f\xfd', 'zstd'),
+)
+
+
+def detect_compression(filepath: str) -> Optional[str]:
+    """
+    Rozpoznaje kompresję pliku po pierwszych bajtach (nie po rozszerzeniu).
+    
+    Args:
+        filepath (str): Ścieżka do pliku
+    
+    Returns:
+        Optional[str]: Nazwa formatu z COMPRESSIONS lub None dla zwykłego pliku
+    
+    Raises:
+        FileNotFoundError: Gdy plik nie istnieje
+    """
+    with open(filepath, 'rb') as file:
+        head = file.read(6)
+    for signature, name in _SIGNATURES:
+        if head.startswith(signature):
+            return name
+    return None
+
+
+def open_binary(filepath: str, compression: Optional[str] = None) -> IO[bytes]:
+    """
+    Otwiera plik do odczytu binarnego, dekompresując go strumieniowo.
+    
+    Args:
+        filepath (str): Ścieżka do pliku
+        compression (Optional[str]): Format z detect_compression (domyślnie
+            wykrywany automatycznie)
+    
+    Returns:
+        IO[bytes]: Obiekt pliku zwracający zdekompresowane bajty
+    
+    Raises:
+        FileNotFoundError: Gdy plik nie istnieje
+        ValueError: Gdy format nie jest obsługiwany w tej instalacji
+    """
+    if compression is None:
+        compression = detect_compression(filepath)
+    if compression is None:
+        return open(filepath, 'rb')
+    if compression == 'gzip':
+        return gzip.open(filepath, 'rb')
+    if compression == 'bz2' and bz2 is not None:
+        return bz2.open(filepath, 'rb')
+    if compression == 'xz' and lzma is not None:
+        return lzma.open(filepath, 'rb')
+    if compression == 'zstd' and zstandard is not None:
+        return zstandard.ZstdDecompressor().stream_reader(open(filepath, 'rb'),
+                                                          closefd=True)
+    if compression == 'zstd':
+        raise ValueError("Plik jest skompresowany zstd - zainstaluj pakiet zstandard")
+    raise ValueError(f"Kompresja '{compression}' nie jest obsługiwana")
+
+
+def open_text(filepath: str, encoding: str = 'utf-8',
+              compression: Optional[str] = None) -> IO[str]:
+    """
+    Otwiera plik tekstowy (np. CSV) do odczytu, dekompresując go strumieniowo.
+    
+    Plik jest otwierany z newline='', jak wymaga moduł csv.
+    
+    Args:
+        filepath (str): Ścieżka do pliku
+        encoding (str): Kodowanie tekstu (domyślnie 'utf-8')
+        compression (Optional[str]): Format z detect_compression (domyślnie
+            wykrywany automatycznie)
+    
+    Returns:
+        IO[str]: Obiekt pliku tekstowego
+    
+    Raises:
+        FileNotFoundError: Gdy plik nie istnieje
+        ValueError: Gdy format nie jest obsługiwany w tej instalacji
+    """
+    if compression is None:
+        compression = detect_compression(filepath)
+    if compression is None:
+        return open(filepath, 'r', encoding=encoding, newline='')
+    return io.TextIOWrapper(open_binary(filepath, compression), encoding=encoding, newline='')
+
+
+def read_bytes(filepath: str) -> bytes:
+    """
+    Odczytuje całą (zdekompresowaną) zawartość pliku.
+    
+    Args:
+        filepath (str): Ścieżka do pliku
+    
+    Returns:
+        bytes: Zawartość pliku
+    """
+    with open_binary(filepath) as file:
+        return file.read()
@@ -8,91 +8,758 @@ Ten moduł zawiera funkcje i klasy do:
 - Podstawowej manipulacji struktur danych
 """
 
+import io
+import os
 import csv
-from typing import List, Dict, Any, Optional, Union
+import glob
+import heapq
+import types
+import hashlib
+import operator
+import itertools
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, Future
+from contextlib import contextmanager
+from typing import (List, Dict, Any, Optional, Union, Iterable, Iterator, Callable,
+                    Sequence, Tuple, BinaryIO)
 from collections import defaultdict
 
+from .columnar import ColumnStore, DictionaryColumn, MISSING
+from .indexes import HashIndex, SortedIndex
+from .predicates import Predicate, compile_conditions
+from .query import LazyQuery
+from .aggregations import aggregate_data
+from .joins import JOIN_TYPES, HashTable, probe
+from .sketches import HyperLogLog
+from .cache import cache_path, source_stamp, read_cache, write_cache
+from .columnfile import CHUNK_SIZE, ColumnarFile, write_columnar
+from .compression import detect_compression, open_binary, open_text, read_bytes
+from .sampling import reservoir_sample, stratified_sample
+
+
+DEFAULT_SAMPLE_SIZE = 1000
+# Górny limit wątków czytających pliki w DataProcessor.load_many
+MAX_READ_THREADS = 32
+
+
+def _is_int_text(value: str) -> bool:
+    """Sprawdza czy tekst zapisuje liczbę całkowitą (także ujemną)."""
+    digits = value[1:] if value[:1] in ('+', '-') else value
+    return digits.isascii() and digits.isdigit()
+
+
+def _convert_value(value: str) -> Any:
+    """
+    Konwertuje tekstową wartość z pliku CSV na liczbę, jeśli to możliwe.
+    
+    Args:
+        value (str): Wartość odczytana z pliku
+    
+    Returns:
+        Any: Wartość typu int, float lub oryginalny tekst
+    """
+    if _is_int_text(value):
+        return int(value)
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+def _infer_column_type(values: Iterable[str]) -> type:
+    """
+    Wyznacza najwęższy typ (int, float lub str) pasujący do wszystkich
+    niepustych wartości z próbki.
+    """
+    column_type = int
+    for value in values:
+        if value == '':
+            continue
+        if column_type is int and _is_int_text(value):
+            continue
+        try:
+            float(value)
+            column_type = float
+        except ValueError:
+            return str
+    return column_type
+
+
+class _TypedConverter:
+    """
+    Konwerter kolumny o wywnioskowanym typie.
+    
+    Próbuje najpierw typu kolumny, a dopiero dla wartości, które do niego
+    nie pasują (np. pusta komórka), wraca do _convert_value. W odróżnieniu
+    od domknięcia może być przesłany do procesu roboczego (pickle).
+    """
+    
+    __slots__ = ('parse',)
+    
+    def __init__(self, parse: type):
+        self.parse = parse
+    
+    def __call__(self, value: str) -> Any:
+        try:
+            return self.parse(value)
+        except ValueError:
+            return _convert_value(value)
+
+
+def _make_converter(column_type: type) -> Callable[[str], Any]:
+    """Tworzy konwerter kolumny dla wywnioskowanego typu."""
+    if column_type is str:
+        return str
+    return _TypedConverter(column_type)
+
+
+def _build_converters(header: List[str], sample: List[List[str]],
+                      schema: Optional[Dict[str, Callable[[str], Any]]] = None,
+                      infer_schema: bool = True,
+                      columns: Optional[Iterable[str]] = None) -> List[Optional[Callable[[str], Any]]]:
+    """
+    Buduje listę konwerterów - po jednym dla każdej kolumny nagłówka.
+    
+    Kolumny podane w schema używają konwertera ze schematu, pozostałe typu
+    wywnioskowanego z próbki (lub _convert_value, gdy infer_schema=False).
+    Kolumny spoza columns (jeśli podano) dostają None i nie są analizowane.
+    """
+    schema = schema or {}
+    wanted = None if columns is None else set(columns)
+    converters = []
+    for index, column in enumerate(header):
+        if wanted is not None and column not in wanted:
+            converters.append(None)
+        elif column in schema:
+            converters.append(schema[column])
+        elif infer_schema:
+            column_type = _infer_column_type(row[index] for row in sample)
+            converters.append(_make_converter(column_type))
+        else:
+            converters.append(_convert_value)
+    return converters
+
+
+def _convert_rows(header: List[str], converters: List[Optional[Callable[[str], Any]]],
+                  rows: Iterable[List[str]],
+                  first_line: int = 2) -> Iterator[Dict[str, Any]]:
+    """
+    Zamienia surowe wiersze z csv.reader na słowniki z przekonwertowanymi
+    wartościami. Puste linie są pomijane, a kolumny bez konwertera (None)
+    nie trafiają do wyniku.
+    
+    Raises:
+        ValueError: Gdy wiersz ma inną liczbę pól niż nagłówek
+    """
+    width = len(header)
+    selected = [i for i, convert in enumerate(converters) if convert is not None]
+    if len(selected) == width:
+        for line, row in enumerate(rows, first_line):
+            if not row:
+                continue
+            if len(row) != width:
+                raise ValueError(f"Wiersz {line} ma {len(row)} pól, oczekiwano {width}")
+            yield dict(zip(header, [convert(value) for convert, value 
+                                    in zip(converters, row)]))
+        return
+    
+    # Konwertowane są tylko wybrane kolumny
+    names = [header[i] for i in selected]
+    pairs = [(converters[i], i) for i in selected]
+    for line, row in enumerate(rows, first_line):
+        if not row:
+            continue
+        if len(row) != width:
+            raise ValueError(f"Wiersz {line} ma {len(row)} pól, oczekiwano {width}")
+        yield dict(zip(names, [convert(row[i]) for convert, i in pairs]))
+
+
+def infer_csv_schema(filepath: str, delimiter: str = ',', 
+                     encoding: str = 'utf-8',
+                     sample_size: int = DEFAULT_SAMPLE_SIZE) -> Dict[str, type]:
+    """
+    Wyznacza typy kolumn pliku CSV na podstawie próbki wierszy.
+    
+    Args:
+        filepath (str): Ścieżka do pliku CSV
+        delimiter (str): Separator kolumn (domyślnie ',')
+        encoding (str): Kodowanie pliku (domyślnie 'utf-8')
+        sample_size (int): Liczba wierszy próbki
+    
+    Returns:
+        Dict[str, type]: Słownik {kolumna: int, float lub str}
+    
+    Example:
+        >>> infer_csv_schema('dane.csv')
+        {'name': <class 'str'>, 'age': <class 'int'>, 'score': <class 'float'>}
+    """
+    with open_text(filepath, encoding) as file:
+        reader = csv.reader(file, delimiter=delimiter)
+        header = next(reader, [])
+        sample = [row for row in itertools.islice(reader, sample_size) 
+                  if len(row) == len(header)]
+    return {column: _infer_column_type(row[index] for row in sample)
+            for index, column in enumerate(header)}
+
+
+MIN_PARALLEL_CHUNK = 1024 * 1024
+MAX_PARALLEL_CHUNK = 64 * 1024 * 1024
+_READ_BLOCK = 1024 * 1024
+
+
+def _find_record_end(file: BinaryIO, position: int, in_quotes: bool) -> int:
+    """
+    Zwraca pozycję za pierwszym znakiem nowej linii od position, który
+    nie leży wewnątrz pola w cudzysłowie (lub koniec pliku).
+    
+    Args:
+        file (BinaryIO): Plik otwarty binarnie
+        position (int): Pozycja początkowa
+        in_quotes (bool): Czy position leży wewnątrz pola w cudzysłowie
+    """
+    file.seek(position)
+    while True:
+        block = file.read(_READ_BLOCK)
+        if not block:
+            return file.tell()
+        start = 0
+        while True:
+            newline = block.find(b'\n', start)
+            if newline < 0:
+                in_quotes ^= block.count(b'"', start) % 2 == 1
+                break
+            in_quotes ^= block.count(b'"', start, newline) % 2 == 1
+            if not in_quotes:
+                return position + newline + 1
+            start = newline + 1
+        position += len(block)
+
+
+def _count_quotes(file: BinaryIO, start: int, end: int) -> int:
+    """Liczy znaki cudzysłowu w zakresie [start, end) pliku."""
+    file.seek(start)
+    total = 0
+    remaining = end - start
+    while remaining > 0:
+        block = file.read(min(_READ_BLOCK, remaining))
+        if not block:
+            break
+        total += block.count(b'"')
+        remaining -= len(block)
+    return total
+
+
+def _chunk_boundaries(filepath: str, chunk_size: int) -> List[int]:
+    """
+    Dzieli treść pliku CSV (bez nagłówka) na zakresy bajtów kończące się
+    na granicy rekordu.
+    
+    Nowa linia jest granicą rekordu tylko wtedy, gdy liczba cudzysłowów od
+    początku pliku jest parzysta - dzięki temu pola w cudzysłowie
+    zawierające znaki nowej linii nie są rozcinane.
+    
+    Returns:
+        List[int]: Rosnące pozycje [początek treści, ..., rozmiar pliku]
+    """
+    size = os.path.getsize(filepath)
+    with open(filepath, 'rb') as file:
+        boundaries = [_find_record_end(file, 0, False)]
+        while boundaries[-1] + chunk_size < size:
+            start = boundaries[-1]
+            target = start + chunk_size
+            in_quotes = _count_quotes(file, start, target) % 2 == 1
+            end = _find_record_end(file, target, in_quotes)
+            if end >= size:
+                break
+            boundaries.append(end)
+    boundaries.append(size)
+    return boundaries
+
+
+def _parse_csv_chunk(filepath: str, start: int, end: int, delimiter: str,
+                     encoding: str, header: List[str],
+                     converters: List[Optional[Callable[[str], Any]]]) -> List[Dict[str, Any]]:
+    """
+    Parsuje zakres bajtów [start, end) pliku CSV w procesie roboczym.
+    
+    Raises:
+        ValueError: Gdy wiersz ma inną liczbę pól niż nagłówek
+    """
+    with open(filepath, 'rb') as file:
+        file.seek(start)
+        data = file.read(end - start)
+    return _parse_csv_block(data, start, delimiter, encoding, header, converters)
+
+
+def _parse_csv_block(data: bytes, start: int, delimiter: str, encoding: str,
+                     header: List[str],
+                     converters: List[Optional[Callable[[str], Any]]]) -> List[Dict[str, Any]]:
+    """
+    Parsuje fragment treści pliku CSV zaczynający się na bajcie start.
+    
+    Raises:
+        ValueError: Gdy wiersz ma inną liczbę pól niż nagłówek
+    """
+    reader = csv.reader(io.StringIO(data.decode(encoding), newline=''), delimiter=delimiter)
+    try:
+        return list(_convert_rows(header, converters, reader))
+    except ValueError as e:
+        raise ValueError(f"{e} (fragment pliku od bajtu {start})")
+
+
+def _supports_parallel(encoding: str) -> bool:
+    """Czy w kodowaniu cudzysłów i nowa linia są pojedynczymi bajtami ASCII."""
+    try:
+        return '"\n'.encode(encoding) == b'"\n'
+    except (LookupError, UnicodeError):
+        return False
+
+
+def _iter_csv_parallel(filepath: str, delimiter: str, encoding: str, 
+                       header: List[str],
+                       converters: List[Optional[Callable[[str], Any]]],
+                       workers: int, compression: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Parsuje treść pliku CSV w puli procesów, zwracając wiersze w kolejności
+    z pliku. Jednocześnie przetwarzanych jest najwyżej 2 * workers
+    fragmentów, więc zużycie pamięci nie zależy od rozmiaru pliku.
+    
+    Zwykły plik jest dzielony na zakresy bajtów czytane przez procesy
+    robocze. Pliku skompresowanego nie da się czytać od dowolnej pozycji,
+    więc jest dekompresowany strumieniowo w bieżącym procesie, a do
+    procesów roboczych trafiają gotowe fragmenty treści.
+    """
+    size = os.path.getsize(filepath)
+    chunk_size = min(max(size // (workers * 4), MIN_PARALLEL_CHUNK), MAX_PARALLEL_CHUNK)
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        if compression is None:
+            boundaries = _chunk_boundaries(filepath, chunk_size)
+            tasks = (executor.submit(_parse_csv_chunk, filepath, start, end,
+                                     delimiter, encoding, header, converters)
+                     for start, end in zip(boundaries, boundaries[1:]))
+            yield from _ordered_results(tasks, workers * 2)
+            return
+        
+        with open_binary(filepath, compression) as file:
+            tasks = (executor.submit(_parse_csv_block, block, start,
+                                     delimiter, encoding, header, converters)
+                     for start, block in _iter_record_blocks(file, chunk_size))
+            yield from _ordered_results(tasks, workers * 2)
+
+
+def _ordered_results(tasks: Iterator[Future], window: int) -> Iterator[Dict[str, Any]]:
+    """
+    Zwraca wiersze z kolejnych zadań w kolejności ich utworzenia, utrzymując
+    najwyżej window zadań w toku (zadania są tworzone leniwie).
+    """
+    pending = deque(itertools.islice(tasks, window))
+    try:
+        while pending:
+            rows = pending.popleft().result()
+            task = next(tasks, None)
+            if task is not None:
+                pending.append(task)
+            yield from rows
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _iter_record_blocks(file: BinaryIO, block_size: int) -> Iterator[Tuple[int, bytes]]:
+    """
+    Dzieli strumień bajtów pliku CSV (bez nagłówka) na fragmenty kończące się
+    na granicy rekordu.
+    
+    Nowa linia jest granicą rekordu tylko przy parzystej liczbie
+    cudzysłowów od początku fragmentu (który zaczyna się na granicy rekordu).
+    
+    Yields:
+        Tuple[int, bytes]: Pozycja fragmentu w zdekompresowanej treści i fragment
+    """
+    pending = b''
+    position = 0
+    header_skipped = False
+    while True:
+        data = file.read(block_size)
+        if not data:
+            break
+        pending += data
+        if not header_skipped:
+            end = pending.find(b'\n')
+            while end >= 0 and pending.count(b'"', 0, end) % 2:
+                end = pending.find(b'\n', end + 1)
+            if end < 0:
+                continue
+            pending = pending[end + 1:]
+            position = end + 1
+            header_skipped = True
+        
+        end = pending.rfind(b'\n')
+        while end >= 0 and pending.count(b'"', 0, end) % 2:
+            end = pending.rfind(b'\n', 0, end)
+        if end < 0:
+            continue
+        yield position, pending[:end + 1]
+        position += end + 1
+        pending = pending[end + 1:]
+    
+    if header_skipped and pending:
+        yield position, pending
+
+
+def _prepare_reader(reader: Iterator[List[str]],
+                    schema: Optional[Dict[str, Callable[[str], Any]]],
+                    infer_schema: bool, sample_size: int,
+                    columns: Optional[Iterable[str]] = None
+                    ) -> Optional[Tuple[List[str], List[Optional[Callable[[str], Any]]], List[List[str]]]]:
+    """
+    Odczytuje nagłówek i próbkę, a następnie buduje konwertery kolumn.
+    
+    Returns:
+        Optional[Tuple]: Nagłówek, konwertery i odczytana próbka (do
+            przetworzenia przed resztą czytnika) albo None dla pustego pliku
+    """
+    header = next(reader, None)
+    if header is None:
+        return None
+    
+    sample = list(itertools.islice(reader, sample_size)) if infer_schema else []
+    converters = _build_converters(header, [row for row in sample if row], 
+                                   schema, infer_schema, columns)
+    return header, converters, sample
+
+
+def _parse_csv_bytes(data: bytes, delimiter: str = ',', encoding: str = 'utf-8',
+                     schema: Optional[Dict[str, Callable[[str], Any]]] = None,
+                     infer_schema: bool = True,
+                     sample_size: int = DEFAULT_SAMPLE_SIZE) -> List[Dict[str, Any]]:
+    """
+    Parsuje całą treść pliku CSV odczytaną wcześniej (np. w procesie roboczym).
+    
+    Raises:
+        ValueError: Gdy treść nie daje się zdekodować lub wiersz ma inną
+            liczbę pól niż nagłówek
+    """
+    reader = csv.reader(io.StringIO(data.decode(encoding), newline=''), delimiter=delimiter)
+    prepared = _prepare_reader(reader, schema, infer_schema, sample_size)
+    if prepared is None:
+        return []
+    header, converters, sample = prepared
+    return list(_convert_rows(header, converters, itertools.chain(sample, reader)))
+
+
+def iter_csv_data(filepath: str, delimiter: str = ',', 
+                  encoding: str = 'utf-8',
+                  schema: Optional[Dict[str, Callable[[str], Any]]] = None,
+                  infer_schema: bool = True,
+                  sample_size: int = DEFAULT_SAMPLE_SIZE,
+                  columns: Optional[Iterable[str]] = None,
+                  workers: int = 1) -> Iterator[Dict[str, Any]]:
+    """
+    Leniwie odczytuje plik CSV, zwracając kolejne wiersze jako słowniki.
+    
+    W przeciwieństwie do load_csv_data nie buduje listy wszystkich wierszy,
+    więc zużycie pamięci nie zależy od rozmiaru pliku.
+    
+    Pliki skompresowane (gzip, bz2, xz, a z pakietem zstandard także zstd)
+    są rozpoznawane po sygnaturze i dekompresowane strumieniowo wprost do
+    parsera, bez pliku tymczasowego.
+    
+    Typ każdej kolumny jest wyznaczany raz, na podstawie pierwszych
+    sample_size wierszy, a następnie cała kolumna jest konwertowana jednym
+    konwerterem. Wartości niepasujące do typu kolumny (np. puste komórki)
+    są konwertowane tak jak przy infer_schema=False.
+    
+    Args:
+        filepath (str): Ścieżka do pliku CSV
+        delimiter (str): Separator kolumn (domyślnie ',')
+        encoding (str): Kodowanie pliku (domyślnie 'utf-8')
+        schema (Optional[Dict[str, Callable[[str], Any]]]): Jawne konwertery
+            kolumn, np. {'age': int, 'zip': str}
+        infer_schema (bool): Czy wnioskować typy kolumn z próbki; gdy False,
+            każda komórka jest konwertowana osobno
+        sample_size (int): Liczba wierszy próbki do wnioskowania typów
+        columns (Optional[Iterable[str]]): Kolumny do odczytania; pozostałe
+            nie są konwertowane ani zwracane (domyślnie wszystkie)
+        workers (int): Liczba procesów parsujących. Dla workers > 1 plik
+            jest dzielony na fragmenty kończące się na granicy rekordu
+            (z uwzględnieniem pól w cudzysłowie zawierających nowe linie),
+            a wiersze są zwracane w kolejności z pliku. Konwertery ze
+            schema muszą wtedy dać się zserializować (np. int, float, str).
+            Tryb równoległy wymaga kodowania zgodnego z ASCII (np. UTF-8)
+            i cudzysłowów wyłącznie wokół całych pól; w przeciwnym razie
+            plik jest czytany sekwencyjnie. Plik skompresowany jest
+            dekompresowany w bieżącym procesie, a parsowany równolegle
+    
+    Yields:
+        Dict[str, Any]: Kolejny wiersz z przekonwertowanymi wartościami
+    
+    Raises:
+        FileNotFoundError: Gdy plik nie istnieje
+        ValueError: Gdy wiersz ma inną liczbę pól niż nagłówek
+    """
+    compression = detect_compression(filepath)
+    with open_text(filepath, encoding, compression) as file:
+        reader = csv.reader(file, delimiter=delimiter)
+        prepared = _prepare_reader(reader, schema, infer_schema, sample_size, columns)
+        if prepared is None:
+            return
+        
+        header, converters, sample = prepared
+        if workers <= 1 or not _supports_parallel(encoding):
+            yield from _convert_rows(header, converters, 
+                                     itertools.chain(sample, reader))
+            return
+    
+    yield from _iter_csv_parallel(filepath, delimiter, encoding, header, 
+                                  converters, workers, compression)
+
 
 def load_csv_data(filepath: str, delimiter: str = ',', 
-                  encoding: str = 'utf-8') -> List[Dict[str, Any]]:
+                  encoding: str = 'utf-8',
+                  schema: Optional[Dict[str, Callable[[str], Any]]] = None,
+                  infer_schema: bool = True,
+                  sample_size: int = DEFAULT_SAMPLE_SIZE,
+                  workers: int = 1,
+                  cache_dir: Optional[str] = None) -> List[Dict[str, Any]]:
     """
     Ładuje dane z pliku CSV i zwraca jako listę słowników.
     
+    Gdy podano cache_dir, sparsowany wynik jest zapisywany w tym katalogu
+    w binarnym formacie kolumnowym (moduł cache), a kolejne wywołania
+    z tymi samymi opcjami odczytują go zamiast parsować plik. Wpis jest
+    unieważniany automatycznie, gdy zmieni się rozmiar lub czas
+    modyfikacji pliku.
+    
     Args:
         filepath (str): Ścieżka do pliku CSV
         delimiter (str): Separator kolumn (domyślnie ',')
         encoding (str): Kodowanie pliku (domyślnie 'utf-8')
+        schema (Optional[Dict[str, Callable[[str], Any]]]): Jawne konwertery
+            kolumn (patrz iter_csv_data)
+        infer_schema (bool): Czy wnioskować typy kolumn z próbki
+        sample_size (int): Liczba wierszy próbki do wnioskowania typów
+        workers (int): Liczba procesów parsujących (patrz iter_csv_data)
+        cache_dir (Optional[str]): Katalog pamięci podręcznej sparsowanych
+            plików (domyślnie brak)
     
     Returns:
         List[Dict[str, Any]]: Lista słowników reprezentujących wiersze
     
+    Raises:
+        FileNotFoundError: Gdy plik nie istnieje
+        ValueError: Gdy plik ma nieprawidłowy format
+    """
+    options = _csv_options(delimiter, encoding, schema, infer_schema, sample_size)
+    with _csv_errors(filepath):
+        if cache_dir is not None:
+            return _load_cached(filepath, cache_dir, options, workers)
+        return list(iter_csv_data(filepath, workers=workers, **options))
+
+
+def _csv_options(delimiter: str = ',', encoding: str = 'utf-8',
+                 schema: Optional[Dict[str, Callable[[str], Any]]] = None,
+                 infer_schema: bool = True,
+                 sample_size: int = DEFAULT_SAMPLE_SIZE) -> Dict[str, Any]:
+    """Zbiera opcje parsowania wpływające na wynik (z wartościami domyślnymi)."""
+    return dict(delimiter=delimiter, encoding=encoding, schema=schema,
+                infer_schema=infer_schema, sample_size=sample_size)
+
+
+def _code_digest(code: types.CodeType) -> str:
+    """Skrót kodu funkcji (z zagnieżdżonymi funkcjami), stały między uruchomieniami."""
+    parts = [code.co_code, repr(code.co_names).encode('utf-8')]
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            parts.append(_code_digest(const).encode('ascii'))
+        else:
+            parts.append(repr(const).encode('utf-8'))
+    return hashlib.sha1(b'\x00'.join(parts)).hexdigest()
+
+
+def _converter_key(converter: Callable[[str], Any]) -> Optional[str]:
+    """
+    Zwraca klucz konwertera ze schematu, stały między uruchomieniami, albo
+    None, gdy konwertera nie da się w ten sposób rozpoznać.
+    
+    Sama nazwa nie wystarcza - wszystkie funkcje lambda mają nazwę
+    '<lambda>' - więc dla funkcji klucz obejmuje też skrót kodu. Domknięcia
+    i funkcje z wartościami domyślnymi zależą od wartości spoza kodu,
+    więc nie mają klucza.
+    """
+    if isinstance(converter, (type, types.BuiltinFunctionType)):
+        return f"{converter.__module__}.{converter.__qualname__}"
+    if isinstance(converter, _TypedConverter):
+        return f"typed:{_converter_key(converter.parse)}"
+    if isinstance(converter, types.FunctionType):
+        if converter.__closure__ or converter.__defaults__ or converter.__kwdefaults__:
+            return None
+        return (f"{converter.__module__}.{converter.__qualname__}:"
+                f"{_code_digest(converter.__code__)}")
+    return None
+
+
+def _cache_options(options: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Zamienia opcje parsowania na postać stałą między uruchomieniami (klucz
+    wpisu) albo zwraca None, gdy któregoś konwertera nie da się rozpoznać.
+    """
+    key = dict(options)
+    if key['schema'] is not None:
+        key['schema'] = {column: _converter_key(converter)
+                         for column, converter in key['schema'].items()}
+        if None in key['schema'].values():
+            return None
+    return key
+
+
+def _load_cached(filepath: str, cache_dir: str, options: Dict[str, Any], workers: int,
+                 columnar: bool = False) -> Union[List[Dict[str, Any]], ColumnStore]:
+    """
+    Ładuje plik CSV przez pamięć podręczną.
+    
+    Args:
+        filepath (str): Ścieżka do pliku CSV
+        cache_dir (str): Katalog pamięci podręcznej
+        options (Dict[str, Any]): Opcje dla iter_csv_data
+        workers (int): Liczba procesów parsujących przy braku wpisu
+        columnar (bool): Czy zwrócić ColumnStore zamiast listy wierszy
+    
+    Returns:
+        Union[List[Dict[str, Any]], ColumnStore]: Wiersze lub magazyn kolumnowy
+    """
+    key = _cache_options(options)
+    if key is None:
+        # Konwertera nie da się rozpoznać - wynik nie może trafić do pamięci podręcznej
+        rows = list(iter_csv_data(filepath, workers=workers, **options))
+        return ColumnStore.from_rows(rows) if columnar else rows
+    
+    stamp = source_stamp(filepath)
+    path = cache_path(cache_dir, filepath, key)
+    cached = read_cache(path, stamp)
+    if cached is not None:
+        columns, length = cached
+        if columnar:
+            return ColumnStore(columns, length=length, dictionary=True)
+        names = list(columns)
+        return [dict(zip(names, values)) for values in zip(*columns.values())]
+    
+    rows = list(iter_csv_data(filepath, workers=workers, **options))
+    write_cache(path, stamp, rows)
+    return ColumnStore.from_rows(rows) if columnar else rows
+
+
+@contextmanager
+def _csv_errors(filepath: str) -> Iterator[None]:
+    """
+    Zamienia wyjątki zgłaszane podczas czytania pliku CSV na wyjątki
+    dokumentowane przez load_csv_data.
+    
+    Args:
+        filepath (str): Ścieżka do czytanego pliku
+    
     Raises:
         FileNotFoundError: Gdy plik nie istnieje
         ValueError: Gdy plik ma nieprawidłowy format
     """
     try:
-        data = []
-        with open(filepath, 'r', encoding=encoding, newline='') as file:
-            reader = csv.DictReader(file, delimiter=delimiter)
-            for row in reader:
-                # Konwersja numerycznych wartości
-                processed_row = {}
-                for key, value in row.items():
-                    if value.isdigit():
-                        processed_row[key] = int(value)
-                    else:
-                        try:
-                            processed_row[key] = float(value)
-                        except ValueError:
-                            processed_row[key] = value
-                data.append(processed_row)
-        return data
+        yield
     except FileNotFoundError:
         raise FileNotFoundError(f"Plik {filepath} nie został znaleziony")
     except Exception as e:
         raise ValueError(f"Błąd podczas czytania pliku: {str(e)}")
 
 
-def filter_data(data: List[Dict[str, Any]], 
-                conditions: Dict[str, Any]) -> List[Dict[str, Any]]:
+def _with_columns(columns: Optional[Iterable[str]],
+                  extra: Iterable[str]) -> Optional[List[str]]:
+    """Dodaje kolumny extra do listy columns (None oznacza wszystkie kolumny)."""
+    if columns is None:
+        return None
+    return list(dict.fromkeys(itertools.chain(columns, extra)))
+
+
+def _filtered_source(source: Callable[..., Iterator[Dict[str, Any]]],
+                     predicate: Predicate) -> Callable[..., Iterator[Dict[str, Any]]]:
+    """Zwraca źródło strumieniowe zwracające tylko wiersze spełniające warunek."""
+    return lambda columns=None: filter_data(
+        source(_with_columns(columns, predicate.columns)), predicate)
+
+
+def _chunked(values: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Dzieli wartości na kolejne listy o podanym rozmiarze (ostatnia krótsza)."""
+    values = iter(values)
+    while True:
+        chunk = list(itertools.islice(values, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def filter_data(data: Iterable[Dict[str, Any]], 
+                conditions: Union[Dict[str, Any], Predicate],
+                indexes: Optional[Dict[str, HashIndex]] = None) -> Iterable[Dict[str, Any]]:
     """
     Filtruje dane na podstawie podanych warunków.
     
+    Warunek może być zwykłą wartością (równość) lub krotką
+    (operator, argument) z operatorem '==', '!=', '>', '>=', '<', '<=',
+    'in', 'not in', 'between' lub 'regex' (patrz moduł predicates).
+    Warunki są kompilowane raz i sprawdzane od najbardziej selektywnych.
+    
+    Dla listy zwracana jest lista. Dla iteratora (np. wyniku iter_csv_data)
+    zwracany jest leniwy generator, dzięki czemu filtrowanie strumienia
+    nie wczytuje całego pliku do pamięci.
+    
+    Gdy podano indeksy, a warunek dotyczy indeksowanej kolumny, sprawdzane
+    są tylko wiersze wskazane przez indeks zamiast całej listy.
+    
     Args:
-        data (List[Dict[str, Any]]): Dane do filtrowania
-        conditions (Dict[str, Any]): Słownik warunków {kolumna: wartość}
+        data (Iterable[Dict[str, Any]]): Dane do filtrowania
+        conditions (Union[Dict[str, Any], Predicate]): Słownik warunków
+            {kolumna: wartość lub (operator, argument)} lub skompilowany
+            warunek z compile_conditions
+        indexes (Optional[Dict[str, HashIndex]]): Indeksy {kolumna: indeks}
+            zbudowane dla tej samej listy danych
     
     Returns:
-        List[Dict[str, Any]]: Przefiltrowane dane
+        Iterable[Dict[str, Any]]: Przefiltrowane dane
+    
+    Raises:
+        ValueError: Gdy operator jest nieznany
     
     Example:
         >>> data = [{'name': 'Jan', 'age': 25}, {'name': 'Anna', 'age': 30}]
         >>> filter_data(data, {'age': 25})
         [{'name': 'Jan', 'age': 25}]
+        >>> filter_data(data, {'age': ('>', 26)})
+        [{'name': 'Anna', 'age': 30}]
     """
-    if not data or not conditions:
+    if not conditions:
         return data
     
-    filtered = []
-    for row in data:
-        match = True
-        for key, value in conditions.items():
-            if key not in row or row[key] != value:
-                match = False
-                break
-        if match:
-            filtered.append(row)
+    predicate = compile_conditions(conditions, indexes)
+    if isinstance(data, Iterator):
+        return filter(predicate, data)
+    
+    if not data:
+        return data
     
-    return filtered
+    candidates = predicate.index_candidates(indexes)
+    if candidates is not None:
+        return [data[i] for i in candidates if predicate(data[i])]
+    
+    return list(filter(predicate, data))
 
 
-def group_by_column(data: List[Dict[str, Any]], 
+def group_by_column(data: Iterable[Dict[str, Any]], 
                    column: str) -> Dict[Any, List[Dict[str, Any]]]:
     """
     Grupuje dane według wartości w określonej kolumnie.
     
     Args:
-        data (List[Dict[str, Any]]): Dane do grupowania
+        data (Iterable[Dict[str, Any]]): Dane do grupowania (lista lub iterator)
         column (str): Nazwa kolumny do grupowania
     
     Returns:
@@ -101,102 +768,1234 @@ def group_by_column(data: List[Dict[str, Any]],
     Raises:
         KeyError: Gdy kolumna nie istnieje w danych
     """
-    if not data:
+    rows = iter(data)
+    first = next(rows, None)
+    if first is None:
         return {}
     
-    if column not in data[0]:
+    if column not in first:
         raise KeyError(f"Kolumna '{column}' nie istnieje w danych")
     
     groups = defaultdict(list)
-    for row in data:
+    groups[first[column]].append(first)
+    for row in rows:
         groups[row[column]].append(row)
     
     return dict(groups)
 
 
+def _select_positions(base: Union[List[Dict[str, Any]], ColumnStore],
+                      predicate: Optional[Predicate],
+                      positions: Optional[Sequence[int]] = None,
+                      indexes: Optional[Dict[str, Any]] = None) -> array:
+    """
+    Wyznacza wektor selekcji - numery wierszy danych bazowych spełniających
+    warunek.
+    
+    Args:
+        base (Union[List[Dict[str, Any]], ColumnStore]): Dane bazowe
+        predicate (Optional[Predicate]): Warunek (None - wszystkie wiersze)
+        positions (Optional[Sequence[int]]): Ogranicza sprawdzanie do
+            podanych wierszy (np. wektora selekcji widoku nadrzędnego)
+        indexes (Optional[Dict[str, Any]]): Indeksy danych bazowych
+            (używane tylko, gdy nie podano positions)
+    
+    Returns:
+        array: Rosnące numery wierszy (array('q'))
+    """
+    if predicate is None or not len(predicate):
+        return array('q', range(len(base)) if positions is None else positions)
+    if positions is None and indexes:
+        positions = predicate.index_candidates(indexes)
+    if isinstance(base, ColumnStore):
+        return array('q', predicate.select(base, positions))
+    if positions is None:
+        positions = range(len(base))
+    return array('q', [i for i in positions if predicate(base[i])])
+
+
 class DataProcessor:
     """
     Klasa do zaawansowanego przetwarzania danych.
     
+    Procesor może przechowywać dane w pamięci jako listę słowników
+    (storage='rows') lub kolumnowo w typowanych buforach
+    (storage='columnar'), a także działać w trybie strumieniowym
+    (stream_csv), w którym wiersze są czytane z pliku dopiero przy
+    obliczaniu wyniku.
+    
+    Metoda where tworzy widok - procesor współdzielący dane bazowe
+    i przechowujący tylko wektor selekcji (numery wybranych wierszy).
+    
     Attributes:
-        data (List[Dict[str, Any]]): Przechowywane dane
+        data (List[Dict[str, Any]]): Przechowywane dane (w trybie
+            strumieniowym odczyt atrybutu wczytuje strumień do pamięci,
+            w trybie kolumnowym zwraca listę odtworzoną z kolumn)
     """
     
-    def __init__(self, data: Optional[List[Dict[str, Any]]] = None):
+    STORAGE_TYPES = ('rows', 'columnar')
+    
+    def __init__(self, data: Optional[List[Dict[str, Any]]] = None,
+                 storage: str = 'rows'):
         """
         Inicjalizuje procesor danych.
         
         Args:
             data (Optional[List[Dict[str, Any]]]): Opcjonalne dane początkowe
+            storage (str): Sposób przechowywania danych ('rows' lub 'columnar')
+        
+        Raises:
+            ValueError: Gdy sposób przechowywania jest nieznany
         """
+        if storage not in self.STORAGE_TYPES:
+            raise ValueError("Nieznany sposób przechowywania. Użyj 'rows' lub 'columnar'")
+        
+        self._storage = storage
+        # Źródło strumieniowe przyjmuje opcjonalną listę potrzebnych kolumn
+        self._source: Optional[Callable[..., Iterator[Dict[str, Any]]]] = None
+        self._store: Optional[ColumnStore] = None
+        # Plik zmapowany do pamięci (map_csv) i warunki przekazane do jego odczytu
+        self._mapped = None
+        self._mapped_predicate: Optional[Predicate] = None
+        # Czy plik zmapowany został otwarty przez ten procesor (widoki go współdzielą)
+        self._owns_mapped = False
+        # Indeks None oznacza indeks nieaktualny, przebudowywany przy użyciu
+        self._indexes: Dict[str, Optional[HashIndex]] = {}
+        self._sorted_indexes: Dict[str, Optional[SortedIndex]] = {}
+        # Licznik zmian danych i jego wartość w chwili budowy każdego indeksu
+        self._version = 0
+        self._index_versions: Dict[Tuple[type, str], int] = {}
+        # Widok (where): dane bazowe i numery wybranych wierszy
+        self._base: Union[List[Dict[str, Any]], ColumnStore, None] = None
+        self._selection: Optional[array] = None
+        # Błędy poszczególnych plików z ostatniego load_many {ścieżka: wyjątek}
+        self.load_errors: Dict[str, Exception] = {}
         self.data = data or []
     
-    def load_from_csv(self, filepath: str, **kwargs) -> 'DataProcessor':
+    @property
+    def data(self) -> List[Dict[str, Any]]:
+        """Dane procesora jako lista słowników."""
+        if self._selection is not None:
+            # Widok nie jest zamieniany w kopię danych przy odczycie
+            return list(self._iter_view())
+        if self._source is not None:
+            self._set_rows(self._source())
+        if self._store is not None:
+            return self._store.to_rows()
+        # Wiersze są wydawane bez kopiowania i mogą zostać zmienione w miejscu
+        # (także bez zmiany liczby wierszy), więc indeksy tracą aktualność
+        self._version += 1
+        return self._data
+    
+    @data.setter
+    def data(self, value: List[Dict[str, Any]]) -> None:
+        self._set_rows(value)
+    
+    @property
+    def storage(self) -> str:
+        """Sposób przechowywania danych ('rows' lub 'columnar')."""
+        return self._storage
+    
+    @property
+    def is_streaming(self) -> bool:
+        """Czy procesor działa w trybie strumieniowym (stream_csv lub map_csv)."""
+        return self._source is not None and self._selection is None
+    
+    @property
+    def is_view(self) -> bool:
+        """Czy procesor jest widokiem utworzonym przez where."""
+        return self._selection is not None
+    
+    def _reset_source(self) -> None:
         """
-        Ładuje dane z pliku CSV.
+        Odłącza źródło strumieniowe, plik zmapowany (zamykając go, jeśli
+        otworzył go ten procesor) i dane bazowe widoku.
+        """
+        if self._owns_mapped:
+            self._mapped.close()
+            self._owns_mapped = False
+        self._source = None
+        self._mapped = None
+        self._base = None
+        self._selection = None
+    
+    def _set_rows(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """Zapisuje wiersze w bieżącym sposobie przechowywania."""
+        # Wiersze mogą być czytane leniwie z dotychczasowego pliku zmapowanego,
+        # więc jest on zamykany dopiero po ich wczytaniu
+        previous = self._mapped if self._owns_mapped else None
+        self._owns_mapped = False
+        self._reset_source()
+        self._invalidate_indexes()
+        try:
+            if self._storage == 'columnar':
+                self._store = ColumnStore.from_rows(rows)
+                self._data = []
+            else:
+                self._store = None
+                self._data = rows if isinstance(rows, list) else list(rows)
+        finally:
+            if previous is not None:
+                previous.close()
+    
+    def _iter_rows(self) -> Iterator[Dict[str, Any]]:
+        """Zwraca iterator po wierszach bez materializowania strumienia."""
+        if self._source is not None:
+            return self._source()
+        if self._store is not None:
+            return self._store.iter_rows()
+        return iter(self._data)
+    
+    def _scan(self, predicate: Optional[Predicate] = None,
+              columns: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Zwraca iterator po wierszach spełniających warunek, używając
+        najtańszej drogi dla bieżącego sposobu przechowywania danych.
         
         Args:
-            filepath (str): Ścieżka do pliku
-            **kwargs: Dodatkowe argumenty dla load_csv_data
+            predicate (Optional[Predicate]): Warunek (domyślnie brak)
+            columns (Optional[List[str]]): Kolumny potrzebne dalej; źródło
+                może pominąć pozostałe (wiersze mogą jednak je zawierać)
         
         Returns:
-            DataProcessor: Zwraca siebie dla chaining
+            Iterator[Dict[str, Any]]: Pasujące wiersze
         """
-        self.data = load_csv_data(filepath, **kwargs)
-        return self
+        if self._mapped is not None:
+            if predicate and self._mapped_predicate:
+                predicate = self._mapped_predicate & predicate
+            return self._mapped.iter_rows(columns, predicate or self._mapped_predicate)
+        
+        if self._selection is not None:
+            positions = self._selection
+            if predicate:
+                positions = _select_positions(self._base, predicate, positions)
+            return self._iter_view(positions, columns)
+        
+        if self._source is not None:
+            needed = _with_columns(columns, predicate.columns if predicate else [])
+            rows = self._source(needed)
+            return filter(predicate, rows) if predicate else rows
+        
+        indexes = self._fresh_indexes(predicate.columns) if predicate else {}
+        if self._store is not None:
+            positions = None
+            if predicate:
+                positions = predicate.select(self._store, predicate.index_candidates(indexes))
+            return self._store.iter_rows(positions, columns)
+        
+        if predicate:
+            return iter(filter_data(self._data, predicate, indexes))
+        return iter(self._data)
     
-    def filter(self, conditions: Dict[str, Any]) -> 'DataProcessor':
+    def iter_rows(self, columns: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
         """
-        Filtruje dane według warunków.
+        Leniwie zwraca wiersze danych (także strumienia i widoku).
+        
+        Źródła strumieniowe, pliki zmapowane i dane kolumnowe odczytują
+        tylko podane kolumny. Wierszy nie należy modyfikować - w trybie
+        wierszowym są to wiersze procesora.
         
         Args:
-            conditions (Dict[str, Any]): Warunki filtrowania
+            columns (Optional[List[str]]): Kolumny potrzebne dalej (domyślnie
+                wszystkie); wiersze mogą zawierać także pozostałe kolumny
         
         Returns:
-            DataProcessor: Zwraca siebie dla chaining
+            Iterator[Dict[str, Any]]: Wiersze
         """
-        self.data = filter_data(self.data, conditions)
-        return self
+        return self._scan(columns=columns)
     
-    def get_column_values(self, column: str) -> List[Any]:
+    def lazy(self) -> LazyQuery:
         """
-        Zwraca wszystkie wartości z określonej kolumny.
+        Rozpoczyna leniwe zapytanie na danych procesora.
         
-        Args:
-            column (str): Nazwa kolumny
+        Kolejne filter, select i group_by budują plan, który jest
+        optymalizowany (fuzja filtrów, zawężanie odczytywanych kolumn)
+        i wykonywany w jednym przebiegu dopiero przy collect() lub count().
         
         Returns:
-            List[Any]: Lista wartości
+            LazyQuery: Puste zapytanie na bieżących danych
         
-        Raises:
-            KeyError: Gdy kolumna nie istnieje
+        Example:
+            >>> query = processor.lazy().filter({'age': ('>', 30)}).select(['name'])
+            >>> print(query.explain())
+            >>> names = query.collect()
         """
-        if not self.data:
-            return []
-        
-        if column not in self.data[0]:
-            raise KeyError(f"Kolumna '{column}' nie istnieje w danych")
-        
-        return [row[column] for row in self.data if column in row]
+        return LazyQuery(self)
     
-    def get_unique_values(self, column: str) -> List[Any]:
+    def to_columnar(self) -> 'DataProcessor':
         """
-        Zwraca unikalne wartości z kolumny.
+        Przełącza procesor na kolumnowe przechowywanie danych.
         
-        Args:
-            column (str): Nazwa kolumny
+        W trybie strumieniowym kolumny są budowane w jednym przebiegu
+        po pliku, bez tworzenia listy wierszy.
         
         Returns:
-            List[Any]: Lista unikalnych wartości
+            DataProcessor: Zwraca siebie dla chaining
         """
-        values = self.get_column_values(column)
-        return list(set(values))
+        if self._storage != 'columnar':
+            store = self._read_columnar_file()
+            rows = self._iter_rows() if store is None else []
+            self._storage = 'columnar'
+            self._set_rows(rows)
+            if store is not None:
+                self._store = store
+        return self
     
-    def count_rows(self) -> int:
+    def _read_columnar_file(self) -> Optional[ColumnStore]:
+        """Wczytuje źródło z load_columnar wprost do magazynu (None dla innych źródeł)."""
+        if self._selection is None and isinstance(self._mapped, ColumnarFile):
+            return self._mapped.read(predicate=self._mapped_predicate)
+        return None
+    
+    def to_rows(self) -> 'DataProcessor':
         """
-        Zwraca liczbę wierszy w danych.
+        Przełącza procesor na przechowywanie danych jako listy słowników.
         
         Returns:
-            int: Liczba wierszy
+            DataProcessor: Zwraca siebie dla chaining
+        """
+        if self._storage != 'rows':
+            rows = self._iter_rows()
+            self._storage = 'rows'
+            self._set_rows(rows)
+        return self
+    
+    def load_from_csv(self, filepath: str, **kwargs) -> 'DataProcessor':
         """
-        return len(self.data)
\ No newline at end of file
+        Ładuje dane z pliku CSV.
+        
+        Args:
+            filepath (str): Ścieżka do pliku
+            **kwargs: Dodatkowe argumenty dla load_csv_data
+        
+        Returns:
+            DataProcessor: Zwraca siebie dla chaining
+        """
+        if self._storage == 'columnar' and kwargs.get('cache_dir') is not None:
+            # Trafienie w pamięci podręcznej daje gotowe bufory kolumn
+            cache_dir = kwargs.pop('cache_dir')
+            workers = kwargs.pop('workers', 1)
+            with _csv_errors(filepath):
+                store = _load_cached(filepath, cache_dir, _csv_options(**kwargs),
+                                     workers, columnar=True)
+            self._set_rows([])
+            self._store = store
+        elif self._storage == 'columnar':
+            # Kolumny budowane wprost ze strumienia, bez listy wierszy
+            with _csv_errors(filepath):
+                self._set_rows(iter_csv_data(filepath, **kwargs))
+        else:
+            self.data = load_csv_data(filepath, **kwargs)
+        return self
+    
+    def load_many(self, glob_or_paths: Union[str, Iterable[str]], workers: int = 1,
+                  threads: Optional[int] = None, **kwargs) -> 'DataProcessor':
+        """
+        Ładuje i łączy dane z wielu plików CSV, czytając je współbieżnie.
+        
+        Pliki są odczytywane w puli wątków (czas otwierania i czytania
+        wielu małych plików nakłada się), a dla workers > 1 parsowane
+        w puli procesów. Wiersze są łączone zawsze w kolejności plików
+        (dla wzorca - posortowanych ścieżek), niezależnie od kolejności
+        zakończenia zadań. Każdy plik ma własny schemat wnioskowany jak
+        w load_csv_data.
+        
+        Błąd pojedynczego pliku nie przerywa ładowania: plik jest pomijany,
+        a wyjątek (FileNotFoundError lub ValueError, jak w load_csv_data)
+        trafia do atrybutu load_errors {ścieżka: wyjątek}.
+        
+        Args:
+            glob_or_paths (Union[str, Iterable[str]]): Wzorzec glob (np.
+                'dane/*.csv') lub lista ścieżek
+            workers (int): Liczba procesów parsujących (domyślnie 1 -
+                parsowanie w wątkach czytających). Konwertery ze schema
+                muszą wtedy dać się zserializować
+            threads (Optional[int]): Liczba wątków czytających (domyślnie
+                4 * workers, najwyżej MAX_READ_THREADS)
+            **kwargs: Opcje parsowania jak w load_csv_data (delimiter,
+                encoding, schema, infer_schema, sample_size)
+        
+        Returns:
+            DataProcessor: Zwraca siebie dla chaining
+        
+        Raises:
+            FileNotFoundError: Gdy wzorzec nie pasuje do żadnego pliku
+        
+        Example:
+            >>> processor = DataProcessor().load_many('logi/2024-*.csv', workers=4)
+            >>> processor.load_errors
+            {'logi/2024-01-03.csv': ValueError('Błąd podczas czytania pliku: ...')}
+        """
+        options = _csv_options(**kwargs)
+        if isinstance(glob_or_paths, str):
+            paths = sorted(glob.glob(glob_or_paths))
+            if not paths:
+                raise FileNotFoundError(f"Brak plików pasujących do wzorca {glob_or_paths}")
+        else:
+            paths = list(glob_or_paths)
+        if threads is None:
+            threads = min(4 * max(workers, 1), MAX_READ_THREADS)
+        
+        parsers = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        
+        def load(filepath: str) -> List[Dict[str, Any]]:
+            with _csv_errors(filepath):
+                data = read_bytes(filepath)
+                if parsers is None:
+                    return _parse_csv_bytes(data, **options)
+                # Wątek czeka na wynik, a parsowanie odbywa się poza GIL
+                return parsers.submit(_parse_csv_bytes, data, **options).result()
+        
+        results = []
+        errors: Dict[str, Exception] = {}
+        try:
+            with ThreadPoolExecutor(max_workers=max(threads, 1)) as readers:
+                futures = [readers.submit(load, filepath) for filepath in paths]
+                for filepath, future in zip(paths, futures):
+                    try:
+                        results.append(future.result())
+                    except (FileNotFoundError, ValueError) as e:
+                        errors[filepath] = e
+        finally:
+            if parsers is not None:
+                parsers.shutdown()
+        
+        self._set_rows(itertools.chain.from_iterable(results))
+        self.load_errors = errors
+        return self
+    
+    def stream_csv(self, filepath: str, **kwargs) -> 'DataProcessor':
+        """
+        Ustawia plik CSV jako leniwe źródło danych.
+        
+        Kolejne operacje (filter, get_column_values, count_rows, ...)
+        przechodzą przez plik wiersz po wierszu, więc zużycie pamięci
+        nie zależy od jego rozmiaru. Każda operacja końcowa czyta plik
+        od nowa.
+        
+        Args:
+            filepath (str): Ścieżka do pliku
+            **kwargs: Dodatkowe argumenty dla iter_csv_data
+        
+        Returns:
+            DataProcessor: Zwraca siebie dla chaining
+        """
+        self._reset_source()
+        self._data = []
+        self._store = None
+        self._invalidate_indexes()
+        base_columns = kwargs.pop('columns', None)
+        
+        def source(columns: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+            if base_columns is not None:
+                columns = base_columns if columns is None else [
+                    column for column in columns if column in base_columns]
+            return iter_csv_data(filepath, columns=columns, **kwargs)
+        
+        self._source = source
+        return self
+    
+    def map_csv(self, filepath: str, **kwargs) -> 'DataProcessor':
+        """
+        Mapuje plik CSV do pamięci i używa go jako leniwego źródła danych.
+        
+        Pozycje rekordów są indeksowane raz, przy otwarciu. Operacje
+        konwertują tylko potrzebne kolumny: get_column_values - jedną
+        kolumnę, filter - najpierw kolumny warunku, a pozostałe tylko dla
+        pasujących wierszy; count_rows bez filtrów nie odczytuje rekordów.
+        
+        Args:
+            filepath (str): Ścieżka do pliku
+            **kwargs: Dodatkowe argumenty dla MappedCSV (delimiter,
+                encoding, schema, infer_schema, sample_size)
+        
+        Returns:
+            DataProcessor: Zwraca siebie dla chaining
+        
+        Raises:
+            FileNotFoundError: Gdy plik nie istnieje
+            ValueError: Gdy kodowanie nie jest zgodne z ASCII lub plik jest
+                skompresowany
+        """
+        from .mapped import MappedCSV
+        
+        with _csv_errors(filepath):
+            mapped = MappedCSV(filepath, **kwargs)
+        self._reset_source()
+        self._data = []
+        self._store = None
+        self._invalidate_indexes()
+        self._attach_mapped(mapped, None)
+        self._owns_mapped = True
+        return self
+    
+    def close(self) -> None:
+        """
+        Zwalnia plik zmapowany przez map_csv i usuwa dane procesora.
+        
+        Plik jest zwalniany także przy wczytaniu innych danych (map_csv,
+        load_from_csv, przypisanie data). Widoki utworzone przez where
+        współdzielą mapowanie, więc po zamknięciu nie można ich odczytywać.
+        Procesor może być używany jako menedżer kontekstu (blok with).
+        
+        Example:
+            >>> with DataProcessor().map_csv('dane.csv') as processor:
+            ...     adults = processor.filter({'age': ('>=', 18)}).count_rows()
+        """
+        self._set_rows([])
+    
+    def __enter__(self) -> 'DataProcessor':
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+    
+    def save_columnar(self, path: str, chunk_size: int = CHUNK_SIZE) -> 'DataProcessor':
+        """
+        Zapisuje dane w binarnym formacie kolumnowym (patrz columnfile).
+        
+        Dane są dzielone na porcje po chunk_size wierszy, a dla każdej
+        porcji i kolumny zapisywane są wartości min/max. Dane strumieniowe
+        są zapisywane porcjami, bez wczytywania całości do pamięci.
+        
+        Args:
+            path (str): Ścieżka pliku wynikowego
+            chunk_size (int): Liczba wierszy w porcji (domyślnie CHUNK_SIZE)
+        
+        Returns:
+            DataProcessor: Zwraca siebie dla chaining
+        
+        Raises:
+            ValueError: Gdy chunk_size nie jest dodatnie
+        """
+        if self._store is not None and self._source is None:
+            write_columnar(path, self._store, chunk_size)
+        else:
+            write_columnar(path, self._iter_rows(), chunk_size)
+        return self
+    
+    def load_columnar(self, path: str) -> 'DataProcessor':
+        """
+        Używa pliku zapisanego przez save_columnar jako leniwego źródła danych.
+        
+        Przy otwarciu czytana jest tylko stopka pliku. Operacje odczytują
+        z dysku wyłącznie potrzebne kolumny, a filter, range i zapytania
+        leniwe pomijają porcje, których wartości min/max wykluczają
+        warunek. Dane można wczytać do pamięci przez to_columnar() lub
+        to_rows().
+        
+        Args:
+            path (str): Ścieżka do pliku
+        
+        Returns:
+            DataProcessor: Zwraca siebie dla chaining
+        
+        Raises:
+            FileNotFoundError: Gdy plik nie istnieje
+            ValueError: Gdy plik nie jest w formacie kolumnowym
+        
+        Example:
+            >>> processor.load_from_csv('dane.csv').save_columnar('dane.dfcol')
+            >>> recent = DataProcessor().load_columnar('dane.dfcol').filter({'year': ('>=', 2020)})
+        """
+        columnar = ColumnarFile(path)
+        self._reset_source()
+        self._data = []
+        self._store = None
+        self._invalidate_indexes()
+        self._attach_mapped(columnar, None)
+        return self
+    
+    def _attach_mapped(self, mapped: Any, predicate: Optional[Predicate]) -> None:
+        """Ustawia plik zmapowany (i warunek jego odczytu) jako źródło danych."""
+        self._mapped = mapped
+        self._mapped_predicate = predicate
+        self._source = lambda columns=None: mapped.iter_rows(columns, self._mapped_predicate)
+    
+    def filter(self, conditions: Union[Dict[str, Any], Predicate]) -> 'DataProcessor':
+        """
+        Filtruje dane według warunków.
+        
+        Obsługuje te same operatory co filter_data. W trybie kolumnowym
+        warunki są sprawdzane na całych kolumnach naraz.
+        
+        Args:
+            conditions (Union[Dict[str, Any], Predicate]): Warunki filtrowania
+        
+        Returns:
+            DataProcessor: Zwraca siebie dla chaining
+        """
+        if self._mapped is not None:
+            # Warunek jest sprawdzany podczas odczytu zmapowanego pliku
+            predicate = compile_conditions(conditions)
+            if self._mapped_predicate is not None:
+                predicate = self._mapped_predicate & predicate
+            self._mapped_predicate = predicate
+            return self
+        
+        if self._selection is not None:
+            # Widok zawęża tylko własny wektor selekcji
+            self._selection = _select_positions(self._base, compile_conditions(conditions),
+                                                self._selection)
+            return self
+        
+        if self._source is not None:
+            self._source = _filtered_source(self._source, compile_conditions(conditions))
+            return self
+        
+        if not conditions:
+            return self
+        
+        indexes = self._fresh_indexes(compile_conditions(conditions).columns)
+        predicate = compile_conditions(conditions, indexes)
+        if self._store is not None:
+            positions = predicate.select(self._store, predicate.index_candidates(indexes))
+            self._store = self._store.take(positions)
+            self._invalidate_indexes()
+            return self
+        
+        self.data = filter_data(self._data, predicate, indexes)
+        return self
+    
+    def where(self, conditions: Union[Dict[str, Any], Predicate, None] = None) -> 'DataProcessor':
+        """
+        Tworzy widok danych spełniających warunki, nie zmieniając procesora.
+        
+        Widok współdzieli dane bazowe (listę wierszy lub magazyn kolumnowy)
+        i przechowuje tylko wektor selekcji - array('q') z numerami
+        wybranych wierszy. Widok widoku sprawdza warunek wyłącznie na
+        wierszach widoku nadrzędnego. Widok obsługuje te same operacje co
+        procesor; filter zawęża wektor selekcji widoku, a kopia danych
+        powstaje dopiero przez materialize(). Odczyt data zwraca listę
+        współdzielonych wierszy bazowych.
+        
+        Dla procesora strumieniowego (stream_csv, map_csv) widok jest
+        nowym procesorem strumieniowym z dołączonym warunkiem.
+        
+        Args:
+            conditions (Union[Dict[str, Any], Predicate, None]): Warunki jak
+                w filter (domyślnie brak - widok wszystkich wierszy)
+        
+        Returns:
+            DataProcessor: Nowy procesor-widok
+        
+        Example:
+            >>> adults = processor.where({'age': ('>=', 18)})
+            >>> in_warsaw = adults.where({'city': 'Warszawa'})
+            >>> processor.count_rows(), adults.count_rows(), in_warsaw.count_rows()
+            (1000, 800, 120)
+        """
+        predicate = compile_conditions(conditions) if conditions else None
+        view = DataProcessor(storage=self._storage)
+        
+        if self._mapped is not None:
+            combined = self._mapped_predicate
+            if predicate:
+                combined = predicate if combined is None else combined & predicate
+            view._attach_mapped(self._mapped, combined)
+            return view
+        
+        if self._selection is not None:
+            base = self._base
+            selection = _select_positions(base, predicate, self._selection)
+        elif self._source is not None:
+            view._source = _filtered_source(self._source, predicate) if predicate else self._source
+            return view
+        else:
+            base = self._store if self._store is not None else self._data
+            indexes = self._fresh_indexes(predicate.columns) if predicate else {}
+            if predicate:
+                predicate = compile_conditions(conditions, indexes)
+            selection = _select_positions(base, predicate, None, indexes)
+        
+        view._base = base
+        view._selection = selection
+        view._source = lambda columns=None: view._iter_view(columns=columns)
+        return view
+    
+    def _iter_view(self, positions: Optional[Sequence[int]] = None,
+                   columns: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+        """Zwraca wiersze danych bazowych widoku o podanych numerach."""
+        if positions is None:
+            positions = self._selection
+        if isinstance(self._base, ColumnStore):
+            return self._base.iter_rows(positions, columns)
+        return map(self._base.__getitem__, positions)
+    
+    def materialize(self) -> 'DataProcessor':
+        """
+        Tworzy niezależny procesor z kopią danych (np. z widoku).
+        
+        Dla widoku kolumnowego kopiowane są tylko wybrane pozycje buforów
+        kolumn, bez odtwarzania wierszy.
+        
+        Returns:
+            DataProcessor: Nowy procesor z danymi w pamięci
+        """
+        result = DataProcessor(storage=self._storage)
+        if self._selection is not None and isinstance(self._base, ColumnStore):
+            result._store = self._base.take(self._selection)
+            result._data = []
+            return result
+        if self._store is not None and self._source is None:
+            result._store = self._store.take(range(len(self._store)))
+            result._data = []
+            return result
+        if self._storage == 'columnar' and isinstance(self._mapped, ColumnarFile):
+            result._store = self._read_columnar_file()
+            result._data = []
+            return result
+        result._set_rows(dict(row) for row in self._scan())
+        return result
+    
+    def _require_memory(self) -> None:
+        """Zgłasza ValueError, gdy indeksu nie można zbudować (strumień lub widok)."""
+        if self._selection is not None:
+            raise ValueError("Indeksy wymagają własnych danych w pamięci, "
+                             "a procesor jest widokiem (użyj materialize())")
+        if self._source is not None:
+            raise ValueError("Indeksy wymagają danych w pamięci, "
+                             "a procesor działa w trybie strumieniowym")
+    
+    def create_index(self, column: str) -> 'DataProcessor':
+        """
+        Tworzy indeks haszujący kolumny.
+        
+        Indeks jest używany automatycznie przez filter, gdy warunek dotyczy
+        indeksowanej kolumny. Po każdej zmianie danych (filter, load_from_csv,
+        przypisanie data, zmiana liczby wierszy) indeks jest przebudowywany
+        przy najbliższym użyciu. Odczyt data w trybie wierszowym wydaje
+        wiersze bez kopiowania, więc także oznacza indeksy jako nieaktualne
+        (zmiany wierszy należy wprowadzać przez świeżo odczytane data).
+        
+        Args:
+            column (str): Nazwa kolumny
+        
+        Returns:
+            DataProcessor: Zwraca siebie dla chaining
+        
+        Raises:
+            KeyError: Gdy kolumna nie istnieje
+            ValueError: Gdy procesor działa w trybie strumieniowym lub jest
+                widokiem
+        """
+        self._require_memory()
+        
+        self._indexes[column] = self._build_index(column)
+        return self
+    
+    def create_sorted_index(self, column: str) -> 'DataProcessor':
+        """
+        Tworzy indeks posortowany kolumny.
+        
+        Indeks jest używany przez range i top_k (O(log n + k) zamiast
+        sortowania danych), a także przez filter dla warunków '==', '>',
+        '>=', '<', '<=' i 'between' na kolumnie bez indeksu haszującego.
+        Jak create_index, indeks jest przebudowywany po zmianie danych.
+        
+        Args:
+            column (str): Nazwa kolumny
+        
+        Returns:
+            DataProcessor: Zwraca siebie dla chaining
+        
+        Raises:
+            KeyError: Gdy kolumna nie istnieje
+            TypeError: Gdy wartości kolumny nie dają się porównać
+            ValueError: Gdy procesor działa w trybie strumieniowym lub jest
+                widokiem
+        """
+        self._require_memory()
+        
+        self._sorted_indexes[column] = self._build_index(column, SortedIndex)
+        return self
+    
+    def drop_index(self, column: str) -> 'DataProcessor':
+        """
+        Usuwa indeksy kolumny (haszujący i posortowany).
+        
+        Args:
+            column (str): Nazwa kolumny
+        
+        Returns:
+            DataProcessor: Zwraca siebie dla chaining
+        """
+        self._indexes.pop(column, None)
+        self._sorted_indexes.pop(column, None)
+        return self
+    
+    @property
+    def indexed_columns(self) -> List[str]:
+        """Nazwy kolumn posiadających indeks (dowolnego rodzaju)."""
+        return list(dict.fromkeys(itertools.chain(self._indexes, self._sorted_indexes)))
+    
+    def _build_index(self, column: str, kind: type = HashIndex) -> Any:
+        """Buduje indeks kolumny (HashIndex lub SortedIndex) dla bieżących danych."""
+        self._index_versions[kind, column] = self._version
+        if self._store is not None:
+            if len(self._store) and column not in self._store:
+                raise KeyError(f"Kolumna '{column}' nie istnieje w danych")
+            if column not in self._store:
+                return kind(column, [])
+            return kind(column, self._store.column(column))
+        
+        if self._data and column not in self._data[0]:
+            raise KeyError(f"Kolumna '{column}' nie istnieje w danych")
+        return kind.from_rows(self._data, column)
+    
+    def _invalidate_indexes(self) -> None:
+        """Oznacza wszystkie indeksy jako nieaktualne."""
+        self._version += 1
+        for column in self._indexes:
+            self._indexes[column] = None
+        for column in self._sorted_indexes:
+            self._sorted_indexes[column] = None
+    
+    def _fresh_index(self, indexes: Dict[str, Any], column: str, kind: type) -> Any:
+        """Zwraca aktualny indeks kolumny z podanego słownika (None, gdy brak)."""
+        if column not in indexes:
+            return None
+        index = indexes[column]
+        if (index is None or self._index_versions.get((kind, column)) != self._version
+                or index.size != self.count_rows()):
+            index = indexes[column] = self._build_index(column, kind)
+        return index
+    
+    def _fresh_indexes(self, columns: Iterable[str]) -> Dict[str, Any]:
+        """
+        Zwraca aktualne indeksy podanych kolumn, przebudowując nieaktualne.
+        
+        Dla kolumny z oboma rodzajami indeksu zwracany jest indeks haszujący.
+        """
+        fresh = {}
+        for column in columns:
+            index = self._fresh_index(self._indexes, column, HashIndex)
+            if index is None:
+                index = self._fresh_index(self._sorted_indexes, column, SortedIndex)
+            if index is not None:
+                fresh[column] = index
+        return fresh
+    
+    def _rows_at(self, positions: Iterable[int]) -> List[Dict[str, Any]]:
+        """Zwraca wiersze o podanych numerach (w podanej kolejności)."""
+        if self._store is not None:
+            return list(self._store.iter_rows(positions))
+        data = self._data
+        return [data[i] for i in positions]
+    
+    def sample(self, n: int, stratify_by: Optional[str] = None,
+               seed: Optional[int] = None) -> 'DataProcessor':
+        """
+        Losuje próbkę wierszy w jednym przebiegu po danych.
+        
+        Dane strumieniowe (stream_csv, map_csv, load_columnar) są czytane
+        raz, a w pamięci przechowywana jest tylko próbka (reservoir
+        sampling). Dla danych w pamięci losowane są numery wierszy.
+        
+        Args:
+            n (int): Rozmiar próbki (przy stratify_by - w każdej warstwie)
+            stratify_by (Optional[str]): Kolumna wyznaczająca warstwy; każda
+                wartość kolumny dostaje własną próbkę n wierszy
+            seed (Optional[int]): Ziarno generatora dla powtarzalnych próbek
+        
+        Returns:
+            DataProcessor: Nowy procesor z próbką (wiersze w kolejności
+                z danych, ten sam sposób przechowywania)
+        
+        Raises:
+            ValueError: Gdy n jest ujemne
+            KeyError: Gdy kolumna stratify_by nie istnieje w wierszu
+        
+        Example:
+            >>> sample = DataProcessor().stream_csv('dane.csv').sample(1000, seed=7)
+            >>> per_city = DataProcessor().stream_csv('dane.csv').sample(
+            ...     100, stratify_by='city', seed=7)
+        """
+        if stratify_by is not None:
+            try:
+                strata = stratified_sample(enumerate(self._scan()), n,
+                                           lambda entry: entry[1][stratify_by], seed)
+            except KeyError:
+                raise KeyError(f"Kolumna '{stratify_by}' nie istnieje w danych")
+            # Próbki warstw (posortowane numerami wierszy) są łączone
+            # w kolejności wierszy w danych
+            rows = [row for _, row in heapq.merge(*strata.values())]
+        elif self._source is None:
+            rows = self._rows_at(reservoir_sample(range(self.count_rows()), n, seed))
+        else:
+            rows = reservoir_sample(self._scan(), n, seed)
+        
+        result = DataProcessor(storage=self._storage)
+        result._set_rows(rows)
+        return result
+    
+    def range(self, column: str, low: Any = None, high: Any = None) -> List[Dict[str, Any]]:
+        """
+        Zwraca wiersze, w których wartość kolumny należy do przedziału
+        [low, high], uporządkowane rosnąco według tej kolumny.
+        
+        Z indeksem posortowanym (create_sorted_index) zapytanie kosztuje
+        O(log n + k); bez indeksu dane są filtrowane, a wynik sortowany.
+        
+        Args:
+            column (str): Nazwa kolumny
+            low (Any): Dolna granica włącznie (None - brak granicy)
+            high (Any): Górna granica włącznie (None - brak granicy)
+        
+        Returns:
+            List[Dict[str, Any]]: Pasujące wiersze
+        
+        Example:
+            >>> processor.create_sorted_index('age').range('age', 25, 30)
+        """
+        if self._source is None:
+            index = self._fresh_index(self._sorted_indexes, column, SortedIndex)
+            if index is not None:
+                return self._rows_at(index.range(low, high))
+        
+        bounds = []
+        if low is not None:
+            bounds.append(('>=', low))
+        if high is not None:
+            bounds.append(('<=', high))
+        predicate = compile_conditions({column: bounds}) if bounds else None
+        rows = [row for row in self._scan(predicate) if column in row]
+        try:
+            return sorted(rows, key=operator.itemgetter(column))
+        except TypeError:
+            raise TypeError(f"Wartości kolumny '{column}' nie dają się porównać")
+    
+    def top_k(self, column: str, k: int, largest: bool = True) -> List[Dict[str, Any]]:
+        """
+        Zwraca k wierszy z największymi (lub najmniejszymi) wartościami kolumny.
+        
+        Z indeksem posortowanym wiersze są odczytywane wprost z końca
+        indeksu; bez indeksu dane są przeglądane raz z kopcem rozmiaru k
+        (heapq), czyli w O(n log k) zamiast sortowania całości. Wiersze
+        o równych wartościach zachowują kolejność z danych.
+        
+        Args:
+            column (str): Nazwa kolumny
+            k (int): Liczba wierszy
+            largest (bool): True - największe wartości (malejąco),
+                False - najmniejsze (rosnąco)
+        
+        Returns:
+            List[Dict[str, Any]]: Co najwyżej k wierszy
+        
+        Example:
+            >>> processor.top_k('salary', 100)
+        """
+        if self._source is None:
+            index = self._fresh_index(self._sorted_indexes, column, SortedIndex)
+            if index is not None:
+                return self._rows_at(index.largest(k) if largest else index.smallest(k))
+        
+        select = heapq.nlargest if largest else heapq.nsmallest
+        try:
+            if self._source is None and self._store is not None:
+                if column not in self._store:
+                    return []
+                buffer = self._store.column(column)
+                positions = range(len(buffer))
+                if isinstance(buffer, list):
+                    positions = [i for i in positions if buffer[i] is not MISSING]
+                return self._rows_at(select(k, positions, key=buffer.__getitem__))
+            rows = (row for row in self._scan() if column in row)
+            return select(k, rows, key=operator.itemgetter(column))
+        except TypeError:
+            raise TypeError(f"Wartości kolumny '{column}' nie dają się porównać")
+    
+    def get_column_values(self, column: str) -> List[Any]:
+        """
+        Zwraca wszystkie wartości z określonej kolumny.
+        
+        Args:
+            column (str): Nazwa kolumny
+        
+        Returns:
+            List[Any]: Lista wartości
+        
+        Raises:
+            KeyError: Gdy kolumna nie istnieje
+        """
+        if self._source is None and self._store is not None:
+            if not len(self._store):
+                return []
+            return self._store.get_column_values(column)
+        return list(self.iter_column(column))
+    
+    def get_column_array(self, column: str) -> array:
+        """
+        Zwraca kolumnę liczbową jako typowany bufor array.array.
+        
+        W trybie kolumnowym zwracany jest bufor kolumny bez kopiowania
+        (nie należy go modyfikować). Bufor można przekazać wprost do funkcji
+        math_tools, które sprawdzają wtedy typ raz, a nie dla każdego
+        elementu, a z NumPy - użyć jako tablicy bez kopiowania
+        (numpy.frombuffer).
+        
+        Args:
+            column (str): Nazwa kolumny
+        
+        Returns:
+            array: array('q') dla liczb całkowitych lub array('d') dla
+                zmiennoprzecinkowych
+        
+        Raises:
+            KeyError: Gdy kolumna nie istnieje
+            ValueError: Gdy kolumna zawiera wartości nieliczbowe lub brakujące
+        """
+        if self._source is None and self._store is not None and len(self._store):
+            buffer = self._store.column(column)
+            if isinstance(buffer, array):
+                return buffer
+        
+        values = self.get_column_values(column)
+        if self._store is not None and self._source is None and len(values) != len(self._store):
+            raise ValueError(f"Kolumna '{column}' zawiera brakujące wartości")
+        if not all(isinstance(value, (int, float)) for value in values):
+            raise ValueError(f"Kolumna '{column}' nie jest kolumną liczbową")
+        try:
+            return array('q', values)
+        except (TypeError, OverflowError):
+            return array('d', values)
+    
+    def iter_column(self, column: str, chunk_size: Optional[int] = None) -> Iterator[Any]:
+        """
+        Leniwie zwraca wartości kolumny (także strumienia i widoku).
+        
+        W trybie kolumnowym (również dla widoku danych kolumnowych) wartości
+        są czytane wprost z bufora kolumny, bez odtwarzania wierszy, a
+        źródło strumieniowe odczytuje tylko tę kolumnę. Brakujące wartości
+        są pomijane. Z chunk_size zwracane są porcje wartości - dla buforów
+        liczbowych wycinki array.array, które funkcje math_tools sprawdzają
+        raz, a nie dla każdego elementu.
+        
+        Args:
+            column (str): Nazwa kolumny
+            chunk_size (Optional[int]): Rozmiar porcji (domyślnie zwracane
+                są pojedyncze wartości)
+        
+        Returns:
+            Iterator[Any]: Wartości kolumny albo, z chunk_size, ich porcje
+                (array.array lub list)
+        
+        Raises:
+            KeyError: Gdy kolumna nie istnieje (dla strumienia - przy
+                odczycie pierwszego wiersza)
+            ValueError: Gdy rozmiar porcji nie jest dodatni
+        
+        Example:
+            >>> for chunk in processor.iter_column('value', chunk_size=65536):
+            ...     stats.update(chunk)
+        """
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("Rozmiar porcji musi być dodatni")
+        
+        if self._selection is not None and isinstance(self._base, ColumnStore):
+            store, positions = self._base, self._selection
+        elif self._source is None and self._store is not None:
+            store, positions = self._store, None
+        else:
+            values = self._iter_column(column)
+            return values if chunk_size is None else _chunked(values, chunk_size)
+        
+        if not len(store):
+            return iter(())
+        buffer = store.column(column)
+        if positions is None and chunk_size is not None and isinstance(buffer, array):
+            return (buffer[start:start + chunk_size]
+                    for start in range(0, len(buffer), chunk_size))
+        values = iter(buffer) if positions is None else map(buffer.__getitem__, positions)
+        if not isinstance(buffer, (array, DictionaryColumn)):
+            values = (value for value in values if value is not MISSING)
+        return values if chunk_size is None else _chunked(values, chunk_size)
+    
+    def _iter_column(self, column: str) -> Iterator[Any]:
+        """Leniwie zwraca wartości kolumny z wierszy, sprawdzając pierwszy wiersz."""
+        # Źródło strumieniowe odczytuje tylko potrzebną kolumnę
+        rows = self._source([column]) if self._source is not None else self._iter_rows()
+        first = next(rows, None)
+        if first is None:
+            return
+        
+        if column not in first:
+            raise KeyError(f"Kolumna '{column}' nie istnieje w danych")
+        
+        yield first[column]
+        for row in rows:
+            if column in row:
+                yield row[column]
+    
+    def get_unique_values(self, column: str, approx: bool = False,
+                          error: float = 0.01) -> Union[List[Any], HyperLogLog]:
+        """
+        Zwraca unikalne wartości z kolumny.
+        
+        Z approx=True zamiast zbioru wartości budowany jest szkic
+        HyperLogLog o stałym rozmiarze (około (1.04 / error) ** 2 bajtów),
+        więc liczność kolumn o wielu wartościach (np. identyfikatorów)
+        można oszacować także dla strumienia pliku. Szkice z różnych
+        fragmentów danych lub procesów łączy się przez merge (lub |).
+        
+        Args:
+            column (str): Nazwa kolumny
+            approx (bool): Czy zwrócić szkic zamiast listy wartości
+            error (float): Względny błąd standardowy szkicu (domyślnie 0.01)
+        
+        Returns:
+            Union[List[Any], HyperLogLog]: Lista unikalnych wartości lub,
+                dla approx=True, szkic z oszacowaniem liczności (count())
+        
+        Example:
+            >>> sketch = processor.get_unique_values('user_id', approx=True)
+            >>> sketch.count()
+            1002311
+        """
+        if approx:
+            sketch = HyperLogLog(error)
+            if self._source is None and self._store is not None and column in self._store:
+                buffer = self._store.column(column)
+                if isinstance(buffer, DictionaryColumn):
+                    return sketch.update(buffer.unique())
+                return sketch.update(value for value in buffer if value is not MISSING)
+            return sketch.update(self.iter_column(column))
+        
+        if self._source is None and self._store is not None:
+            if not len(self._store):
+                return []
+            buffer = self._store.column(column)
+            if isinstance(buffer, DictionaryColumn):
+                return buffer.unique()
+            unique = set(buffer)
+            unique.discard(MISSING)
+            return list(unique)
+        return list(set(self.iter_column(column)))
+    
+    def group_by(self, column: str) -> Dict[Any, List[Dict[str, Any]]]:
+        """
+        Grupuje dane według wartości kolumny (jak group_by_column).
+        
+        Dla kolumny kodowanej słownikowo wiersze są grupowane po kodach,
+        bez porównywania napisów.
+        
+        Args:
+            column (str): Nazwa kolumny
+        
+        Returns:
+            Dict[Any, List[Dict[str, Any]]]: Słownik grup
+        
+        Raises:
+            KeyError: Gdy kolumna nie istnieje w danych
+        """
+        if self._source is None and self._store is not None and column in self._store:
+            buffer = self._store.column(column)
+            if isinstance(buffer, DictionaryColumn):
+                positions: Dict[int, List[int]] = defaultdict(list)
+                for position, code in enumerate(buffer.codes):
+                    positions[code].append(position)
+                return {buffer.values[code]: list(self._store.iter_rows(group))
+                        for code, group in positions.items()}
+        return group_by_column(self._scan(), column)
+    
+    def count_rows(self) -> int:
+        """
+        Zwraca liczbę wierszy w danych.
+        
+        Returns:
+            int: Liczba wierszy
+        """
+        if self._mapped is not None and self._mapped_predicate is None:
+            return len(self._mapped)
+        if self._selection is not None:
+            return len(self._selection)
+        if self._source is not None:
+            return sum(1 for _ in self._source([]))
+        if self._store is not None:
+            return len(self._store)
+        return len(self._data)
+    
+    def aggregate(self, by: Union[str, List[str]],
+                  aggs: Dict[str, Union[str, List[str]]]) -> Dict[Any, Dict[str, Any]]:
+        """
+        Agreguje dane w grupach w jednym przebiegu (jak aggregate_data).
+        
+        Odczytywane są tylko kolumny grupowania i agregowane, a członkowie
+        grup nie są przechowywani - w trybie strumieniowym zużycie pamięci
+        zależy wyłącznie od liczby grup.
+        
+        Args:
+            by (Union[str, List[str]]): Kolumna lub lista kolumn grupowania
+            aggs (Dict[str, Union[str, List[str]]]): Agregacje dla kolumn,
+                np. {'salary': ['sum', 'mean', 'count', 'min', 'max']}
+        
+        Returns:
+            Dict[Any, Dict[str, Any]]: Słownik {klucz grupy: wyniki}
+        
+        Raises:
+            KeyError: Gdy kolumna grupowania nie istnieje w danych
+            ValueError: Gdy agregacja jest nieznana
+        
+        Example:
+            >>> processor.aggregate(by=['city', 'dept'], aggs={'salary': ['sum', 'mean']})
+            {('Warszawa', 'IT'): {'count': 2, 'salary_sum': 9000, 'salary_mean': 4500.0}}
+        """
+        keys = [by] if isinstance(by, str) else list(by)
+        rows = self._scan(None, _with_columns(keys, aggs))
+        return aggregate_data(rows, by, aggs)
+    
+    def join(self, other: 'DataProcessor', on: Union[str, List[str]], how: str = 'inner',
+             suffix: str = '_right') -> 'DataProcessor':
+        """
+        Łączy dane z danymi innego procesora (hash join).
+        
+        Tablica haszująca jest budowana z mniejszej strony, a druga strona
+        jest przeglądana wiersz po wierszu. Strona strumieniowa (stream_csv,
+        map_csv) jest zawsze przeglądana - nie trafia do pamięci, a wynik
+        jest wtedy również strumieniowy (każda operacja przegląda plik
+        od nowa, tablica haszująca jest budowana raz).
+        
+        Kolejność wyniku odpowiada kolejności przeglądanej strony; gdy
+        tablica powstała z lewej strony (self), niepasujące wiersze
+        złączenia 'left' trafiają na koniec.
+        
+        Args:
+            other (DataProcessor): Prawa strona złączenia
+            on (Union[str, List[str]]): Kolumna lub lista kolumn złączenia
+            how (str): 'inner' lub 'left' (domyślnie 'inner')
+            suffix (str): Sufiks dla kolumn prawej strony o nazwach
+                występujących po lewej stronie (domyślnie '_right')
+        
+        Returns:
+            DataProcessor: Nowy procesor z połączonymi danymi (w tym samym
+                sposobie przechowywania co self)
+        
+        Raises:
+            ValueError: Gdy typ złączenia jest nieznany
+        
+        Example:
+            >>> people = DataProcessor(people_rows)
+            >>> orders = DataProcessor().stream_csv('zamowienia.csv')
+            >>> result = people.join(orders, on='person_id', how='left')
+        """
+        if how not in JOIN_TYPES:
+            raise ValueError(f"Nieznany typ złączenia '{how}'. Dostępne: {', '.join(JOIN_TYPES)}")
+        
+        if self.is_streaming != other.is_streaming:
+            build_left = other.is_streaming
+        elif self.is_streaming:
+            build_left = False
+        else:
+            build_left = self.count_rows() < other.count_rows()
+        build, probe_side = (self, other) if build_left else (other, self)
+        table = HashTable(build._scan(), on)
+        
+        result = DataProcessor(storage=self._storage)
+        if not probe_side.is_streaming:
+            result._set_rows(probe(table, probe_side._scan(), how, build_left, suffix))
+            return result
+        
+        source = probe_side._source
+        result._source = lambda columns=None: probe(table, source(), how, build_left, suffix)
+        return result
@@ -0,0 +1,266 @@
+"""
+Moduł indexes - indeksy kolumn
+==============================
+
+Ten moduł zawiera klasy do:
+- Budowania indeksów haszujących wartość -> numery wierszy
+- Szybkiego wyszukiwania wierszy o podanej wartości kolumny
+- Budowania indeksów posortowanych do zapytań zakresowych i top-k
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from typing import List, Dict, Any, Iterable, Optional, Tuple
+
+from .columnar import MISSING
+
+
+class HashIndex:
+    """
+    Indeks haszujący kolumny: dla każdej wartości przechowuje rosnącą listę
+    numerów wierszy, w których ta wartość występuje.
+    
+    Attributes:
+        column (str): Nazwa indeksowanej kolumny
+        size (int): Liczba wierszy, dla których zbudowano indeks
+    """
+    
+    def __init__(self, column: str, values: Iterable[Any]):
+        """
+        Buduje indeks z wartości kolumny podanych w kolejności wierszy.
+        
+        Args:
+            column (str): Nazwa indeksowanej kolumny
+            values (Iterable[Any]): Wartości kolumny (MISSING oznacza brak
+                wartości i nie trafia do indeksu)
+        
+        Raises:
+            TypeError: Gdy kolumna zawiera wartości niehaszowalne
+        """
+        self.column = column
+        positions: Dict[Any, List[int]] = defaultdict(list)
+        size = 0
+        for position, value in enumerate(values):
+            if value is not MISSING:
+                positions[value].append(position)
+            size = position + 1
+        self.size = size
+        self._positions = dict(positions)
+    
+    @classmethod
+    def from_rows(cls, rows: Iterable[Dict[str, Any]], column: str) -> 'HashIndex':
+        """
+        Buduje indeks kolumny z listy słowników.
+        
+        Args:
+            rows (Iterable[Dict[str, Any]]): Wiersze danych
+            column (str): Nazwa indeksowanej kolumny
+        
+        Returns:
+            HashIndex: Nowy indeks
+        """
+        return cls(column, (row.get(column, MISSING) for row in rows))
+    
+    def lookup(self, value: Any) -> List[int]:
+        """
+        Zwraca numery wierszy, w których kolumna ma podaną wartość.
+        
+        Args:
+            value (Any): Szukana wartość
+        
+        Returns:
+            List[int]: Rosnąca lista numerów wierszy (pusta, gdy brak)
+        """
+        try:
+            return self._positions.get(value, [])
+        except TypeError:
+            # Wartość niehaszowalna nie może występować w indeksie
+            return []
+    
+    def count(self, value: Any) -> int:
+        """
+        Zwraca liczbę wierszy z podaną wartością.
+        
+        Args:
+            value (Any): Szukana wartość
+        
+        Returns:
+            int: Liczba wierszy
+        """
+        return len(self.lookup(value))
+    
+    def values(self) -> List[Any]:
+        """
+        Zwraca unikalne wartości występujące w indeksie.
+        
+        Returns:
+            List[Any]: Lista unikalnych wartości
+        """
+        return list(self._positions)
+    
+    def __len__(self) -> int:
+        return len(self._positions)
+
+
+class SortedIndex:
+    """
+    Indeks posortowany kolumny: numery wierszy uporządkowane według wartości.
+    
+    Zapytania zakresowe wykonywane są przez wyszukiwanie binarne (bisect)
+    w O(log n + k), a k najmniejszych lub największych wartości jest
+    odczytywanych wprost z końców indeksu. Wiersze o równych wartościach
+    są uporządkowane rosnąco według numeru wiersza.
+    
+    Attributes:
+        column (str): Nazwa indeksowanej kolumny
+        size (int): Liczba wierszy, dla których zbudowano indeks
+    """
+    
+    def __init__(self, column: str, values: Iterable[Any]):
+        """
+        Buduje indeks z wartości kolumny podanych w kolejności wierszy.
+        
+        Args:
+            column (str): Nazwa indeksowanej kolumny
+            values (Iterable[Any]): Wartości kolumny (MISSING oznacza brak
+                wartości i nie trafia do indeksu)
+        
+        Raises:
+            TypeError: Gdy wartości kolumny nie dają się porównać
+                (np. liczby i napisy)
+        """
+        self.column = column
+        values = list(values)
+        order = sorted((i for i, value in enumerate(values) if value is not MISSING),
+                       key=values.__getitem__)
+        self.size = len(values)
+        self._keys = [values[i] for i in order]
+        self._positions = array('q', order)
+    
+    @classmethod
+    def from_rows(cls, rows: Iterable[Dict[str, Any]], column: str) -> 'SortedIndex':
+        """
+        Buduje indeks kolumny z listy słowników.
+        
+        Args:
+            rows (Iterable[Dict[str, Any]]): Wiersze danych
+            column (str): Nazwa indeksowanej kolumny
+        
+        Returns:
+            SortedIndex: Nowy indeks
+        """
+        return cls(column, (row.get(column, MISSING) for row in rows))
+    
+    def _bounds(self, low: Any = None, high: Any = None, include_low: bool = True,
+                include_high: bool = True) -> Tuple[int, int]:
+        """Zwraca zakres pozycji indeksu dla wartości między low i high."""
+        keys = self._keys
+        start = 0
+        stop = len(keys)
+        if low is not None:
+            start = (bisect_left if include_low else bisect_right)(keys, low)
+        if high is not None:
+            stop = (bisect_right if include_high else bisect_left)(keys, high)
+        return start, max(start, stop)
+    
+    def range(self, low: Any = None, high: Any = None, include_low: bool = True,
+              include_high: bool = True) -> List[int]:
+        """
+        Zwraca numery wierszy z wartościami z zakresu, w kolejności wartości.
+        
+        Args:
+            low (Any): Dolna granica (None - brak granicy)
+            high (Any): Górna granica (None - brak granicy)
+            include_low (bool): Czy granica dolna należy do zakresu
+            include_high (bool): Czy granica górna należy do zakresu
+        
+        Returns:
+            List[int]: Numery wierszy (pusta lista, gdy granic nie da się
+                porównać z wartościami kolumny)
+        """
+        try:
+            start, stop = self._bounds(low, high, include_low, include_high)
+        except TypeError:
+            return []
+        return self._positions[start:stop].tolist()
+    
+    def lookup(self, value: Any) -> List[int]:
+        """
+        Zwraca numery wierszy, w których kolumna ma podaną wartość.
+        
+        Args:
+            value (Any): Szukana wartość
+        
+        Returns:
+            List[int]: Rosnąca lista numerów wierszy (pusta, gdy brak)
+        """
+        if value is None:
+            return []
+        return self.range(value, value)
+    
+    def positions_for(self, op: str, operand: Any) -> Optional[List[int]]:
+        """
+        Zwraca numery wierszy spełniających warunek zakresowy.
+        
+        Args:
+            op (str): Operator ('==', '>', '>=', '<', '<=' lub 'between')
+            operand (Any): Argument operatora
+        
+        Returns:
+            Optional[List[int]]: Rosnąca lista numerów wierszy lub None,
+                gdy indeks nie obsługuje operatora
+        """
+        if op == '==':
+            return self.lookup(operand)
+        if op == 'between':
+            try:
+                low, high = operand
+            except (TypeError, ValueError):
+                return None
+            positions = self.range(low, high)
+        elif op in ('>', '>='):
+            positions = self.range(low=operand, include_low=op == '>=')
+        elif op in ('<', '<='):
+            positions = self.range(high=operand, include_high=op == '<=')
+        else:
+            return None
+        positions.sort()
+        return positions
+    
+    def smallest(self, k: int) -> List[int]:
+        """
+        Zwraca numery wierszy z k najmniejszymi wartościami.
+        
+        Args:
+            k (int): Liczba wierszy
+        
+        Returns:
+            List[int]: Numery wierszy od najmniejszej wartości
+        """
+        return self._positions[:max(k, 0)].tolist()
+    
+    def largest(self, k: int) -> List[int]:
+        """
+        Zwraca numery wierszy z k największymi wartościami.
+        
+        Wiersze o równych wartościach są zwracane w kolejności numerów
+        (jak heapq.nlargest).
+        
+        Args:
+            k (int): Liczba wierszy
+        
+        Returns:
+            List[int]: Numery wierszy od największej wartości
+        """
+        keys = self._keys
+        result: List[int] = []
+        stop = len(keys)
+        while stop > 0 and len(result) < k:
+            start = bisect_left(keys, keys[stop - 1], 0, stop)
+            result.extend(self._positions[start:min(stop, start + k - len(result))])
+            stop = start
+        return result
+    
+    def __len__(self) -> int:
+        return len(self._keys)
@@ -0,0 +1,189 @@
+"""
+Moduł joins - łączenie zbiorów danych
+=====================================
+
+Ten moduł zawiera funkcje i klasy do:
+- Łączenia dwóch zbiorów wierszy według wartości kolumn (hash join)
+- Budowania tablicy haszującej po jednej stronie i strumieniowego
+  przeglądania drugiej
+- Złączeń wewnętrznych (inner) i lewostronnych (left)
+"""
+
+from typing import List, Dict, Any, Iterable, Iterator, Union, Tuple
+
+JOIN_TYPES = ('inner', 'left')
+
+_NO_KEY = object()
+
+
+def _key_function(on: Union[str, List[str]]):
+    """Tworzy funkcję zwracającą klucz złączenia wiersza (lub _NO_KEY)."""
+    if isinstance(on, str):
+        def key(row: Dict[str, Any]) -> Any:
+            return row.get(on, _NO_KEY)
+    else:
+        columns = tuple(on)
+        
+        def key(row: Dict[str, Any]) -> Any:
+            try:
+                return tuple(row[column] for column in columns)
+            except KeyError:
+                return _NO_KEY
+    return key
+
+
+class HashTable:
+    """
+    Tablica haszująca strony budującej złączenia: klucz -> lista wierszy.
+    
+    Attributes:
+        on (Union[str, List[str]]): Kolumna lub kolumny złączenia
+        unkeyed (List[Dict[str, Any]]): Wiersze bez kolumny złączenia
+            lub z wartością niehaszowalną (nigdy nie pasują)
+    """
+    
+    def __init__(self, rows: Iterable[Dict[str, Any]], on: Union[str, List[str]]):
+        """
+        Buduje tablicę w jednym przebiegu po wierszach.
+        
+        Args:
+            rows (Iterable[Dict[str, Any]]): Wiersze strony budującej
+            on (Union[str, List[str]]): Kolumna lub kolumny złączenia
+        """
+        self.on = on
+        self.unkeyed: List[Dict[str, Any]] = []
+        self._key = _key_function(on)
+        buckets: Dict[Any, List[Dict[str, Any]]] = {}
+        for row in rows:
+            key = self._key(row)
+            try:
+                if key is _NO_KEY:
+                    raise TypeError
+                bucket = buckets.get(key)
+                if bucket is None:
+                    buckets[key] = [row]
+                else:
+                    bucket.append(row)
+            except TypeError:
+                self.unkeyed.append(row)
+        self._buckets = buckets
+    
+    def lookup(self, row: Dict[str, Any]) -> Tuple[Any, List[Dict[str, Any]]]:
+        """
+        Zwraca klucz wiersza strony przeglądanej i pasujące wiersze.
+        
+        Args:
+            row (Dict[str, Any]): Wiersz strony przeglądanej
+        
+        Returns:
+            Tuple[Any, List[Dict[str, Any]]]: Klucz i lista pasujących
+                wierszy (pusta, gdy brak)
+        """
+        key = self._key(row)
+        if key is _NO_KEY:
+            return key, []
+        try:
+            return key, self._buckets.get(key, [])
+        except TypeError:
+            return _NO_KEY, []
+    
+    def rows_except(self, keys: set) -> Iterator[Dict[str, Any]]:
+        """Zwraca wiersze o kluczach spoza podanego zbioru."""
+        for key, bucket in self._buckets.items():
+            if key not in keys:
+                yield from bucket
+        yield from self.unkeyed
+    
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+def _merge(left: Dict[str, Any], right: Dict[str, Any], on_columns: frozenset,
+           suffix: str) -> Dict[str, Any]:
+    """Łączy dwa wiersze; kolumny prawej strony powtarzające nazwy lewej dostają sufiks."""
+    merged = dict(left)
+    for column, value in right.items():
+        if column in on_columns:
+            continue
+        merged[column + suffix if column in left else column] = value
+    return merged
+
+
+def probe(table: HashTable, rows: Iterable[Dict[str, Any]], how: str = 'inner',
+          build_left: bool = False, suffix: str = '_right') -> Iterator[Dict[str, Any]]:
+    """
+    Przegląda wiersze drugiej strony złączenia i zwraca połączone wiersze.
+    
+    Args:
+        table (HashTable): Tablica zbudowana z jednej strony złączenia
+        rows (Iterable[Dict[str, Any]]): Wiersze drugiej strony (mogą
+            pochodzić z iteratora - nie są przechowywane)
+        how (str): 'inner' lub 'left'
+        build_left (bool): Czy tablica została zbudowana z lewej strony
+        suffix (str): Sufiks dla kolumn prawej strony o nazwach
+            występujących po lewej stronie
+    
+    Yields:
+        Dict[str, Any]: Połączony wiersz
+    """
+    on_columns = frozenset([table.on] if isinstance(table.on, str) else table.on)
+    if not build_left:
+        for left in rows:
+            matches = table.lookup(left)[1]
+            for right in matches:
+                yield _merge(left, right, on_columns, suffix)
+            if not matches and how == 'left':
+                yield dict(left)
+        return
+    
+    matched = set()
+    for right in rows:
+        key, matches = table.lookup(right)
+        if matches and how == 'left':
+            matched.add(key)
+        for left in matches:
+            yield _merge(left, right, on_columns, suffix)
+    if how == 'left':
+        for left in table.rows_except(matched):
+            yield dict(left)
+
+
+def join_data(left: Iterable[Dict[str, Any]], right: Iterable[Dict[str, Any]],
+              on: Union[str, List[str]], how: str = 'inner',
+              suffix: str = '_right') -> Union[List[Dict[str, Any]], Iterator[Dict[str, Any]]]:
+    """
+    Łączy dwa zbiory wierszy według wartości kolumn (hash join).
+    
+    Tablica haszująca jest budowana z prawej strony, a lewa jest
+    przeglądana wiersz po wierszu, więc koszt to O(n + m) zamiast
+    O(n * m) dla zagnieżdżonych pętli. Kolejność wyniku odpowiada
+    kolejności lewej strony.
+    
+    Args:
+        left (Iterable[Dict[str, Any]]): Lewa strona (lista lub iterator)
+        right (Iterable[Dict[str, Any]]): Prawa strona (przechowywana w pamięci)
+        on (Union[str, List[str]]): Kolumna lub lista kolumn złączenia
+        how (str): 'inner' - tylko pasujące wiersze, 'left' - także
+            niepasujące wiersze lewej strony (bez kolumn prawej strony)
+        suffix (str): Sufiks dla kolumn prawej strony o nazwach
+            występujących po lewej stronie (domyślnie '_right')
+    
+    Returns:
+        Union[List[Dict[str, Any]], Iterator[Dict[str, Any]]]: Połączone
+            wiersze - lista dla listy na wejściu, leniwy iterator dla iteratora
+    
+    Raises:
+        ValueError: Gdy typ złączenia jest nieznany
+    
+    Example:
+        >>> people = [{'id': 1, 'name': 'Jan'}]
+        >>> salaries = [{'id': 1, 'salary': 5000}]
+        >>> join_data(people, salaries, on='id')
+        [{'id': 1, 'name': 'Jan', 'salary': 5000}]
+    """
+    if how not in JOIN_TYPES:
+        raise ValueError(f"Nieznany typ złączenia '{how}'. Dostępne: {', '.join(JOIN_TYPES)}")
+    rows = probe(HashTable(right, on), left, how, suffix=suffix)
+    if isinstance(left, Iterator):
+        return rows
+    return list(rows)
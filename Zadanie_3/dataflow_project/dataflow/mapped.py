@@ -0,0 +1,240 @@
+"""
+Moduł mapped - pliki CSV mapowane do pamięci
+============================================
+
+Ten moduł zawiera klasy do:
+- Mapowania pliku CSV do pamięci (mmap) bez wczytywania go w całości
+- Jednorazowego indeksowania pozycji rekordów w pliku
+- Dekodowania rekordów wprost z mapowania (bez kopiowania bajtów) i konwersji
+  tylko tych kolumn i wierszy, które są odczytywane
+"""
+
+import csv
+import mmap
+from array import array
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Callable
+
+from .data_utils import DEFAULT_SAMPLE_SIZE, _build_converters, _supports_parallel
+from .predicates import Predicate
+from .compression import detect_compression
+
+
+class MappedCSV:
+    """
+    Plik CSV zmapowany do pamięci z indeksem pozycji rekordów.
+    
+    Przy otwarciu plik jest jednokrotnie przeglądany w celu zapamiętania
+    pozycji początków rekordów (array('q')), z uwzględnieniem pól
+    w cudzysłowie zawierających nowe linie. Rekord jest dekodowany dopiero
+    przy odczycie, wprost z widoku memoryview na mapowanie (bez pośredniej
+    kopii bajtów), a konwertowane są tylko potrzebne pola. Plik jest
+    zamykany zaraz po zmapowaniu; mapowanie zwalnia close() (lub blok with).
+    
+    Attributes:
+        filepath (str): Ścieżka do pliku
+        header (List[str]): Nazwy kolumn
+    """
+    
+    def __init__(self, filepath: str, delimiter: str = ',', encoding: str = 'utf-8',
+                 schema: Optional[Dict[str, Callable[[str], Any]]] = None,
+                 infer_schema: bool = True,
+                 sample_size: int = DEFAULT_SAMPLE_SIZE):
+        """
+        Otwiera i indeksuje plik.
+        
+        Args:
+            filepath (str): Ścieżka do pliku CSV
+            delimiter (str): Separator kolumn (domyślnie ',')
+            encoding (str): Kodowanie pliku - musi być zgodne z ASCII,
+                np. 'utf-8' (domyślnie 'utf-8')
+            schema (Optional[Dict[str, Callable[[str], Any]]]): Jawne
+                konwertery kolumn (jak w load_csv_data)
+            infer_schema (bool): Czy wnioskować typy kolumn z próbki
+            sample_size (int): Liczba wierszy próbki do wnioskowania typów
+        
+        Raises:
+            FileNotFoundError: Gdy plik nie istnieje
+            ValueError: Gdy kodowanie nie jest zgodne z ASCII lub plik jest
+                skompresowany
+        """
+        if not _supports_parallel(encoding):
+            raise ValueError(f"Kodowanie '{encoding}' nie jest obsługiwane "
+                             "przez mapowanie pliku (wymagane zgodne z ASCII)")
+        if detect_compression(filepath) is not None:
+            raise ValueError("Pliku skompresowanego nie można mapować do pamięci "
+                             "(użyj stream_csv lub load_from_csv)")
+        
+        self.filepath = filepath
+        self._delimiter = delimiter
+        self._encoding = encoding
+        with open(filepath, 'rb') as file:
+            try:
+                # Mapowanie pozostaje ważne po zamknięciu pliku
+                self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Pusty plik nie może zostać zmapowany
+                self._map = b''
+        self._view = memoryview(self._map)
+        self._closed = False
+        
+        self._starts = array('q')
+        self._ends = array('q')
+        self.header: List[str] = []
+        self._index_records()
+        
+        sample = []
+        if infer_schema:
+            for index in range(min(sample_size, len(self))):
+                sample.append(self._raw_fields(index))
+        self._converters = _build_converters(self.header, sample, schema, infer_schema)
+        self._positions = {column: i for i, column in enumerate(self.header)}
+    
+    def _index_records(self) -> None:
+        """Zapamiętuje pozycje początku i końca każdego niepustego rekordu."""
+        data = self._map
+        size = len(data)
+        has_quotes = data.find(b'"') >= 0
+        position = 0
+        first = True
+        while position < size:
+            end = data.find(b'\n', position)
+            if has_quotes:
+                # Nowa linia wewnątrz pola w cudzysłowie nie kończy rekordu
+                while end >= 0 and data[position:end].count(b'"') % 2 == 1:
+                    end = data.find(b'\n', end + 1)
+            if end < 0:
+                end = size
+            stop = end - 1 if end > position and data[end - 1:end] == b'\r' else end
+            if first:
+                line = data[position:stop].decode(self._encoding)
+                if line.startswith('\ufeff'):
+                    line = line[1:]
+                self.header = next(csv.reader([line], delimiter=self._delimiter), [])
+                first = False
+            elif stop > position:
+                self._starts.append(position)
+                self._ends.append(stop)
+            position = end + 1
+    
+    def __len__(self) -> int:
+        return len(self._starts)
+    
+    def __enter__(self) -> 'MappedCSV':
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Zwalnia mapowanie pliku (kolejne wywołania nic nie robią)."""
+        self._view.release()
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._closed = True
+    
+    @property
+    def closed(self) -> bool:
+        """Czy mapowanie zostało zwolnione."""
+        return self._closed
+    
+    def _raw_fields(self, index: int) -> List[str]:
+        """
+        Dekoduje rekord wprost z widoku mapowania i dzieli go na pola
+        (rekord z cudzysłowami przez parser csv).
+        """
+        line = str(self._view[self._starts[index]:self._ends[index]], self._encoding)
+        if '"' not in line:
+            fields = line.split(self._delimiter)
+        else:
+            fields = next(csv.reader([line], delimiter=self._delimiter))
+        self._check_width(index, fields)
+        return fields
+    
+    def _check_width(self, index: int, fields: List[Any]) -> None:
+        """Sprawdza liczbę pól rekordu."""
+        if len(fields) != len(self.header):
+            raise ValueError(f"Rekord {index + 1} ma {len(fields)} pól, "
+                             f"oczekiwano {len(self.header)}")
+    
+    def _value(self, field: str, position: int) -> Any:
+        """Konwertuje pojedyncze pole."""
+        return self._converters[position](field)
+    
+    def _column_positions(self, columns: Optional[Iterable[str]]) -> List[int]:
+        """Zamienia nazwy kolumn na numery pól (pomija nieznane kolumny)."""
+        if columns is None:
+            return list(range(len(self.header)))
+        return [self._positions[column] for column in columns if column in self._positions]
+    
+    def row(self, index: int, columns: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        Odczytuje pojedynczy wiersz.
+        
+        Args:
+            index (int): Numer wiersza
+            columns (Optional[Iterable[str]]): Kolumny do zdekodowania
+                (domyślnie wszystkie)
+        
+        Returns:
+            Dict[str, Any]: Wiersz
+        """
+        fields = self._raw_fields(index)
+        header = self.header
+        return {header[i]: self._value(fields[i], i) for i in self._column_positions(columns)}
+    
+    def column(self, column: str) -> List[Any]:
+        """
+        Odczytuje wartości jednej kolumny ze wszystkich wierszy.
+        
+        Args:
+            column (str): Nazwa kolumny
+        
+        Returns:
+            List[Any]: Lista wartości
+        
+        Raises:
+            KeyError: Gdy kolumna nie istnieje
+        """
+        if column not in self._positions:
+            raise KeyError(f"Kolumna '{column}' nie istnieje w danych")
+        position = self._positions[column]
+        return [self._value(self._raw_fields(i)[position], position) for i in range(len(self))]
+    
+    def iter_rows(self, columns: Optional[Iterable[str]] = None,
+                  predicate: Optional[Predicate] = None,
+                  positions: Optional[Iterable[int]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iteruje po wierszach, konwertując tylko potrzebne pola.
+        
+        Gdy podano warunek, najpierw konwertowane są tylko kolumny warunku,
+        a pozostałe kolumny - wyłącznie dla wierszy, które go spełniają.
+        
+        Args:
+            columns (Optional[Iterable[str]]): Kolumny wyniku (domyślnie wszystkie)
+            predicate (Optional[Predicate]): Warunek filtrowania
+            positions (Optional[Iterable[int]]): Numery wierszy (domyślnie wszystkie)
+        
+        Yields:
+            Dict[str, Any]: Kolejny wiersz
+        """
+        header = self.header
+        wanted = self._column_positions(columns)
+        rows = range(len(self)) if positions is None else positions
+        
+        if not predicate:
+            for index in rows:
+                fields = self._raw_fields(index)
+                yield {header[i]: self._value(fields[i], i) for i in wanted}
+            return
+        
+        tested = self._column_positions(predicate.columns)
+        if len(tested) < len(predicate.columns):
+            # Warunek na nieistniejącej kolumnie nie może być spełniony
+            return
+        for index in rows:
+            fields = self._raw_fields(index)
+            values = {header[i]: self._value(fields[i], i) for i in tested}
+            if not predicate(values):
+                continue
+            yield {header[i]: values[header[i]] if header[i] in values 
+                   else self._value(fields[i], i) for i in wanted}
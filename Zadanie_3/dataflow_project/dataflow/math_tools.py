@@ -3,22 +3,464 @@ Moduł math_tools - narzędzia matematyczne i statystyczne
 =======================================================
 
 Ten moduł zawiera funkcje i klasy do:
-- Obliczeń statystycznych
+- Obliczeń statystycznych (także przyrostowych, w jednym przebiegu)
+- Kwantyli dokładnych (przez selekcję) i przybliżonych (szkic strumienia)
 - Normalizacji danych
-- Podstawowych operacji matematycznych
+- Korelacji Pearsona (także macierzy korelacji wielu kolumn w jednym przebiegu)
+- Podstawowych operacji matematycznych (w tym testów pierwszości
+  Millera-Rabina i segmentowanego sita Eratostenesa)
+
+Funkcje statystyczne przyjmują listy, typowane bufory array.array (np.
+kolumny liczbowe DataProcessor.get_column_array) oraz - gdy zainstalowano
+NumPy - tablice numpy.ndarray. Typ elementów buforów i tablic jest
+sprawdzany raz, a nie dla każdego elementu. Tablice NumPy oraz długie
+listy liczb są przetwarzane wektorowo; wyniki zgadzają się z obliczeniami
+w czystym Pythonie z dokładnością względną VECTOR_RTOL (różnice wynikają
+z innej kolejności sumowania zmiennoprzecinkowego).
 """
 
 import math
-from typing import List, Union, Dict, Tuple
-from statistics import mean, median, mode, stdev
+import numbers
+import random
+import operator
+from array import array
+from bisect import bisect_right
+from itertools import compress, islice
+from typing import List, Union, Dict, Tuple, Iterable, Iterator, Optional, Any
+from statistics import mean, mode, stdev
+
+from .sketches import QuantileSketch
+
+try:
+    import numpy as np
+except ImportError:  # NumPy jest opcjonalny - używana jest wtedy ścieżka w czystym Pythonie
+    np = None
+
+# Dokładność względna, z jaką wyniki ścieżki wektorowej odpowiadają
+# obliczeniom w czystym Pythonie
+VECTOR_RTOL = 1e-9
+# Listy co najmniej tej długości są przetwarzane wektorowo (gdy jest NumPy);
+# dla krótszych koszt konwersji przewyższa zysk
+VECTORIZE_MIN_SIZE = 1000
+
+_NUMERIC_TYPECODES = frozenset('bBhHiIlLqQfd')
+# Fragmenty nie dłuższe niż ta wartość są przy selekcji po prostu sortowane
+_SELECT_CUTOFF = 64
+# Liczba wierszy w porcji macierzy korelacji czytanej ze strumienia
+_CORRELATION_BLOCK = 4096
+
+# Podstawy testu Millera-Rabina (13 pierwszych liczb pierwszych) - test jest
+# z nimi deterministyczny dla n < 3.3 * 10**24, czyli dla wszystkich liczb
+# 64-bitowych; dla większych n dodawane są losowe podstawy
+_MR_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+_MR_DETERMINISTIC_LIMIT = 3317044064679887385961981
+# Dodatkowe losowe podstawy - prawdopodobieństwo błędu poniżej 4**-20
+_MR_RANDOM_ROUNDS = 20
+# Rozmiar segmentu sita w bajtach - segment mieści się w pamięci podręcznej L2
+_SIEVE_SEGMENT = 1 << 18
+# Sito jest używane dla liczb poniżej _SIEVE_BASE_LIMIT**2 (2**40); większe
+# wymagałyby zbyt wielu liczb pierwszych bazowych
+_SIEVE_BASE_LIMIT = 1 << 20
+# Segment jest przesiewany, gdy ma co najmniej tyle liczb do sprawdzenia
+# (plus jedną na każde 8 liczb pierwszych bazowych - test Millera-Rabina
+# kosztuje mniej więcej tyle, co wykreślenie wielokrotności 8 z nich)
+_SIEVE_MIN_HITS = 64
+
+_prime_rng = random.Random()
+
+Numbers = Union[List[Union[int, float]], array, Any]
+
+
+def _is_typed(data: Any) -> bool:
+    """Czy dane są typowanym buforem liczbowym (typ sprawdzany raz)."""
+    return isinstance(data, array) and data.typecode in _NUMERIC_TYPECODES
+
+
+def _check_numbers(data: Any) -> None:
+    """
+    Sprawdza, czy wszystkie elementy są liczbami.
+    
+    Dla array.array wystarcza sprawdzenie kodu typu bufora.
+    
+    Raises:
+        ValueError: Gdy któryś element nie jest liczbą
+    """
+    if isinstance(data, array):
+        if data.typecode not in _NUMERIC_TYPECODES:
+            raise ValueError("Wszystkie elementy muszą być liczbami")
+        return
+    if not all(isinstance(x, (int, float)) for x in data):
+        raise ValueError("Wszystkie elementy muszą być liczbami")
+
+
+def _as_number(value: Any) -> Optional[Union[int, float]]:
+    """
+    Zwraca liczbę jako int lub float Pythona, albo None, gdy wartość nie
+    jest liczbą rzeczywistą.
+    
+    Skalary NumPy (np. numpy.int64, numpy.float32) są zamieniane na typy
+    Pythona, dzięki czemu sumy liczb całkowitych pozostają dokładne i nie
+    przepełniają się jak arytmetyka 64-bitowa.
+    """
+    kind = type(value)
+    if kind is int or kind is float:
+        return value
+    if isinstance(value, numbers.Integral):
+        return operator.index(value)
+    if isinstance(value, numbers.Real):
+        return float(value)
+    return None
+
+
+def _plain_values(values: Any) -> Tuple[Iterable[Any], bool]:
+    """
+    Zwraca wartości do iteracji w czystym Pythonie oraz informację, czy
+    ich typ został już sprawdzony (bufory array.array, tablice NumPy).
+    
+    Raises:
+        ValueError: Gdy tablica NumPy nie jest liczbowa
+    """
+    if np is not None and isinstance(values, np.ndarray):
+        if values.dtype.kind not in 'biuf':
+            raise ValueError("Wszystkie elementy muszą być liczbami")
+        # tolist() zwraca int i float Pythona zamiast skalarów NumPy
+        return values.ravel().tolist(), True
+    return values, _is_typed(values)
+
+
+def _as_vector(data: Any) -> Optional['np.ndarray']:
+    """
+    Zwraca dane jako jednowymiarową tablicę NumPy, gdy należy użyć ścieżki
+    wektorowej, albo None (brak NumPy, krótka lista lub lista z wartościami,
+    których NumPy nie reprezentuje dokładnie, np. bardzo duże int).
+    
+    Raises:
+        ValueError: Gdy tablica NumPy nie jest liczbowa lub nie jest
+            jednowymiarowa
+    """
+    if np is None:
+        return None
+    if isinstance(data, np.ndarray):
+        if data.dtype.kind not in 'biuf':
+            raise ValueError("Wszystkie elementy muszą być liczbami")
+        if data.ndim != 1:
+            raise ValueError("Dane muszą być jednowymiarowe")
+        return data
+    if _is_typed(data):
+        # Widok bufora bez kopiowania
+        return np.frombuffer(data, dtype=data.typecode)
+    if isinstance(data, list) and len(data) >= VECTORIZE_MIN_SIZE:
+        vector = np.asarray(data)
+        # Napisy, None lub liczby spoza int64 dają dtype obiektowy/tekstowy -
+        # takie listy sprawdza i liczy ścieżka w czystym Pythonie
+        if vector.ndim == 1 and vector.dtype.kind in 'biuf':
+            return vector
+    return None
 
 
-def calculate_statistics(data: List[Union[int, float]]) -> Dict[str, float]:
+def _vector_sum(vector: 'np.ndarray') -> Union[int, float]:
+    """Suma tablicy; dla liczb całkowitych dokładna jak sum() w Pythonie."""
+    if vector.dtype.kind == 'f':
+        return float(vector.sum())
+    low, high = int(vector.min()), int(vector.max())
+    if max(abs(low), abs(high)) * len(vector) < 2 ** 63:
+        return int(vector.sum(dtype=np.int64))
+    return sum(vector.tolist())
+
+
+def _select(data: Any, positions: Iterable[int]) -> Dict[int, Any]:
+    """
+    Zwraca wartości, które stałyby na podanych pozycjach po posortowaniu
+    danych, bez sortowania całości (quickselect dla wielu pozycji naraz).
+    
+    Średni koszt jest liniowy; dzielone są tylko fragmenty zawierające
+    szukane pozycje.
+    """
+    found: Dict[int, Any] = {}
+    pending = [(data, 0, sorted(set(positions)))]
+    while pending:
+        items, offset, targets = pending.pop()
+        if len(items) <= _SELECT_CUTOFF:
+            ordered = sorted(items)
+            for position in targets:
+                found[position] = ordered[position - offset]
+            continue
+        # Mediana z trzech - odporna na dane już posortowane
+        pivot = sorted((items[0], items[len(items) // 2], items[-1]))[1]
+        lower = [x for x in items if x < pivot]
+        upper = [x for x in items if x > pivot]
+        start = offset + len(lower)
+        end = offset + len(items) - len(upper)
+        below = [position for position in targets if position < start]
+        above = [position for position in targets if position >= end]
+        for position in targets:
+            if start <= position < end:
+                found[position] = pivot
+        if below:
+            pending.append((lower, offset, below))
+        if above:
+            pending.append((upper, end, above))
+    return found
+
+
+def _median(data: Any) -> Union[int, float]:
+    """Mediana przez selekcję, zgodna ze statistics.median."""
+    n = len(data)
+    middle = n // 2
+    if n % 2:
+        return _select(data, (middle,))[middle]
+    values = _select(data, (middle - 1, middle))
+    return (values[middle - 1] + values[middle]) / 2
+
+
+def _check_orders(qs: Iterable[float]) -> List[float]:
+    """Sprawdza rzędy kwantyli."""
+    qs = list(qs)
+    if any(not 0 <= q <= 1 for q in qs):
+        raise ValueError("Rzędy kwantyli muszą należeć do przedziału [0, 1]")
+    return qs
+
+
+def _vector_median(vector: 'np.ndarray') -> Union[int, float]:
+    """Mediana przez selekcję (np.partition), zgodna ze statistics.median."""
+    n = len(vector)
+    middle = n // 2
+    if n % 2:
+        return np.partition(vector, middle)[middle].item()
+    part = np.partition(vector, [middle - 1, middle])
+    return (part[middle - 1].item() + part[middle].item()) / 2
+
+
+def _vector_mode(vector: 'np.ndarray') -> Union[int, float]:
+    """Najczęstsza wartość; przy remisie pierwsza w danych (jak statistics.mode)."""
+    values, first, counts = np.unique(vector, return_index=True, return_counts=True)
+    candidates = np.flatnonzero(counts == counts.max())
+    return values[candidates[np.argmin(first[candidates])]].item()
+
+
+def _vector_statistics(vector: 'np.ndarray') -> Dict[str, float]:
+    """Wektorowe obliczenie słownika calculate_statistics."""
+    if vector.dtype.kind == 'b':
+        vector = vector.astype(np.int64)
+    n = len(vector)
+    variance = float(vector.var(ddof=1)) if n > 1 else 0.0
+    return {
+        'mean': float(vector.mean()),
+        'median': _vector_median(vector),
+        'min': vector.min().item(),
+        'max': vector.max().item(),
+        'count': n,
+        'sum': _vector_sum(vector),
+        'std': math.sqrt(variance),
+        'variance': variance,
+        'mode': _vector_mode(vector)
+    }
+
+
+class RunningStatistics:
+    """
+    Przyrostowy akumulator statystyk (liczba, suma, średnia, wariancja,
+    minimum, maksimum) obliczanych w jednym przebiegu.
+    
+    Średnia i wariancja są aktualizowane metodą Welforda, która - w
+    przeciwieństwie do wzoru z sumą kwadratów - nie traci dokładności dla
+    dużych wartości o małym rozrzucie. Dane można dodawać porcjami
+    (np. kolejnymi fragmentami strumienia), a akumulatory z różnych
+    fragmentów lub procesów łączyć metodą merge (wzór Chana). Obiekt
+    można serializować przez pickle.
+    
+    Attributes:
+        count (int): Liczba wartości
+        total (Union[int, float]): Suma wartości
+        minimum (Optional[Union[int, float]]): Najmniejsza wartość
+        maximum (Optional[Union[int, float]]): Największa wartość
+    
+    Example:
+        >>> stats = RunningStatistics()
+        >>> for chunk in ([1, 2, 3], [4, 5]):
+        ...     stats.update(chunk)
+        >>> stats.mean, stats.std
+        (3.0, 1.5811388300841898)
+    """
+    
+    __slots__ = ('count', 'total', 'minimum', 'maximum', '_mean', '_m2')
+    
+    def __init__(self, values: Optional[Iterable[Union[int, float]]] = None):
+        """
+        Tworzy akumulator, opcjonalnie od razu dodając wartości.
+        
+        Args:
+            values (Optional[Iterable[Union[int, float]]]): Wartości początkowe
+        
+        Raises:
+            ValueError: Gdy któraś wartość nie jest liczbą
+        """
+        self.count = 0
+        self.total: Union[int, float] = 0
+        self.minimum: Optional[Union[int, float]] = None
+        self.maximum: Optional[Union[int, float]] = None
+        self._mean = 0.0
+        self._m2 = 0.0
+        if values is not None:
+            self.update(values)
+    
+    def add(self, value: Union[int, float]) -> None:
+        """
+        Dodaje pojedynczą wartość.
+        
+        Args:
+            value (Union[int, float]): Liczba
+        
+        Raises:
+            ValueError: Gdy wartość nie jest liczbą
+        """
+        self.update((value,))
+    
+    def update(self, values: Iterable[Union[int, float]]) -> 'RunningStatistics':
+        """
+        Dodaje wiele wartości (lista, iterator lub porcja strumienia).
+        
+        Args:
+            values (Iterable[Union[int, float]]): Liczby
+        
+        Returns:
+            RunningStatistics: Zwraca siebie dla chaining
+        
+        Raises:
+            ValueError: Gdy któraś wartość nie jest liczbą (wartości
+                dodane przed nią pozostają w akumulatorze)
+        """
+        count, total, low, high = self.count, self.total, self.minimum, self.maximum
+        running_mean, m2 = self._mean, self._m2
+        # Typ elementów bufora array.array i tablicy NumPy jest sprawdzany raz
+        values, checked = _plain_values(values)
+        try:
+            for value in values:
+                if not checked:
+                    value = _as_number(value)
+                    if value is None:
+                        raise ValueError("Wszystkie elementy muszą być liczbami")
+                count += 1
+                total += value
+                delta = value - running_mean
+                running_mean += delta / count
+                m2 += delta * (value - running_mean)
+                if low is None or value < low:
+                    low = value
+                if high is None or value > high:
+                    high = value
+        finally:
+            self.count, self.total, self.minimum, self.maximum = count, total, low, high
+            self._mean, self._m2 = running_mean, m2
+        return self
+    
+    def merge(self, other: 'RunningStatistics') -> 'RunningStatistics':
+        """
+        Dołącza statystyki innego akumulatora (np. z innego fragmentu danych).
+        
+        Args:
+            other (RunningStatistics): Akumulator do dołączenia
+        
+        Returns:
+            RunningStatistics: Zwraca siebie dla chaining
+        """
+        if not other.count:
+            return self
+        if not self.count:
+            for name in self.__slots__:
+                setattr(self, name, getattr(other, name))
+            return self
+        
+        count = self.count + other.count
+        delta = other._mean - self._mean
+        self._mean += delta * other.count / count
+        self._m2 += other._m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.total += other.total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        return self
+    
+    def __add__(self, other: 'RunningStatistics') -> 'RunningStatistics':
+        """Zwraca nowy akumulator będący połączeniem dwóch akumulatorów."""
+        return self.copy().merge(other)
+    
+    def copy(self) -> 'RunningStatistics':
+        """Zwraca kopię akumulatora."""
+        result = RunningStatistics()
+        return result.merge(self)
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    @property
+    def mean(self) -> float:
+        """
+        Średnia arytmetyczna.
+        
+        Raises:
+            ValueError: Gdy akumulator jest pusty
+        """
+        if not self.count:
+            raise ValueError("Brak danych do obliczenia średniej")
+        if isinstance(self.total, int):
+            # Suma liczb całkowitych jest dokładna
+            return self.total / self.count
+        return self._mean
+    
+    @property
+    def variance(self) -> float:
+        """Wariancja z próby (0.0 dla mniej niż dwóch wartości)."""
+        if self.count < 2:
+            return 0.0
+        return self._m2 / (self.count - 1)
+    
+    @property
+    def std(self) -> float:
+        """Odchylenie standardowe z próby (0.0 dla mniej niż dwóch wartości)."""
+        return math.sqrt(self.variance)
+    
+    def to_dict(self) -> Dict[str, float]:
+        """
+        Zwraca statystyki jako słownik.
+        
+        Returns:
+            Dict[str, float]: Klucze 'mean', 'min', 'max', 'count', 'sum',
+                'std' i 'variance'
+        
+        Raises:
+            ValueError: Gdy akumulator jest pusty
+        """
+        return {
+            'mean': self.mean,
+            'min': self.minimum,
+            'max': self.maximum,
+            'count': self.count,
+            'sum': self.total,
+            'std': self.std,
+            'variance': self.variance
+        }
+    
+    def __repr__(self) -> str:
+        if not self.count:
+            return "RunningStatistics(count=0)"
+        return (f"RunningStatistics(count={self.count}, mean={self.mean}, "
+                f"std={self.std}, min={self.minimum}, max={self.maximum})")
+
+
+def calculate_statistics(data: Numbers) -> Dict[str, float]:
     """
     Oblicza podstawowe statystyki dla listy liczb.
     
+    Liczba, suma, średnia, wariancja, minimum i maksimum są liczone
+    w jednym przebiegu przez RunningStatistics; mediana jest wyznaczana
+    przez selekcję (bez sortowania), a moda wymaga całej listy.
+    
+    Tablice NumPy i długie listy są przetwarzane wektorowo (patrz
+    VECTOR_RTOL).
+    
     Args:
-        data (List[Union[int, float]]): Lista liczb
+        data (Numbers): Lista liczb, array.array lub numpy.ndarray
     
     Returns:
         Dict[str, float]: Słownik ze statystykami
@@ -30,29 +472,26 @@ def calculate_statistics(data: List[Union[int, float]]) -> Dict[str, float]:
         >>> calculate_statistics([1, 2, 3, 4, 5])
         {'mean': 3.0, 'median': 3, 'min': 1, 'max': 5, 'std': 1.58...}
     """
-    if not data:
+    if len(data) == 0:
         raise ValueError("Lista danych nie może być pusta")
     
-    if not all(isinstance(x, (int, float)) for x in data):
-        raise ValueError("Wszystkie elementy muszą być liczbami")
+    vector = _as_vector(data)
+    if vector is not None:
+        return _vector_statistics(vector)
     
+    running = RunningStatistics(data).to_dict()
     stats = {
-        'mean': mean(data),
-        'median': median(data),
-        'min': min(data),
-        'max': max(data),
-        'count': len(data),
-        'sum': sum(data)
+        'mean': running['mean'],
+        'median': _median(data),
+        'min': running['min'],
+        'max': running['max'],
+        'count': running['count'],
+        'sum': running['sum'],
+        # Odchylenie standardowe i wariancja są równe 0 dla jednego elementu
+        'std': running['std'],
+        'variance': running['variance']
     }
     
-    # Odchylenie standardowe tylko dla więcej niż jednego elementu
-    if len(data) > 1:
-        stats['std'] = stdev(data)
-        stats['variance'] = stdev(data) ** 2
-    else:
-        stats['std'] = 0.0
-        stats['variance'] = 0.0
-    
     # Moda - obsługa wyjątku gdy brak unikalnej mody
     try:
         stats['mode'] = mode(data)
@@ -62,60 +501,346 @@ def calculate_statistics(data: List[Union[int, float]]) -> Dict[str, float]:
     return stats
 
 
-def normalize_data(data: List[Union[int, float]], 
-                  method: str = 'min-max') -> List[float]:
+def calculate_quantiles(data: Numbers, qs: Iterable[float]) -> List[float]:
+    """
+    Oblicza dokładne kwantyle danych mieszczących się w pamięci.
+    
+    Wartości na potrzebnych pozycjach są wyznaczane przez selekcję
+    (np.partition dla tablic NumPy), bez sortowania całych danych.
+    Między sąsiednimi wartościami stosowana jest interpolacja liniowa
+    (jak domyślnie w numpy.quantile); kwantyl 0.5 jest równy medianie.
+    
+    Args:
+        data (Numbers): Lista liczb, array.array lub numpy.ndarray
+        qs (Iterable[float]): Rzędy kwantyli z przedziału [0, 1]
+    
+    Returns:
+        List[float]: Kwantyle w kolejności qs
+    
+    Raises:
+        ValueError: Gdy dane są puste lub nieprawidłowe albo rząd jest
+            spoza przedziału [0, 1]
+    
+    Example:
+        >>> calculate_quantiles([5, 1, 4, 2, 3], [0.25, 0.5, 1])
+        [2, 3, 5]
+    """
+    qs = _check_orders(qs)
+    if len(data) == 0:
+        raise ValueError("Lista danych nie może być pusta")
+    if not qs:
+        return []
+    
+    vector = _as_vector(data)
+    if vector is None:
+        _check_numbers(data)
+    elif vector.dtype.kind == 'b':
+        vector = vector.astype(np.int64)
+    
+    last = len(data) - 1
+    bounds = []
+    for q in qs:
+        low = int(math.floor(q * last))
+        bounds.append((low, min(low + 1, last), q * last - low))
+    positions = {position for low, high, _ in bounds for position in (low, high)}
+    if vector is not None:
+        ordered = sorted(positions)
+        part = np.partition(vector, ordered)
+        values = {position: part[position].item() for position in ordered}
+    else:
+        values = _select(data, positions)
+    
+    result = []
+    for low, high, fraction in bounds:
+        if fraction == 0:
+            result.append(values[low])
+        else:
+            result.append(values[low] + (values[high] - values[low]) * fraction)
+    return result
+
+
+def approximate_quantiles(stream: Iterable[Union[int, float]], qs: Iterable[float],
+                          k: int = 200, seed: Optional[int] = None) -> List[float]:
+    """
+    Oblicza przybliżone kwantyle strumienia w ograniczonej pamięci.
+    
+    Dane są przeglądane raz i trafiają do szkicu QuantileSketch, który
+    przechowuje około 3 * k wartości. Zwracane są wartości z danych, których
+    ranga różni się od dokładnej o ułamek rzędu 1/k (dla k=200 zwykle
+    poniżej 1% liczby wartości). Do przetwarzania fragmentami lub
+    w osobnych procesach służą szkice łączone metodą merge.
+    
+    Args:
+        stream (Iterable[Union[int, float]]): Liczby (lista, iterator,
+            kolumna czytana strumieniowo)
+        qs (Iterable[float]): Rzędy kwantyli z przedziału [0, 1]
+        k (int): Parametr dokładności szkicu (domyślnie 200)
+        seed (Optional[int]): Ziarno szkicu (powtarzalny wynik)
+    
+    Returns:
+        List[float]: Kwantyle w kolejności qs
+    
+    Raises:
+        ValueError: Gdy strumień jest pusty, zawiera wartości niebędące
+            liczbami lub rząd jest spoza przedziału [0, 1]
+    
+    Example:
+        >>> approximate_quantiles(range(1, 100001), [0.5, 0.99])
+        [49931, 98978]  # wartości bliskie 50000 i 99000
+    """
+    qs = _check_orders(qs)
+    stream, checked = _plain_values(stream)
+    
+    def checked_values():
+        for value in stream:
+            if not checked:
+                value = _as_number(value)
+                if value is None:
+                    raise ValueError("Wszystkie elementy muszą być liczbami")
+            yield value
+    
+    sketch = QuantileSketch(k=k, seed=seed).update(checked_values())
+    if not sketch.count:
+        raise ValueError("Lista danych nie może być pusta")
+    return sketch.quantiles(qs)
+
+
+def _output_buffer(out: Any, size: int) -> Any:
+    """
+    Sprawdza bufor wyniku normalizacji i zwraca go (array.array przy
+    zainstalowanym NumPy - jako widok tablicy bez kopiowania).
+    
+    Raises:
+        ValueError: Gdy bufor ma złą długość lub nie przechowuje liczb
+            zmiennoprzecinkowych
+    """
+    if isinstance(out, array):
+        if out.typecode not in 'fd':
+            raise ValueError("Bufor wyniku musi przechowywać liczby zmiennoprzecinkowe")
+        buffer = np.frombuffer(out, dtype=out.typecode) if np is not None else out
+    elif np is not None and isinstance(out, np.ndarray):
+        if out.dtype.kind != 'f' or out.ndim != 1:
+            raise ValueError("Bufor wyniku musi przechowywać liczby zmiennoprzecinkowe")
+        buffer = out
+    elif isinstance(out, list):
+        buffer = out
+    else:
+        raise ValueError("Bufor wyniku musi być listą, array.array lub numpy.ndarray")
+    if len(out) != size:
+        raise ValueError("Bufor wyniku musi mieć długość danych")
+    return buffer
+
+
+def _normalization_parameters(stats: 'RunningStatistics', method: str) -> Tuple[float, float]:
+    """Przesunięcie i skala normalizacji ze statystyk całych danych."""
+    if method == 'min-max':
+        return stats.minimum, stats.maximum - stats.minimum
+    if stats.count < 2:
+        return 0.0, 0.0
+    return stats.mean, stats.std
+
+
+def _apply_normalization(data: Numbers, offset: float, scale: float,
+                         buffer: Any = None) -> Union[List[float], 'np.ndarray']:
+    """
+    Zwraca (x - offset) / scale dla każdej wartości (zera, gdy scale == 0).
+    
+    Wynik trafia do bufora z _output_buffer albo do nowej tablicy float64
+    (wejście numpy.ndarray) lub nowej listy. Przesunięcie i skala są
+    wyznaczone wcześniej, więc bufor może być samymi danymi.
+    """
+    if np is not None and isinstance(data, np.ndarray):
+        if data.dtype.kind == 'b':
+            data = data.astype(np.int64)
+        target = buffer if isinstance(buffer, np.ndarray) else np.empty(len(data))
+        if scale == 0:
+            target.fill(0.0)
+        else:
+            np.subtract(data, offset, out=target)
+            target /= scale
+        if isinstance(buffer, list):
+            buffer[:] = target.tolist()
+        return target
+    
+    if scale == 0:
+        values = [0.0] * len(data)
+    else:
+        values = [(x - offset) / scale for x in data]
+    if buffer is None:
+        return values
+    buffer[:] = array(buffer.typecode, values) if isinstance(buffer, array) else values
+    return buffer
+
+
+def normalize_data(data: Numbers, 
+                  method: str = 'min-max',
+                  out: Any = None) -> Union[List[float], array, 'np.ndarray']:
     """
     Normalizuje dane używając wybranej metody.
     
+    Z parametrem out wynik jest zapisywany do podanego bufora zamiast do
+    nowej listy. Przekazanie jako out samych danych (array('d') lub
+    zmiennoprzecinkowej tablicy NumPy) normalizuje je w miejscu.
+    
     Args:
-        data (List[Union[int, float]]): Dane do normalizacji
+        data (Numbers): Dane do normalizacji (lista, array.array lub
+            numpy.ndarray)
         method (str): Metoda normalizacji ('min-max' lub 'z-score')
+        out (Any): Opcjonalny bufor wyniku o długości danych - lista,
+            array('d'), array('f') lub zmiennoprzecinkowa numpy.ndarray
     
     Returns:
-        List[float]: Znormalizowane dane
+        Union[List[float], array, np.ndarray]: Bufor out, gdy go podano;
+            w przeciwnym razie tablica float64 dla wejścia numpy.ndarray,
+            a dla pozostałych wejść lista
     
     Raises:
-        ValueError: Gdy metoda jest nieznana lub dane nieprawidłowe
+        ValueError: Gdy metoda jest nieznana, dane nieprawidłowe lub bufor
+            wyniku nieodpowiedni
+    
+    Example:
+        >>> values = array('d', [1.0, 2.0, 3.0])
+        >>> normalize_data(values, out=values)
+        array('d', [0.0, 0.5, 1.0])
     """
-    if not data:
+    if len(data) == 0:
         raise ValueError("Lista danych nie może być pusta")
     
-    if not all(isinstance(x, (int, float)) for x in data):
-        raise ValueError("Wszystkie elementy muszą być liczbami")
+    if method not in ('min-max', 'z-score'):
+        raise ValueError("Nieznana metoda normalizacji. Użyj 'min-max' lub 'z-score'")
+    
+    buffer = _output_buffer(out, len(data)) if out is not None else None
+    
+    vector = _as_vector(data)
+    if vector is not None:
+        result = _apply_normalization(vector, *_vector_parameters(vector, method), buffer)
+        if out is not None:
+            return out
+        return result if isinstance(data, np.ndarray) else result.tolist()
+    
+    _check_numbers(data)
     
     if method == 'min-max':
         min_val = min(data)
         max_val = max(data)
-        
-        if min_val == max_val:
-            return [0.0] * len(data)
-        
-        return [(x - min_val) / (max_val - min_val) for x in data]
+        offset, scale = min_val, max_val - min_val
+    elif len(data) < 2:
+        offset, scale = 0.0, 0.0
+    else:
+        offset, scale = mean(data), stdev(data)
     
-    elif method == 'z-score':
-        if len(data) < 2:
-            return [0.0] * len(data)
-        
-        data_mean = mean(data)
-        data_std = stdev(data)
-        
-        if data_std == 0:
-            return [0.0] * len(data)
-        
-        return [(x - data_mean) / data_std for x in data]
+    result = _apply_normalization(data, offset, scale, buffer)
+    return out if out is not None else result
+
+
+def _vector_parameters(vector: 'np.ndarray', method: str) -> Tuple[float, float]:
+    """Wektorowe wyznaczenie przesunięcia i skali normalizacji."""
+    if vector.dtype.kind == 'b':
+        vector = vector.astype(np.int64)
+    if method == 'min-max':
+        low, high = vector.min().item(), vector.max().item()
+        return low, high - low
+    if len(vector) < 2:
+        return 0.0, 0.0
+    return float(vector.mean()), float(vector.std(ddof=1))
+
+
+def _chunk_statistics(chunk: Numbers) -> 'RunningStatistics':
+    """Statystyki porcji danych (tablice NumPy i długie listy - wektorowo)."""
+    vector = _as_vector(chunk)
+    if vector is None or len(vector) == 0:
+        return RunningStatistics(chunk)
+    if vector.dtype.kind == 'b':
+        vector = vector.astype(np.int64)
+    stats = RunningStatistics()
+    stats.count = len(vector)
+    stats.total = _vector_sum(vector)
+    stats.minimum, stats.maximum = vector.min().item(), vector.max().item()
+    stats._mean = float(vector.mean())
+    stats._m2 = float(((vector - stats._mean) ** 2).sum())
+    return stats
+
+
+def normalize_stream(source: Any, method: str = 'min-max', column: Optional[str] = None,
+                     chunk_size: int = 65536) -> Iterator[Union[List[float], 'np.ndarray']]:
+    """
+    Normalizuje dane większe niż pamięć w dwóch przebiegach po porcjach.
     
-    else:
+    Pierwszy przebieg (wykonywany przy wywołaniu) zbiera minimum i maksimum
+    albo średnią i odchylenie standardowe przez RunningStatistics. Drugi
+    przebieg jest leniwy - zwracany iterator normalizuje kolejne porcje,
+    które można od razu zapisać (np. do pliku), więc w pamięci jest
+    najwyżej jedna porcja. Wyniki są takie jak z normalize_data dla
+    połączonych danych (z dokładnością do zaokrągleń).
+    
+    Args:
+        source (Any): Funkcja bez argumentów zwracająca nowy iterator porcji
+            (list, array.array lub numpy.ndarray), kolekcja porcji, którą
+            można przejść dwa razy, albo DataProcessor (wymaga column;
+            porcje czyta DataProcessor.iter_column, więc np. stream_csv
+            czyta plik dwukrotnie, a dane kolumnowe - wprost z bufora)
+        method (str): Metoda normalizacji ('min-max' lub 'z-score')
+        column (Optional[str]): Kolumna procesora do normalizacji
+        chunk_size (int): Rozmiar porcji czytanych z procesora
+    
+    Returns:
+        Iterator[Union[List[float], np.ndarray]]: Znormalizowane porcje
+            (tablica float64 dla porcji numpy.ndarray, w pozostałych
+            przypadkach lista)
+    
+    Raises:
+        ValueError: Gdy metoda jest nieznana, dane są puste lub
+            nieprawidłowe albo source jest jednorazowym iteratorem
+        KeyError: Gdy kolumna nie istnieje
+    
+    Example:
+        >>> processor = DataProcessor().stream_csv('pomiary.csv')
+        >>> with open('znormalizowane.txt', 'w') as file:
+        ...     for chunk in normalize_stream(processor, 'z-score', column='value'):
+        ...         file.writelines(f"{value}\\n" for value in chunk)
+    """
+    if method not in ('min-max', 'z-score'):
         raise ValueError("Nieznana metoda normalizacji. Użyj 'min-max' lub 'z-score'")
+    if chunk_size < 1:
+        raise ValueError("Rozmiar porcji musi być dodatni")
+    
+    if column is not None:
+        chunks = lambda: source.iter_column(column, chunk_size)
+    elif callable(source):
+        chunks = source
+    elif iter(source) is source:
+        raise ValueError("Normalizacja wymaga dwóch przebiegów - podaj funkcję "
+                         "zwracającą nowy iterator porcji")
+    else:
+        chunks = lambda: iter(source)
+    
+    stats = RunningStatistics()
+    for chunk in chunks():
+        stats.merge(_chunk_statistics(chunk))
+    if not stats.count:
+        raise ValueError("Lista danych nie może być pusta")
+    offset, scale = _normalization_parameters(stats, method)
+    
+    def normalized() -> Iterator[Union[List[float], 'np.ndarray']]:
+        for chunk in chunks():
+            vector = _as_vector(chunk)
+            if vector is None:
+                yield _apply_normalization(chunk, offset, scale)
+            else:
+                result = _apply_normalization(vector, offset, scale)
+                yield result if isinstance(chunk, np.ndarray) else result.tolist()
+    
+    return normalized()
 
 
-def calculate_correlation(x: List[Union[int, float]], 
-                         y: List[Union[int, float]]) -> float:
+def calculate_correlation(x: Numbers, 
+                         y: Numbers) -> float:
     """
     Oblicza współczynnik korelacji Pearsona między dwoma zmiennymi.
     
     Args:
-        x (List[Union[int, float]]): Pierwsza zmienna
-        y (List[Union[int, float]]): Druga zmienna
+        x (Numbers): Pierwsza zmienna (lista, array.array lub numpy.ndarray)
+        y (Numbers): Druga zmienna
     
     Returns:
         float: Współczynnik korelacji (-1 do 1)
@@ -129,6 +854,17 @@ def calculate_correlation(x: List[Union[int, float]],
     if len(x) < 2:
         raise ValueError("Potrzeba co najmniej 2 punktów danych")
     
+    x_vector = _as_vector(x)
+    y_vector = _as_vector(y) if x_vector is not None else None
+    if y_vector is not None:
+        # Wartości centrowane - bez odejmowania dużych sum kwadratów
+        dx = x_vector - x_vector.mean()
+        dy = y_vector - y_vector.mean()
+        denominator = math.sqrt(float(dx @ dx) * float(dy @ dy))
+        if denominator == 0:
+            return 0.0
+        return float(dx @ dy) / denominator
+    
     n = len(x)
     sum_x = sum(x)
     sum_y = sum(y)
@@ -145,6 +881,243 @@ def calculate_correlation(x: List[Union[int, float]],
     return numerator / denominator
 
 
+def _comoments(block: List[Tuple[float, ...]]) -> Tuple[int, Any, Any]:
+    """
+    Zwraca liczbę wierszy, średnie kolumn i macierz współmomentów (sum
+    iloczynów odchyleń od średnich) dla porcji wierszy.
+    """
+    n = len(block)
+    if np is not None:
+        matrix = np.array(block, dtype=np.float64)
+        means = matrix.mean(axis=0)
+        matrix -= means
+        return n, means, matrix.T @ matrix
+    
+    columns = [[float(value) for value in column] for column in zip(*block)]
+    means = [math.fsum(column) / n for column in columns]
+    centered = [[value - column_mean for value in column]
+                for column, column_mean in zip(columns, means)]
+    size = len(centered)
+    comoments = [[0.0] * size for _ in range(size)]
+    for i in range(size):
+        for j in range(i, size):
+            comoments[i][j] = comoments[j][i] = sum(map(operator.mul, centered[i], centered[j]))
+    return n, means, comoments
+
+
+def _merge_comoments(first: Tuple[int, Any, Any],
+                     second: Tuple[int, Any, Any]) -> Tuple[int, Any, Any]:
+    """Łączy współmomenty dwóch porcji danych (wielowymiarowy wzór Chana)."""
+    n_a, means_a, comoments_a = first
+    n_b, means_b, comoments_b = second
+    n = n_a + n_b
+    weight = n_a * n_b / n
+    if np is not None:
+        delta = means_b - means_a
+        return (n, means_a + delta * (n_b / n),
+                comoments_a + comoments_b + np.outer(delta, delta) * weight)
+    
+    delta = [b - a for a, b in zip(means_a, means_b)]
+    means = [a + d * n_b / n for a, d in zip(means_a, delta)]
+    comoments = [[c_a + c_b + d_i * d_j * weight
+                  for c_a, c_b, d_j in zip(row_a, row_b, delta)]
+                 for row_a, row_b, d_i in zip(comoments_a, comoments_b, delta)]
+    return n, means, comoments
+
+
+def _correlation_from_comoments(comoments: Any, size: int) -> List[List[float]]:
+    """Zamienia macierz współmomentów na macierz korelacji Pearsona."""
+    if np is not None:
+        comoments = comoments.tolist()
+    scale = [math.sqrt(comoments[i][i]) for i in range(size)]
+    result = []
+    for i in range(size):
+        row = []
+        for j in range(size):
+            denominator = scale[i] * scale[j]
+            if denominator == 0:
+                # Kolumna stała - jak w calculate_correlation
+                row.append(0.0)
+            elif i == j:
+                row.append(1.0)
+            else:
+                # Zaokrąglenia nie mogą wyprowadzić wyniku poza [-1, 1]
+                row.append(max(-1.0, min(1.0, comoments[i][j] / denominator)))
+        result.append(row)
+    return result
+
+
+def _numeric_rows(rows: Iterable[Dict[str, Any]], columns: List[str]) -> Iterable[Tuple[Any, ...]]:
+    """Zwraca krotki wartości kolumn, sprawdzając, że są liczbami."""
+    first = True
+    for row in rows:
+        if first:
+            for column in columns:
+                if column not in row:
+                    raise KeyError(f"Kolumna '{column}' nie istnieje w danych")
+            first = False
+        values = tuple(row.get(column) for column in columns)
+        for column, value in zip(columns, values):
+            if not isinstance(value, (int, float)):
+                raise ValueError(f"Kolumna '{column}' zawiera wartości nieliczbowe "
+                                 f"lub brakujące")
+        yield values
+
+
+def correlation_matrix(processor: Any, columns: List[str]) -> List[List[float]]:
+    """
+    Oblicza macierz korelacji Pearsona dla wszystkich par kolumn.
+    
+    Zamiast osobnego calculate_correlation dla każdej pary (m * (m - 1) / 2
+    wywołań, każde z kilkoma przebiegami po danych) dane są czytane raz:
+    dla kolejnych porcji wierszy liczone są średnie i iloczyny odchyleń od
+    średnich (z NumPy - jednym mnożeniem macierzy), a porcje są łączone
+    wzorem Chana. Dane w pamięci przy zainstalowanym NumPy trafiają do
+    jednego mnożenia macierzy (kolumny kolumnowego magazynu bez kopiowania
+    przez get_column_array). Procesory strumieniowe (stream_csv, map_csv)
+    i widoki są czytane w jednym przebiegu, tylko z potrzebnymi kolumnami.
+    
+    Args:
+        processor (DataProcessor): Procesor z danymi
+        columns (List[str]): Nazwy kolumn liczbowych
+    
+    Returns:
+        List[List[float]]: Macierz korelacji; element [i][j] to korelacja
+            columns[i] i columns[j] (0.0, gdy któraś kolumna jest stała)
+    
+    Raises:
+        KeyError: Gdy kolumna nie istnieje
+        ValueError: Gdy kolumny się powtarzają, zawierają wartości
+            nieliczbowe lub brakujące albo jest mniej niż 2 wiersze
+    
+    Example:
+        >>> processor = DataProcessor([{'x': 1, 'y': 2}, {'x': 2, 'y': 4},
+        ...                            {'x': 3, 'y': 5}])
+        >>> correlation_matrix(processor, ['x', 'y'])
+        [[1.0, 0.98...], [0.98..., 1.0]]
+    """
+    columns = list(columns)
+    if not columns:
+        raise ValueError("Lista kolumn nie może być pusta")
+    if len(set(columns)) != len(columns):
+        raise ValueError("Kolumny nie mogą się powtarzać")
+    
+    if np is not None and not processor.is_streaming and not processor.is_view:
+        # Kolumny są sprawdzane przed obliczeniami wektorowymi: brakujące
+        # komórki dają krótszy bufor, a wartości nieliczbowe - ValueError
+        size = processor.count_rows()
+        vectors = []
+        for column in columns:
+            try:
+                vector = processor.get_column_array(column)
+            except ValueError:
+                vector = None
+            if vector is None or len(vector) != size:
+                raise ValueError(f"Kolumna '{column}' zawiera wartości nieliczbowe "
+                                 f"lub brakujące")
+            vectors.append(_as_vector(vector))
+        if size < 2:
+            raise ValueError("Potrzeba co najmniej 2 punktów danych")
+        matrix = np.column_stack(vectors).astype(np.float64)
+        matrix -= matrix.mean(axis=0)
+        return _correlation_from_comoments(matrix.T @ matrix, len(columns))
+    
+    rows = _numeric_rows(processor.iter_rows(columns), columns)
+    state = None
+    while True:
+        block = list(islice(rows, _CORRELATION_BLOCK))
+        if not block:
+            break
+        moments = _comoments(block)
+        state = moments if state is None else _merge_comoments(state, moments)
+    if state is None or state[0] < 2:
+        raise ValueError("Potrzeba co najmniej 2 punktów danych")
+    return _correlation_from_comoments(state[2], len(columns))
+
+
+def _isqrt(n: int) -> int:
+    """
+    Całkowity pierwiastek kwadratowy dowolnie dużej liczby.
+    
+    Używa math.isqrt (Python 3.8+), a w starszych wersjach iteracji Newtona
+    na liczbach całkowitych (bez zamiany na float, która traci dokładność
+    powyżej 2**53 i przepełnia się powyżej około 10**308).
+    """
+    if n < 0:
+        raise ValueError("Pierwiastek z liczby ujemnej")
+    if hasattr(math, 'isqrt'):
+        return math.isqrt(n)
+    if n == 0:
+        return 0
+    # Przybliżenie początkowe nie mniejsze niż wynik - ciąg maleje do pierwiastka
+    root = 1 << ((n.bit_length() + 1) // 2)
+    while True:
+        smaller = (root + n // root) // 2
+        if smaller >= root:
+            return root
+        root = smaller
+
+
+def _miller_rabin(n: int) -> bool:
+    """Test Millera-Rabina dla nieparzystego n większego niż 41."""
+    d, s = n - 1, 0
+    while not d & 1:
+        d >>= 1
+        s += 1
+    
+    bases: Iterable[int] = _MR_BASES
+    if n >= _MR_DETERMINISTIC_LIMIT:
+        extra = [_prime_rng.randrange(2, n - 1) for _ in range(_MR_RANDOM_ROUNDS)]
+        bases = _MR_BASES + tuple(extra)
+    for base in bases:
+        x = pow(base, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _base_primes(limit: int) -> List[int]:
+    """Liczby pierwsze nie większe niż limit (zwykłe sito Eratostenesa)."""
+    flags = bytearray([1]) * (limit + 1)
+    flags[:2] = b'\x00\x00'
+    for i in range(2, _isqrt(limit) + 1):
+        if flags[i]:
+            flags[i * i::i] = bytes((limit - i * i) // i + 1)
+    return list(compress(range(limit + 1), flags))
+
+
+def _sieve_segment(low: int, high: int, primes: List[int]) -> bytearray:
+    """
+    Przesiewa przedział [low, high) liczbami pierwszymi bazowymi.
+    
+    Zwraca flagi (1 - liczba pierwsza); wielokrotności są wykreślane
+    przypisaniem wycinka, więc pętla w Pythonie biegnie tylko po liczbach
+    bazowych, a nie po liczbach segmentu.
+    """
+    flags = bytearray([1]) * (high - low)
+    for prime in primes:
+        square = prime * prime
+        if square >= high:
+            break
+        start = max(square, (low + prime - 1) // prime * prime)
+        if start < high:
+            flags[start - low::prime] = bytes((high - 1 - start) // prime + 1)
+    for n in range(low, min(high, 2)):
+        flags[n - low] = 0
+    return flags
+
+
+def _worth_sieving(hits: int, base_count: int) -> bool:
+    """Czy przesianie segmentu jest tańsze niż test każdej liczby osobno."""
+    return hits >= _SIEVE_MIN_HITS + base_count // 8
+
+
 class MathCalculator:
     """
     Klasa do zaawansowanych obliczeń matematycznych.
@@ -208,6 +1181,11 @@ class MathCalculator:
         """
         Sprawdza czy liczba jest liczbą pierwszą.
         
+        Po dzieleniu przez małe liczby pierwsze stosowany jest test
+        Millera-Rabina - deterministyczny dla liczb poniżej 3.3 * 10**24
+        (w tym wszystkich 64-bitowych), a dla większych probabilistyczny
+        z prawdopodobieństwem błędu poniżej 4**-20.
+        
         Args:
             n (int): Liczba do sprawdzenia
         
@@ -217,17 +1195,111 @@ class MathCalculator:
         if not isinstance(n, int) or n < 2:
             return False
         
-        if n == 2:
+        for prime in _MR_BASES:
+            if n % prime == 0:
+                return n == prime
+        
+        if n < _MR_BASES[-1] * _MR_BASES[-1]:
             return True
         
-        if n % 2 == 0:
-            return False
+        return _miller_rabin(n)
+    
+    @staticmethod
+    def primes_in_range(lo: int, hi: int) -> List[int]:
+        """
+        Zwraca liczby pierwsze z przedziału [lo, hi).
         
-        for i in range(3, int(math.sqrt(n)) + 1, 2):
-            if n % i == 0:
-                return False
+        Przedział jest przesiewany segmentami mieszczącymi się w pamięci
+        podręcznej procesora, z liczbami pierwszymi bazowymi do sqrt(hi).
+        Wąskie przedziały oraz liczby od 2**40 są sprawdzane testem
+        Millera-Rabina.
         
-        return True
+        Args:
+            lo (int): Początek przedziału (włącznie)
+            hi (int): Koniec przedziału (wyłącznie)
+        
+        Returns:
+            List[int]: Rosnąca lista liczb pierwszych
+        
+        Raises:
+            ValueError: Gdy granice nie są liczbami całkowitymi
+        
+        Example:
+            >>> MathCalculator.primes_in_range(10, 30)
+            [11, 13, 17, 19, 23, 29]
+        """
+        if not isinstance(lo, int) or not isinstance(hi, int):
+            raise ValueError("Granice przedziału muszą być liczbami całkowitymi")
+        lo = max(lo, 2)
+        if hi <= lo:
+            return []
+        
+        root = _isqrt(hi - 1)
+        if root <= _SIEVE_BASE_LIMIT:
+            # Oszacowanie liczby liczb pierwszych bazowych (twierdzenie o liczbach pierwszych)
+            estimate = int(root / math.log(root)) if root > 2 else 1
+            sieve = _worth_sieving(hi - lo, estimate)
+        else:
+            sieve = False
+        if not sieve:
+            return [n for n in range(lo, hi) if MathCalculator.is_prime(n)]
+        
+        primes = _base_primes(root)
+        result: List[int] = []
+        for low in range(lo, hi, _SIEVE_SEGMENT):
+            high = min(low + _SIEVE_SEGMENT, hi)
+            result.extend(compress(range(low, high), _sieve_segment(low, high, primes)))
+        return result
+    
+    @staticmethod
+    def is_prime_many(values: Iterable[int]) -> List[bool]:
+        """
+        Sprawdza pierwszość wielu liczb naraz.
+        
+        Liczby są grupowane według segmentów sita; segmenty z dużą liczbą
+        sprawdzanych wartości są przesiewane raz (segmentowe sito
+        Eratostenesa), a pojedyncze wartości i liczby od 2**40 sprawdza
+        is_prime.
+        
+        Args:
+            values (Iterable[int]): Liczby (lista, array.array,
+                numpy.ndarray lub iterator)
+        
+        Returns:
+            List[bool]: Wyniki w kolejności values (False dla wartości
+                niebędących liczbami całkowitymi, jak w is_prime)
+        
+        Example:
+            >>> MathCalculator.is_prime_many([1, 2, 9, 97])
+            [False, True, False, True]
+        """
+        values = values.tolist() if hasattr(values, 'tolist') else list(values)
+        result = [False] * len(values)
+        segments: Dict[int, List[int]] = {}
+        sieve_limit = _SIEVE_BASE_LIMIT * _SIEVE_BASE_LIMIT
+        for position, value in enumerate(values):
+            if not isinstance(value, int) or value < 2:
+                continue
+            if value < sieve_limit:
+                segments.setdefault(value // _SIEVE_SEGMENT, []).append(position)
+            else:
+                result[position] = MathCalculator.is_prime(value)
+        
+        dense = [number for number, positions in segments.items()
+                 if _worth_sieving(len(positions), 0)]
+        primes = _base_primes(_isqrt((max(dense) + 1) * _SIEVE_SEGMENT - 1)) if dense else []
+        for number, positions in segments.items():
+            low = number * _SIEVE_SEGMENT
+            high = low + _SIEVE_SEGMENT
+            base_count = bisect_right(primes, _isqrt(high - 1))
+            if primes and _worth_sieving(len(positions), base_count):
+                flags = _sieve_segment(low, high, primes)
+                for position in positions:
+                    result[position] = bool(flags[values[position] - low])
+            else:
+                for position in positions:
+                    result[position] = MathCalculator.is_prime(values[position])
+        return result
     
     @staticmethod
     def gcd(a: int, b: int) -> int:
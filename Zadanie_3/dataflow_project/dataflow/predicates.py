@@ -0,0 +1,344 @@
+"""
+Moduł predicates - kompilowane warunki filtrowania
+==================================================
+
+Ten moduł zawiera funkcje i klasy do:
+- Opisywania warunków filtrowania (równość, zakresy, przynależność, regex)
+- Kompilowania warunków do szybkiej funkcji sprawdzającej wiersz
+- Porządkowania warunków według szacowanej selektywności
+- Wyznaczania pasujących wierszy bezpośrednio na kolumnach ColumnStore
+
+Warunek to słownik {kolumna: wartość}. Zwykła wartość oznacza równość,
+a krotka (operator, argument) - inny operator, np.:
+
+    {'age': ('>', 30), 'city': ('in', {'Warszawa', 'Kraków'})}
+
+Kilka warunków dla jednej kolumny podaje się jako listę krotek:
+
+    {'age': [('>=', 25), ('<', 35)]}
+"""
+
+import re
+import heapq
+import operator
+from array import array
+from functools import partial
+from itertools import compress, count
+from typing import List, Dict, Any, Optional, Callable, Sequence, Tuple
+
+from .columnar import MISSING, DictionaryColumn
+
+# Operatory porównań przyjmują argument jako pierwszy parametr funkcji z modułu
+# operator, dlatego kierunek nierówności jest odwrócony: v > 30 <=> 30 < v.
+_COMPARISONS = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '>': operator.lt,
+    '>=': operator.le,
+    '<': operator.gt,
+    '<=': operator.ge,
+}
+
+OPERATORS = tuple(_COMPARISONS) + ('in', 'not in', 'between', 'regex')
+
+# Szacowany odsetek wierszy spełniających warunek (gdy brak indeksu)
+_DEFAULT_SELECTIVITY = {
+    '==': 0.05,
+    'in': 0.2,
+    'between': 0.25,
+    '>': 0.35, '>=': 0.35, '<': 0.35, '<=': 0.35,
+    'regex': 0.5,
+    '!=': 0.95,
+    'not in': 0.8,
+}
+
+
+def _is_operator_tuple(value: Any) -> bool:
+    """Sprawdza czy wartość warunku jest krotką (operator, argument)."""
+    return (isinstance(value, tuple) and len(value) == 2
+            and isinstance(value[0], str) and value[0] in OPERATORS)
+
+
+class Condition:
+    """
+    Pojedynczy warunek na jednej kolumnie.
+    
+    Attributes:
+        column (str): Nazwa kolumny
+        op (str): Operator (jeden z OPERATORS)
+        operand (Any): Argument operatora
+        test (Callable[[Any], bool]): Funkcja sprawdzająca wartość kolumny;
+            może zgłosić TypeError dla wartości nieporównywalnych
+        selectivity (float): Szacowany odsetek pasujących wierszy
+    """
+    
+    def __init__(self, column: str, op: str, operand: Any):
+        """
+        Inicjalizuje warunek.
+        
+        Args:
+            column (str): Nazwa kolumny
+            op (str): Operator
+            operand (Any): Argument operatora
+        
+        Raises:
+            ValueError: Gdy operator jest nieznany lub argument nieprawidłowy
+        """
+        self.column = column
+        self.op = op
+        self.operand = operand
+        self.test = self._compile(op, operand)
+        self.selectivity = _DEFAULT_SELECTIVITY[op]
+    
+    @staticmethod
+    def _compile(op: str, operand: Any) -> Callable[[Any], bool]:
+        """Tworzy funkcję sprawdzającą wartość dla operatora."""
+        if op in _COMPARISONS:
+            return partial(_COMPARISONS[op], operand)
+        if op == 'in':
+            return frozenset(operand).__contains__
+        if op == 'not in':
+            members = frozenset(operand)
+            return lambda value: value not in members
+        if op == 'between':
+            try:
+                low, high = operand
+            except (TypeError, ValueError):
+                raise ValueError("Operator 'between' wymaga pary (min, max)")
+            return lambda value: low <= value <= high
+        if op == 'regex':
+            return re.compile(operand).search
+        raise ValueError(f"Nieznany operator '{op}'. Dostępne: {', '.join(OPERATORS)}")
+    
+    def matches(self, value: Any) -> bool:
+        """
+        Sprawdza wartość, traktując wartości nieporównywalne jako niepasujące.
+        
+        Args:
+            value (Any): Wartość kolumny
+        
+        Returns:
+            bool: True jeśli wartość spełnia warunek
+        """
+        if value is MISSING:
+            return False
+        try:
+            return bool(self.test(value))
+        except TypeError:
+            return False
+    
+    def __repr__(self) -> str:
+        return f"{self.column} {self.op} {self.operand!r}"
+
+
+class Predicate:
+    """
+    Skompilowany zestaw warunków połączonych koniunkcją (AND).
+    
+    Warunki są uporządkowane od najbardziej selektywnych, więc dla
+    większości wierszy sprawdzanie kończy się na pierwszym warunku.
+    
+    Attributes:
+        conditions (List[Condition]): Warunki w kolejności sprawdzania
+    """
+    
+    def __init__(self, conditions: Dict[str, Any], indexes: Optional[Dict[str, Any]] = None):
+        """
+        Kompiluje warunki.
+        
+        Args:
+            conditions (Dict[str, Any]): Warunki {kolumna: wartość lub
+                (operator, argument) lub lista krotek}
+            indexes (Optional[Dict[str, Any]]): Indeksy HashIndex lub
+                SortedIndex, z których brana jest dokładna selektywność
+                warunków obsługiwanych przez indeks
+        
+        Raises:
+            ValueError: Gdy operator jest nieznany
+        """
+        parsed = []
+        for column, spec in conditions.items():
+            if isinstance(spec, list) and spec and all(_is_operator_tuple(s) for s in spec):
+                parsed.extend(Condition(column, op, operand) for op, operand in spec)
+            elif _is_operator_tuple(spec):
+                parsed.append(Condition(column, spec[0], spec[1]))
+            else:
+                parsed.append(Condition(column, '==', spec))
+        
+        for condition in parsed:
+            index = (indexes or {}).get(condition.column)
+            if index is not None and index.size:
+                matched = len(self._index_positions(condition, index) or [])
+                condition.selectivity = matched / index.size
+        
+        self._set_conditions(parsed)
+    
+    def _set_conditions(self, conditions: List[Condition]) -> None:
+        """Porządkuje warunki według selektywności i przygotowuje testy."""
+        self.conditions = sorted(conditions, key=lambda c: c.selectivity)
+        self._tests: List[Tuple[str, Callable[[Any], bool]]] = [
+            (condition.column, condition.test) for condition in self.conditions
+        ]
+    
+    def __and__(self, other: 'Predicate') -> 'Predicate':
+        """
+        Łączy dwa warunki w jeden (fuzja kolejnych filtrów).
+        
+        Args:
+            other (Predicate): Drugi warunek
+        
+        Returns:
+            Predicate: Nowy warunek sprawdzający oba zestawy naraz
+        """
+        combined = Predicate({})
+        combined._set_conditions(self.conditions + other.conditions)
+        return combined
+    
+    def __len__(self) -> int:
+        return len(self.conditions)
+    
+    @property
+    def columns(self) -> List[str]:
+        """Kolumny używane przez warunki."""
+        return list(dict.fromkeys(condition.column for condition in self.conditions))
+    
+    def __call__(self, row: Dict[str, Any]) -> bool:
+        """
+        Sprawdza wiersz.
+        
+        Brak kolumny lub wartość nieporównywalna z argumentem (np. tekst
+        porównywany z liczbą) oznacza, że wiersz nie pasuje.
+        
+        Args:
+            row (Dict[str, Any]): Wiersz danych
+        
+        Returns:
+            bool: True jeśli wiersz spełnia wszystkie warunki
+        """
+        try:
+            for column, test in self._tests:
+                if not test(row[column]):
+                    return False
+        except (KeyError, TypeError):
+            return False
+        return True
+    
+    @staticmethod
+    def _index_positions(condition: Condition, index: Any) -> Optional[List[int]]:
+        """Zwraca numery wierszy z indeksu dla warunku '==' lub 'in' (i zakresów)."""
+        if condition.op == '==':
+            return index.lookup(condition.operand)
+        if condition.op == 'in':
+            # Powtórzone wartości argumentu dałyby te same wiersze kilka razy
+            values = frozenset(condition.operand)
+            return list(heapq.merge(*(index.lookup(value) for value in values)))
+        positions_for = getattr(index, 'positions_for', None)
+        if positions_for is not None:
+            # Indeks posortowany obsługuje też warunki zakresowe
+            return positions_for(condition.op, condition.operand)
+        return None
+    
+    def index_candidates(self, indexes: Optional[Dict[str, Any]]) -> Optional[List[int]]:
+        """
+        Zwraca kandydatów wskazanych przez najbardziej selektywny warunek
+        obsługiwany przez indeks ('==' lub 'in' na indeksowanej kolumnie,
+        a dla SortedIndex także '>', '>=', '<', '<=' i 'between').
+        
+        Args:
+            indexes (Optional[Dict[str, Any]]): Indeksy {kolumna: HashIndex
+                lub SortedIndex}
+        
+        Returns:
+            Optional[List[int]]: Rosnąca lista numerów wierszy lub None,
+                gdy żaden warunek nie może użyć indeksu
+        """
+        if not indexes:
+            return None
+        candidates = None
+        for condition in self.conditions:
+            index = indexes.get(condition.column)
+            if index is None:
+                continue
+            positions = self._index_positions(condition, index)
+            if positions is not None and (candidates is None or len(positions) < len(candidates)):
+                candidates = positions
+        return candidates
+    
+    def select(self, columns: Any, positions: Optional[Sequence[int]] = None) -> List[int]:
+        """
+        Wyznacza pasujące wiersze, przetwarzając kolejno całe kolumny.
+        
+        Dla kolumn typowanych (array) porównania wykonywane są przez
+        map/compress bez pętli w Pythonie, a dla kolumn kodowanych
+        słownikowo - na kodach wartości.
+        
+        Args:
+            columns (Any): Magazyn kolumnowy (ColumnStore)
+            positions (Optional[Sequence[int]]): Ogranicza sprawdzanie do
+                podanych wierszy
+        
+        Returns:
+            List[int]: Rosnąca lista numerów pasujących wierszy
+        """
+        if positions is None:
+            positions = range(len(columns))
+        for condition in self.conditions:
+            if not positions:
+                break
+            if condition.column not in columns:
+                return []
+            positions = self._select_column(condition, columns.column(condition.column),
+                                            positions)
+        return list(positions)
+    
+    @staticmethod
+    def _select_column(condition: Condition, buffer: Sequence[Any],
+                       positions: Sequence[int]) -> List[int]:
+        """Zwraca pozycje, dla których wartość kolumny spełnia warunek."""
+        full_scan = isinstance(positions, range) and len(positions) == len(buffer)
+        if isinstance(buffer, DictionaryColumn):
+            # Warunek jest sprawdzany raz dla każdej wartości z tabeli,
+            # a wiersze są wybierane po kodach
+            mask = [condition.matches(value) for value in buffer.values]
+            codes = buffer.codes
+            if full_scan:
+                return list(compress(count(), map(mask.__getitem__, codes)))
+            return list(compress(positions, map(mask.__getitem__,
+                                                map(codes.__getitem__, positions))))
+        if isinstance(buffer, array):
+            try:
+                if full_scan:
+                    return list(compress(count(), map(condition.test, buffer)))
+                values = map(buffer.__getitem__, positions)
+                return list(compress(positions, map(condition.test, values)))
+            except TypeError:
+                pass
+        matches = condition.matches
+        return [i for i in positions if matches(buffer[i])]
+    
+    def __repr__(self) -> str:
+        return ' AND '.join(repr(condition) for condition in self.conditions)
+
+
+def compile_conditions(conditions: Any, indexes: Optional[Dict[str, Any]] = None) -> Predicate:
+    """
+    Kompiluje warunki filtrowania do obiektu Predicate.
+    
+    Skompilowany warunek można przekazać wielokrotnie do filter_data,
+    unikając ponownej kompilacji.
+    
+    Args:
+        conditions (Any): Słownik warunków lub gotowy Predicate
+        indexes (Optional[Dict[str, Any]]): Indeksy do szacowania selektywności
+    
+    Returns:
+        Predicate: Skompilowany warunek
+    
+    Example:
+        >>> predicate = compile_conditions({'age': ('>', 30)})
+        >>> predicate({'age': 35})
+        True
+    """
+    if isinstance(conditions, Predicate):
+        return conditions
+    return Predicate(conditions, indexes)
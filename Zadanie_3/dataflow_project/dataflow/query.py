@@ -0,0 +1,260 @@
+"""
+Moduł query - leniwe plany zapytań
+==================================
+
+Ten moduł zawiera klasy do:
+- Budowania planu zapytania z kolejnych operacji (filter, select, group_by)
+- Optymalizacji planu: fuzji filtrów i zawężania odczytywanych kolumn
+- Wykonywania planu w jednym przebiegu po danych
+"""
+
+from typing import List, Dict, Any, Optional, Iterator, Tuple, Union
+
+from .predicates import Predicate, compile_conditions
+
+
+class _Plan:
+    """Zoptymalizowana postać planu zapytania."""
+    
+    def __init__(self, predicate: Optional[Predicate], projection: Optional[List[str]],
+                 group_key: Optional[str], empty: bool):
+        self.predicate = predicate
+        self.projection = projection
+        self.group_key = group_key
+        self.empty = empty
+    
+    @property
+    def scan_columns(self) -> Optional[List[str]]:
+        """Kolumny, które musi dostarczyć źródło danych (None - wszystkie)."""
+        if self.projection is None:
+            return None
+        columns = list(self.projection)
+        if self.group_key is not None and self.group_key not in columns:
+            columns.append(self.group_key)
+        return columns
+
+
+class LazyQuery:
+    """
+    Leniwe zapytanie na danych DataProcessor.
+    
+    Każda operacja zwraca nowe zapytanie, nie zmieniając danych procesora.
+    Plan jest wykonywany dopiero przez collect(), count() lub
+    get_column_values(), zawsze na bieżących danych procesora.
+    
+    Optymalizacje:
+    - wszystkie filtry są łączone w jeden skompilowany warunek,
+    - kolejne projekcje są łączone w jedną,
+    - źródło odczytuje tylko kolumny potrzebne do wyniku i warunków
+      (dla CSV w trybie strumieniowym pozostałe kolumny nie są konwertowane).
+    """
+    
+    def __init__(self, processor: Any, steps: Tuple[Tuple[str, Any], ...] = ()):
+        """
+        Inicjalizuje zapytanie.
+        
+        Args:
+            processor (Any): DataProcessor, na którego danych działa zapytanie
+            steps (Tuple[Tuple[str, Any], ...]): Operacje planu logicznego
+        """
+        self._processor = processor
+        self._steps = steps
+    
+    def _then(self, operation: str, argument: Any) -> 'LazyQuery':
+        """Zwraca nowe zapytanie z dodaną operacją."""
+        if self._steps and self._steps[-1][0] == 'group_by':
+            raise ValueError("Po group_by dozwolone są tylko collect() i count()")
+        return LazyQuery(self._processor, self._steps + ((operation, argument),))
+    
+    def filter(self, conditions: Union[Dict[str, Any], Predicate]) -> 'LazyQuery':
+        """
+        Dodaje filtr do planu.
+        
+        Args:
+            conditions (Union[Dict[str, Any], Predicate]): Warunki jak
+                w filter_data
+        
+        Returns:
+            LazyQuery: Nowe zapytanie
+        """
+        return self._then('filter', compile_conditions(conditions))
+    
+    def select(self, columns: List[str]) -> 'LazyQuery':
+        """
+        Dodaje projekcję - w wyniku zostaną tylko podane kolumny.
+        
+        Args:
+            columns (List[str]): Nazwy kolumn
+        
+        Returns:
+            LazyQuery: Nowe zapytanie
+        """
+        return self._then('select', list(columns))
+    
+    def group_by(self, column: str) -> 'LazyQuery':
+        """
+        Grupuje wynik według kolumny.
+        
+        Po group_by collect() zwraca słownik grup (jak group_by_column),
+        a count() - słownik {wartość: liczba wierszy} bez budowania grup.
+        
+        Args:
+            column (str): Nazwa kolumny
+        
+        Returns:
+            LazyQuery: Nowe zapytanie
+        """
+        return self._then('group_by', column)
+    
+    def _optimize(self) -> _Plan:
+        """Łączy filtry i projekcje planu logicznego."""
+        predicate = None
+        projection = None
+        group_key = None
+        empty = False
+        for operation, argument in self._steps:
+            if operation == 'filter':
+                # Warunek na kolumnie usuniętej wcześniejszą projekcją nie
+                # może być spełniony
+                if projection is not None and any(
+                        column not in projection for column in argument.columns):
+                    empty = True
+                predicate = argument if predicate is None else predicate & argument
+            elif operation == 'select':
+                if projection is None:
+                    projection = list(argument)
+                else:
+                    projection = [column for column in argument if column in projection]
+            else:
+                group_key = argument
+        return _Plan(predicate, projection, group_key, empty)
+    
+    def _rows(self, plan: _Plan) -> Iterator[Dict[str, Any]]:
+        """Wykonuje plan i zwraca wiersze wyniku (przed grupowaniem)."""
+        if plan.empty:
+            return iter(())
+        rows = self._processor._scan(plan.predicate, plan.scan_columns)
+        if plan.projection is None:
+            return rows
+        projection = plan.projection
+        if plan.group_key is not None and plan.group_key not in projection:
+            # Klucz grupowania jest potrzebny do grupowania, ale nie do wyniku
+            return rows
+        return ({column: row[column] for column in projection if column in row}
+                for row in rows)
+    
+    def collect(self) -> Union[List[Dict[str, Any]], Dict[Any, List[Dict[str, Any]]]]:
+        """
+        Wykonuje zapytanie.
+        
+        Returns:
+            Union[List[Dict[str, Any]], Dict[Any, List[Dict[str, Any]]]]:
+                Lista wierszy lub, po group_by, słownik grup
+        
+        Raises:
+            KeyError: Gdy kolumna grupowania nie istnieje w danych
+        """
+        plan = self._optimize()
+        rows = self._rows(plan)
+        if plan.group_key is None:
+            return list(rows)
+        
+        key = plan.group_key
+        projection = plan.projection
+        groups: Dict[Any, List[Dict[str, Any]]] = {}
+        for row in rows:
+            if key not in row:
+                raise KeyError(f"Kolumna '{key}' nie istnieje w danych")
+            value = row[key]
+            if projection is not None and key not in projection:
+                row = {column: row[column] for column in projection if column in row}
+            groups.setdefault(value, []).append(row)
+        return groups
+    
+    def count(self) -> Union[int, Dict[Any, int]]:
+        """
+        Liczy wiersze wyniku bez ich materializowania.
+        
+        Returns:
+            Union[int, Dict[Any, int]]: Liczba wierszy lub, po group_by,
+                słownik {wartość: liczba wierszy}
+        
+        Raises:
+            KeyError: Gdy kolumna grupowania nie istnieje w danych
+        """
+        plan = self._optimize()
+        if plan.group_key is None:
+            if plan.empty:
+                return 0
+            # Do liczenia nie są potrzebne żadne kolumny poza warunkami
+            return sum(1 for _ in self._processor._scan(plan.predicate, []))
+        
+        rows = self._rows(plan)
+        
+        key = plan.group_key
+        counts: Dict[Any, int] = {}
+        for row in rows:
+            if key not in row:
+                raise KeyError(f"Kolumna '{key}' nie istnieje w danych")
+            value = row[key]
+            counts[value] = counts.get(value, 0) + 1
+        return counts
+    
+    def get_column_values(self, column: str) -> List[Any]:
+        """
+        Wykonuje zapytanie i zwraca wartości jednej kolumny.
+        
+        Args:
+            column (str): Nazwa kolumny
+        
+        Returns:
+            List[Any]: Lista wartości
+        """
+        return [row[column] for row in self.select([column]).collect() if column in row]
+    
+    def explain(self) -> str:
+        """
+        Opisuje plan logiczny i plan po optymalizacji.
+        
+        Returns:
+            str: Tekstowy opis planu
+        """
+        lines = ["Plan logiczny:", f"  Scan {self._describe_source()}"]
+        for operation, argument in self._steps:
+            if operation == 'filter':
+                lines.append(f"  Filter {argument!r}")
+            elif operation == 'select':
+                lines.append(f"  Select [{', '.join(argument)}]")
+            else:
+                lines.append(f"  GroupBy {argument}")
+        
+        plan = self._optimize()
+        lines.append("Plan zoptymalizowany:")
+        if plan.empty:
+            lines.append("  Empty (warunek na kolumnie usuniętej projekcją)")
+            return '\n'.join(lines)
+        
+        columns = plan.scan_columns
+        if columns is not None and plan.predicate is not None:
+            columns += [column for column in plan.predicate.columns if column not in columns]
+        scan = f"  Scan {self._describe_source()}"
+        scan += " kolumny: " + ('wszystkie' if columns is None else f"[{', '.join(columns)}]")
+        lines.append(scan)
+        if plan.predicate is not None:
+            lines.append(f"  Filter {plan.predicate!r}")
+        if plan.projection is not None:
+            lines.append(f"  Project [{', '.join(plan.projection)}]")
+        if plan.group_key is not None:
+            lines.append(f"  GroupBy {plan.group_key}")
+        return '\n'.join(lines)
+    
+    def _describe_source(self) -> str:
+        """Opisuje źródło danych procesora."""
+        if self._processor.is_streaming:
+            return 'stream'
+        if self._processor.is_view:
+            return f"view ({self._processor.storage})"
+        return self._processor.storage
+    
+    def __repr__(self) -> str:
+        return self.explain()
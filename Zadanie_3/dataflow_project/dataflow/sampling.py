@@ -0,0 +1,116 @@
+"""
+Moduł sampling - losowanie próbek ze strumienia danych
+======================================================
+
+Ten moduł zawiera funkcje do:
+- Losowania próbki prostej w jednym przebiegu po danych (reservoir sampling)
+- Losowania próbki warstwowej - osobnego rezerwuaru dla każdej warstwy
+- Powtarzalnego losowania dzięki podanemu ziarnu
+
+Pamięć zależy wyłącznie od rozmiaru próbki (i liczby warstw), a nie od
+liczby elementów, więc dane mogą pochodzić z pliku czytanego strumieniowo.
+"""
+
+import math
+import random
+from itertools import islice
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+_END = object()
+
+
+def _check_size(n: int) -> None:
+    """Sprawdza rozmiar próbki."""
+    if n < 0:
+        raise ValueError("Rozmiar próbki nie może być ujemny")
+
+
+def reservoir_sample(items: Iterable[Any], n: int, seed: Optional[int] = None) -> List[Any]:
+    """
+    Losuje n elementów z danych w jednym przebiegu (algorytm L).
+    
+    Każdy element ma jednakowe prawdopodobieństwo trafienia do próbki.
+    Zamiast losowania dla każdego elementu losowana jest liczba elementów
+    do pominięcia, więc koszt rośnie jak n * log(N / n), a pomijane
+    elementy są tylko przeglądane.
+    
+    Args:
+        items (Iterable[Any]): Dane (lista lub iterator)
+        n (int): Rozmiar próbki
+        seed (Optional[int]): Ziarno generatora (ta sama wartość daje tę
+            samą próbkę dla tych samych danych)
+    
+    Returns:
+        List[Any]: Wylosowane elementy w kolejności z danych (wszystkie
+            elementy, gdy jest ich najwyżej n)
+    
+    Raises:
+        ValueError: Gdy n jest ujemne
+    """
+    _check_size(n)
+    iterator = iter(items)
+    reservoir: List[Tuple[int, Any]] = list(enumerate(islice(iterator, n)))
+    if len(reservoir) < n or n == 0:
+        return [item for _, item in reservoir]
+    
+    rng = random.Random(seed)
+    # 1 - random() należy do (0, 1], więc logarytm jest zawsze określony
+    weight = math.exp(math.log(1.0 - rng.random()) / n)
+    position = n - 1
+    while True:
+        if weight >= 1.0:
+            # Liczba pomijanych elementów jest praktycznie nieskończona
+            break
+        skip = int(math.log(1.0 - rng.random()) / math.log(1.0 - weight))
+        item = next(islice(iterator, skip, skip + 1), _END)
+        if item is _END:
+            break
+        position += skip + 1
+        reservoir[rng.randrange(n)] = (position, item)
+        weight *= math.exp(math.log(1.0 - rng.random()) / n)
+    
+    reservoir.sort(key=lambda entry: entry[0])
+    return [item for _, item in reservoir]
+
+
+def stratified_sample(items: Iterable[Any], n: int, key: Callable[[Any], Hashable],
+                      seed: Optional[int] = None) -> Dict[Hashable, List[Any]]:
+    """
+    Losuje po n elementów z każdej warstwy w jednym przebiegu.
+    
+    Każda warstwa (elementy o tej samej wartości key) ma własny rezerwuar,
+    więc małe warstwy nie są wypierane przez duże.
+    
+    Args:
+        items (Iterable[Any]): Dane (lista lub iterator)
+        n (int): Rozmiar próbki w każdej warstwie
+        key (Callable[[Any], Hashable]): Funkcja wyznaczająca warstwę elementu
+        seed (Optional[int]): Ziarno generatora
+    
+    Returns:
+        Dict[Hashable, List[Any]]: Próbka każdej warstwy (elementy
+            w kolejności z danych), w kolejności pojawienia się warstw
+    
+    Raises:
+        ValueError: Gdy n jest ujemne
+    """
+    _check_size(n)
+    rng = random.Random(seed)
+    reservoirs: Dict[Hashable, List[Tuple[int, Any]]] = {}
+    seen: Dict[Hashable, int] = {}
+    for position, item in enumerate(items):
+        stratum = key(item)
+        count = seen.get(stratum, 0)
+        seen[stratum] = count + 1
+        reservoir = reservoirs.setdefault(stratum, [])
+        if count < n:
+            reservoir.append((position, item))
+            continue
+        # Algorytm R: element zastępuje losowy element z prawdopodobieństwem n / (count + 1)
+        slot = rng.randrange(count + 1)
+        if slot < n:
+            reservoir[slot] = (position, item)
+    
+    return {stratum: [item for _, item in sorted(reservoir, key=lambda entry: entry[0])]
+            for stratum, reservoir in reservoirs.items()}
+
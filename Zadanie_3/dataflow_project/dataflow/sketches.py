@@ -0,0 +1,442 @@
+"""
+Moduł sketches - szkice probabilistyczne
+========================================
+
+Ten moduł zawiera klasy do:
+- Przybliżonego liczenia unikalnych wartości w stałej pamięci (HyperLogLog)
+- Przybliżonych kwantyli strumienia w ograniczonej pamięci (QuantileSketch)
+- Łączenia szkiców zbudowanych na fragmentach danych lub w innych procesach
+- Serializacji szkiców do bajtów
+"""
+
+import math
+import random
+import struct
+import hashlib
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+_MIN_PRECISION = 4
+_MAX_PRECISION = 18
+
+
+def _hash64(value: Any) -> int:
+    """
+    Zwraca 64-bitowy skrót wartości, taki sam w każdym procesie.
+    
+    Wbudowane hash() jest losowane dla napisów przy każdym uruchomieniu
+    interpretera, więc szkice z różnych procesów nie dałyby się połączyć.
+    """
+    if isinstance(value, str):
+        data = b's' + value.encode('utf-8', 'surrogatepass')
+    elif isinstance(value, bytes):
+        data = b'b' + value
+    else:
+        if isinstance(value, float) and value.is_integer():
+            # Równe wartości int i float liczone są jako jedna (jak w set)
+            value = int(value)
+        data = b'r' + repr(value).encode('utf-8')
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'little')
+
+
+class HyperLogLog:
+    """
+    Szkic HyperLogLog do przybliżonego liczenia unikalnych wartości.
+    
+    Szkic zajmuje 2**precision bajtów niezależnie od liczby wartości.
+    Względny błąd standardowy oszacowania wynosi około
+    1.04 / sqrt(2**precision). Szkice o tej samej precyzji można łączyć
+    (merge lub |) - wynik jest taki, jakby wszystkie wartości dodano do
+    jednego szkicu, więc dane można przetwarzać we fragmentach lub
+    w osobnych procesach.
+    
+    Attributes:
+        precision (int): Liczba bitów skrótu wybierających rejestr
+    """
+    
+    __slots__ = ('precision', '_registers')
+    
+    def __init__(self, error: float = 0.01, precision: Optional[int] = None):
+        """
+        Tworzy pusty szkic.
+        
+        Args:
+            error (float): Docelowy względny błąd standardowy (domyślnie 0.01)
+            precision (Optional[int]): Jawna precyzja (4-18); ma pierwszeństwo
+                przed error
+        
+        Raises:
+            ValueError: Gdy błąd lub precyzja są spoza dozwolonego zakresu
+        """
+        if precision is None:
+            if not 0 < error < 1:
+                raise ValueError("Błąd musi być liczbą z przedziału (0, 1)")
+            precision = math.ceil(math.log2((1.04 / error) ** 2))
+            precision = min(max(precision, _MIN_PRECISION), _MAX_PRECISION)
+        if not _MIN_PRECISION <= precision <= _MAX_PRECISION:
+            raise ValueError(f"Precyzja musi być z przedziału "
+                             f"{_MIN_PRECISION}-{_MAX_PRECISION}")
+        self.precision = precision
+        self._registers = bytearray(1 << precision)
+    
+    @property
+    def error(self) -> float:
+        """Względny błąd standardowy oszacowania."""
+        return 1.04 / math.sqrt(len(self._registers))
+    
+    def add(self, value: Any) -> None:
+        """
+        Dodaje wartość do szkicu.
+        
+        Args:
+            value (Any): Wartość (napis, liczba lub inna wartość z repr)
+        """
+        self.update((value,))
+    
+    def update(self, values: Iterable[Any]) -> 'HyperLogLog':
+        """
+        Dodaje wiele wartości (np. fragment danych lub strumień).
+        
+        Args:
+            values (Iterable[Any]): Wartości
+        
+        Returns:
+            HyperLogLog: Zwraca siebie dla chaining
+        """
+        registers = self._registers
+        precision = self.precision
+        shift = 64 - precision
+        mask = (1 << shift) - 1
+        for value in values:
+            hashed = _hash64(value)
+            index = hashed >> shift
+            rank = shift - (hashed & mask).bit_length() + 1
+            if rank > registers[index]:
+                registers[index] = rank
+        return self
+    
+    def merge(self, other: 'HyperLogLog') -> 'HyperLogLog':
+        """
+        Dołącza inny szkic do tego szkicu.
+        
+        Args:
+            other (HyperLogLog): Szkic o tej samej precyzji
+        
+        Returns:
+            HyperLogLog: Zwraca siebie dla chaining
+        
+        Raises:
+            ValueError: Gdy szkice mają różną precyzję
+        """
+        if other.precision != self.precision:
+            raise ValueError("Można łączyć tylko szkice o tej samej precyzji")
+        self._registers = bytearray(map(max, self._registers, other._registers))
+        return self
+    
+    def __or__(self, other: 'HyperLogLog') -> 'HyperLogLog':
+        """Zwraca nowy szkic będący połączeniem dwóch szkiców."""
+        return self.copy().merge(other)
+    
+    def copy(self) -> 'HyperLogLog':
+        """Zwraca kopię szkicu."""
+        sketch = HyperLogLog(precision=self.precision)
+        sketch._registers = bytearray(self._registers)
+        return sketch
+    
+    def count(self) -> int:
+        """
+        Zwraca oszacowaną liczbę unikalnych wartości.
+        
+        Returns:
+            int: Oszacowanie liczby unikalnych wartości
+        """
+        registers = self._registers
+        m = len(registers)
+        alpha = {16: 0.673, 32: 0.697, 64: 0.709}.get(m, 0.7213 / (1 + 1.079 / m))
+        estimate = alpha * m * m / math.fsum(2.0 ** -r for r in registers)
+        zeros = registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            # Korekta dla małych liczności (linear counting)
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+    
+    def __len__(self) -> int:
+        return self.count()
+    
+    def to_bytes(self) -> bytes:
+        """
+        Serializuje szkic (np. do przesłania między procesami).
+        
+        Returns:
+            bytes: Zserializowany szkic
+        """
+        return struct.pack('<B', self.precision) + bytes(self._registers)
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'HyperLogLog':
+        """
+        Odtwarza szkic z bajtów zapisanych przez to_bytes.
+        
+        Args:
+            data (bytes): Zserializowany szkic
+        
+        Returns:
+            HyperLogLog: Odtworzony szkic
+        
+        Raises:
+            ValueError: Gdy dane są nieprawidłowe
+        """
+        if not data:
+            raise ValueError("Brak danych szkicu")
+        sketch = cls(precision=data[0])
+        if len(data) - 1 != len(sketch._registers):
+            raise ValueError("Nieprawidłowa długość danych szkicu")
+        sketch._registers = bytearray(data[1:])
+        return sketch
+    
+    def __getstate__(self) -> bytes:
+        return self.to_bytes()
+    
+    def __setstate__(self, state: bytes) -> None:
+        self.precision = state[0]
+        self._registers = bytearray(state[1:])
+    
+    def __repr__(self) -> str:
+        return f"HyperLogLog(precision={self.precision}, count={self.count()})"
+
+
+class QuantileSketch:
+    """
+    Szkic KLL do przybliżonych kwantyli strumienia wartości.
+    
+    Wartości trafiają do poziomu 0; pełny poziom jest sortowany, a co
+    druga jego wartość (losowo parzyste lub nieparzyste pozycje) przechodzi
+    na poziom wyżej z podwojoną wagą. Pojemności poziomów maleją
+    geometrycznie (czynnik 2/3) od najwyższego, więc szkic przechowuje
+    około 3 * k wartości niezależnie od długości strumienia. Błąd rangi
+    zwracanych kwantyli jest rzędu 1/k (dla k=200 zwykle poniżej 1%
+    liczby wartości). Szkice o tym samym k można łączyć (merge lub |),
+    więc dane można przetwarzać we fragmentach lub w osobnych procesach.
+    
+    Attributes:
+        k (int): Parametr dokładności (pojemność najwyższego poziomu)
+        count (int): Liczba dodanych wartości
+        minimum (Any): Najmniejsza wartość (dokładna)
+        maximum (Any): Największa wartość (dokładna)
+    
+    Example:
+        >>> sketch = QuantileSketch(k=200, seed=1)
+        >>> sketch.update(range(100000))
+        >>> sketch.quantile(0.5)  # około 50000
+    """
+    
+    __slots__ = ('k', 'count', 'minimum', 'maximum', '_levels', '_size',
+                 '_max_size', '_rng')
+    
+    _SHRINK = 2.0 / 3.0
+    
+    def __init__(self, k: int = 200, seed: Optional[int] = None):
+        """
+        Tworzy pusty szkic.
+        
+        Args:
+            k (int): Parametr dokładności (domyślnie 200; co najmniej 8)
+            seed (Optional[int]): Ziarno generatora wybierającego pozycje
+                przy kompakcji (ta sama wartość daje ten sam szkic)
+        
+        Raises:
+            ValueError: Gdy k jest mniejsze niż 8
+        """
+        if k < 8:
+            raise ValueError("Parametr k musi wynosić co najmniej 8")
+        self.k = k
+        self.count = 0
+        self.minimum: Any = None
+        self.maximum: Any = None
+        self._levels: List[List[Any]] = [[]]
+        self._size = 0
+        self._max_size = self._capacity(0)
+        self._rng = random.Random(seed)
+    
+    @property
+    def error(self) -> float:
+        """Przybliżony względny błąd rangi (ułamek liczby wartości)."""
+        return 1.7 / self.k
+    
+    def _capacity(self, level: int) -> int:
+        """Pojemność poziomu; najwyższy poziom ma pojemność k."""
+        depth = len(self._levels) - level - 1
+        return int(math.ceil(self.k * self._SHRINK ** depth)) + 1
+    
+    def _grow(self) -> None:
+        """Dodaje nowy najwyższy poziom i przelicza łączną pojemność."""
+        self._levels.append([])
+        self._max_size = sum(self._capacity(level) for level in range(len(self._levels)))
+    
+    def _compress(self) -> None:
+        """Kompaktuje pełne poziomy, aż szkic zmieści się w pojemności."""
+        for level in range(len(self._levels)):
+            items = self._levels[level]
+            if len(items) < self._capacity(level):
+                continue
+            if level + 1 == len(self._levels):
+                self._grow()
+            items.sort()
+            # Przy nieparzystej liczbie wartości ostatnia zostaje na poziomie
+            keep = [items.pop()] if len(items) % 2 else []
+            self._levels[level + 1].extend(items[self._rng.randrange(2)::2])
+            self._levels[level] = keep
+            self._size = sum(len(items) for items in self._levels)
+            if self._size < self._max_size:
+                break
+    
+    def add(self, value: Any) -> None:
+        """
+        Dodaje wartość do szkicu.
+        
+        Args:
+            value (Any): Wartość porównywalna z pozostałymi (np. liczba)
+        """
+        self.update((value,))
+    
+    def update(self, values: Iterable[Any]) -> 'QuantileSketch':
+        """
+        Dodaje wiele wartości (np. fragment danych lub strumień).
+        
+        Args:
+            values (Iterable[Any]): Wartości
+        
+        Returns:
+            QuantileSketch: Zwraca siebie dla chaining
+        """
+        low, high = self.minimum, self.maximum
+        base = self._levels[0]
+        for value in values:
+            if low is None or value < low:
+                low = value
+            if high is None or value > high:
+                high = value
+            base.append(value)
+            self.count += 1
+            self._size += 1
+            if self._size >= self._max_size:
+                self._compress()
+                base = self._levels[0]
+        self.minimum, self.maximum = low, high
+        return self
+    
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        """
+        Dołącza inny szkic do tego szkicu.
+        
+        Args:
+            other (QuantileSketch): Szkic o tym samym k
+        
+        Returns:
+            QuantileSketch: Zwraca siebie dla chaining
+        
+        Raises:
+            ValueError: Gdy szkice mają różne k
+        """
+        if other.k != self.k:
+            raise ValueError("Można łączyć tylko szkice o tym samym k")
+        if not other.count:
+            return self
+        while len(self._levels) < len(other._levels):
+            self._grow()
+        for level, items in enumerate(other._levels):
+            self._levels[level].extend(items)
+        self.count += other.count
+        if self.minimum is None or other.minimum < self.minimum:
+            self.minimum = other.minimum
+        if self.maximum is None or other.maximum > self.maximum:
+            self.maximum = other.maximum
+        self._size = sum(len(items) for items in self._levels)
+        while self._size >= self._max_size:
+            self._compress()
+        return self
+    
+    def __or__(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        """Zwraca nowy szkic będący połączeniem dwóch szkiców."""
+        return self.copy().merge(other)
+    
+    def copy(self) -> 'QuantileSketch':
+        """Zwraca kopię szkicu."""
+        sketch = QuantileSketch(k=self.k)
+        sketch.count, sketch.minimum, sketch.maximum = self.count, self.minimum, self.maximum
+        sketch._levels = [list(items) for items in self._levels]
+        sketch._size, sketch._max_size = self._size, self._max_size
+        sketch._rng.setstate(self._rng.getstate())
+        return sketch
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def _weighted(self) -> Tuple[List[Any], List[int]]:
+        """Posortowane wartości szkicu i skumulowane wagi (2**poziom)."""
+        pairs = sorted((value, 1 << level)
+                       for level, items in enumerate(self._levels) for value in items)
+        return [value for value, _ in pairs], list(accumulate(weight for _, weight in pairs))
+    
+    def rank(self, value: Any) -> int:
+        """
+        Zwraca przybliżoną liczbę wartości mniejszych lub równych value.
+        
+        Args:
+            value (Any): Wartość
+        
+        Returns:
+            int: Oszacowanie rangi
+        """
+        return sum(bisect_right(sorted(items), value) << level
+                   for level, items in enumerate(self._levels))
+    
+    def quantiles(self, qs: Sequence[float]) -> List[Any]:
+        """
+        Zwraca przybliżone kwantyle (wartości z danych, bez interpolacji).
+        
+        Kwantyle 0 i 1 są dokładne (minimum i maksimum).
+        
+        Args:
+            qs (Sequence[float]): Rzędy kwantyli z przedziału [0, 1]
+        
+        Returns:
+            List[Any]: Kwantyle w kolejności qs
+        
+        Raises:
+            ValueError: Gdy szkic jest pusty lub rząd jest spoza [0, 1]
+        """
+        if not self.count:
+            raise ValueError("Brak danych do obliczenia kwantyli")
+        if any(not 0 <= q <= 1 for q in qs):
+            raise ValueError("Rzędy kwantyli muszą należeć do przedziału [0, 1]")
+        values, cumulative = self._weighted()
+        total = cumulative[-1]
+        result = []
+        for q in qs:
+            if q == 0:
+                result.append(self.minimum)
+            elif q == 1:
+                result.append(self.maximum)
+            else:
+                # Pierwsza wartość, której skumulowana waga osiąga q * total
+                index = bisect_left(cumulative, q * total)
+                result.append(values[min(index, len(values) - 1)])
+        return result
+    
+    def quantile(self, q: float) -> Any:
+        """
+        Zwraca przybliżony kwantyl rzędu q.
+        
+        Args:
+            q (float): Rząd kwantyla z przedziału [0, 1]
+        
+        Returns:
+            Any: Kwantyl
+        """
+        return self.quantiles((q,))[0]
+    
+    def __repr__(self) -> str:
+        return (f"QuantileSketch(k={self.k}, count={self.count}, "
+                f"retained={self._size})")
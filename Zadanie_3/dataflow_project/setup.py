@@ -45,6 +45,12 @@ setup(
             "sphinx>=3.0",
             "sphinx-rtd-theme>=0.5",
         ],
+        "zstd": [
+            "zstandard>=0.15",
+        ],
+        "numpy": [
+            "numpy>=1.17",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -0,0 +1,87 @@
+"""
+Testy jednostkowe dla modułu aggregations
+"""
+
+import os
+import tempfile
+import unittest
+from dataflow.aggregations import aggregate_data
+from dataflow.data_utils import DataProcessor
+
+
+class TestAggregations(unittest.TestCase):
+
+    def setUp(self):
+        """Przygotowanie danych testowych"""
+        self.sample_data = [
+            {'name': 'Jan', 'city': 'Warszawa', 'dept': 'IT', 'salary': 5000},
+            {'name': 'Anna', 'city': 'Kraków', 'dept': 'HR', 'salary': 4000},
+            {'name': 'Piotr', 'city': 'Warszawa', 'dept': 'IT', 'salary': 7000},
+            {'name': 'Maria', 'city': 'Warszawa', 'dept': 'HR', 'salary': 4500}
+        ]
+    
+    def test_aggregate_single_key(self):
+        """Test agregacji według jednej kolumny"""
+        result = aggregate_data(self.sample_data, 'city',
+                                {'salary': ['sum', 'mean', 'count', 'min', 'max']})
+        self.assertEqual(result['Warszawa'], {
+            'count': 3, 'salary_sum': 16500, 'salary_mean': 5500.0,
+            'salary_count': 3, 'salary_min': 4500, 'salary_max': 7000
+        })
+        self.assertEqual(result['Kraków']['salary_mean'], 4000.0)
+    
+    def test_aggregate_multi_key(self):
+        """Test agregacji według wielu kolumn"""
+        result = aggregate_data(iter(self.sample_data), ['city', 'dept'], {'salary': 'sum'})
+        self.assertEqual(result, {
+            ('Warszawa', 'IT'): {'count': 2, 'salary_sum': 12000},
+            ('Kraków', 'HR'): {'count': 1, 'salary_sum': 4000},
+            ('Warszawa', 'HR'): {'count': 1, 'salary_sum': 4500}
+        })
+    
+    def test_aggregate_missing_values(self):
+        """Test pomijania brakujących wartości"""
+        data = [{'city': 'A', 'salary': 10}, {'city': 'A'}]
+        result = aggregate_data(data, 'city', {'salary': ['count', 'mean']})
+        self.assertEqual(result['A'], {'count': 2, 'salary_count': 1, 'salary_mean': 10.0})
+    
+    def test_aggregate_errors(self):
+        """Test obsługi błędów"""
+        with self.assertRaises(ValueError):
+            aggregate_data(self.sample_data, 'city', {'salary': ['median']})
+        with self.assertRaises(KeyError):
+            aggregate_data(self.sample_data, 'country', {'salary': 'sum'})
+        with self.assertRaises(ValueError):
+            aggregate_data(self.sample_data, 'city', {'name': 'sum'})
+        self.assertEqual(aggregate_data([], 'city', {'salary': 'sum'}), {})
+    
+    def test_processor_aggregate(self):
+        """Test agregacji w DataProcessor dla każdego sposobu przechowywania"""
+        expected = aggregate_data(self.sample_data, ['city', 'dept'], {'salary': ['sum', 'max']})
+        for storage in DataProcessor.STORAGE_TYPES:
+            processor = DataProcessor(self.sample_data, storage=storage)
+            self.assertEqual(processor.aggregate(['city', 'dept'], {'salary': ['sum', 'max']}),
+                             expected)
+    
+    def test_processor_aggregate_stream(self):
+        """Test agregacji strumienia CSV"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write('name,city,dept,salary\n')
+            for row in self.sample_data:
+                f.write(f"{row['name']},{row['city']},{row['dept']},{row['salary']}\n")
+            temp_file = f.name
+        
+        try:
+            processor = DataProcessor().stream_csv(temp_file).filter({'dept': 'IT'})
+            result = processor.aggregate('city', {'salary': ['mean']})
+            self.assertEqual(result, {'Warszawa': {'count': 2, 'salary_mean': 6000.0}})
+            self.assertTrue(processor.is_streaming)
+            
+            mapped = DataProcessor().map_csv(temp_file)
+            self.assertEqual(mapped.aggregate('dept', {'salary': 'min'})['HR']['salary_min'], 4000)
+        finally:
+            os.unlink(temp_file)
+
+
+if __name__ == '__main__':
+    unittest.main()
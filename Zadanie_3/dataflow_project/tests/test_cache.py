@@ -0,0 +1,103 @@
+"""
+Testy jednostkowe dla modułu cache
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from dataflow import data_utils
+from dataflow.cache import cache_path, read_cache, write_cache, source_stamp, CACHE_SUFFIX
+from dataflow.data_utils import load_csv_data, DataProcessor
+
+
+class TestCache(unittest.TestCase):
+
+    def setUp(self):
+        """Przygotowanie pliku CSV i katalogu pamięci podręcznej"""
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False,
+                                         encoding='utf-8') as f:
+            f.write('name,age,score,note\n')
+            f.write('Łukasz,25,1.5,a\n')
+            f.write('Anna,30,2.0,\n')
+            f.write('Piotr,35,3.25,7\n')
+            self.filepath = f.name
+        self.addCleanup(os.unlink, self.filepath)
+    
+    def test_roundtrip(self):
+        """Test zgodności danych z pamięci podręcznej z parsowaniem"""
+        expected = load_csv_data(self.filepath)
+        first = load_csv_data(self.filepath, cache_dir=self.cache_dir)
+        self.assertEqual(first, expected)
+        self.assertEqual(len([name for name in os.listdir(self.cache_dir)
+                              if name.endswith(CACHE_SUFFIX)]), 1)
+        
+        with mock.patch.object(data_utils, 'iter_csv_data') as parse:
+            second = load_csv_data(self.filepath, cache_dir=self.cache_dir)
+        parse.assert_not_called()
+        self.assertEqual(second, expected)
+        self.assertEqual([type(value) for value in second[2].values()],
+                         [type(value) for value in expected[2].values()])
+    
+    def test_converter_functions_in_key(self):
+        """Test rozróżniania różnych funkcji lambda w schemacie"""
+        first = load_csv_data(self.filepath, cache_dir=self.cache_dir,
+                              schema={'age': lambda s: int(s)})
+        second = load_csv_data(self.filepath, cache_dir=self.cache_dir,
+                               schema={'age': lambda s: int(s) * 100})
+        self.assertEqual(first[0]['age'], 25)
+        self.assertEqual(second[0]['age'], 2500)
+        
+        factor = 10
+        scaled = load_csv_data(self.filepath, cache_dir=self.cache_dir,
+                               schema={'age': lambda s: int(s) * factor})
+        self.assertEqual(scaled[0]['age'], 250)
+        # Domknięcia nie są zapisywane w pamięci podręcznej
+        self.assertEqual(len([name for name in os.listdir(self.cache_dir)
+                              if name.endswith(CACHE_SUFFIX)]), 2)
+    
+    def test_invalidation(self):
+        """Test unieważniania wpisu po zmianie pliku"""
+        load_csv_data(self.filepath, cache_dir=self.cache_dir)
+        with open(self.filepath, 'a', encoding='utf-8') as f:
+            f.write('Maria,40,4.0,b\n')
+        data = load_csv_data(self.filepath, cache_dir=self.cache_dir)
+        self.assertEqual(len(data), 4)
+        self.assertEqual(data[-1]['name'], 'Maria')
+    
+    def test_options_in_key(self):
+        """Test osobnych wpisów dla różnych opcji parsowania"""
+        typed = load_csv_data(self.filepath, cache_dir=self.cache_dir)
+        text = load_csv_data(self.filepath, cache_dir=self.cache_dir, schema={'age': str})
+        self.assertEqual(typed[0]['age'], 25)
+        self.assertEqual(text[0]['age'], '25')
+    
+    def test_corrupted_entry(self):
+        """Test pomijania uszkodzonego wpisu"""
+        stamp = source_stamp(self.filepath)
+        path = cache_path(self.cache_dir, self.filepath, {})
+        write_cache(path, stamp, [{'a': 1, 'b': 'x'}, {'a': 2, 'b': 'y'}])
+        self.assertEqual(read_cache(path, stamp)[1], 2)
+        self.assertIsNone(read_cache(path, (stamp[0] + 1, stamp[1])))
+        
+        with open(path, 'r+b') as f:
+            f.truncate(os.path.getsize(path) - 1)
+        self.assertIsNone(read_cache(path, stamp))
+    
+    def test_processor_columnar(self):
+        """Test ładowania z pamięci podręcznej do magazynu kolumnowego"""
+        for _ in range(2):
+            processor = DataProcessor(storage='columnar').load_from_csv(
+                self.filepath, cache_dir=self.cache_dir)
+            self.assertEqual(processor.data, load_csv_data(self.filepath))
+            self.assertEqual(processor._store.column_kind('age'), 'int')
+        
+        with self.assertRaises(FileNotFoundError):
+            load_csv_data('nie_istnieje.csv', cache_dir=self.cache_dir)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,164 @@
+"""
+Testy jednostkowe dla modułu columnar
+"""
+
+import unittest
+from array import array
+from dataflow.columnar import (
+    ColumnStore, ColumnBuilder, DictionaryColumn, dictionary_encode, MISSING
+)
+from dataflow.predicates import compile_conditions
+
+
+class TestColumnBuilder(unittest.TestCase):
+    
+    def test_int_column(self):
+        """Test kolumny liczb całkowitych"""
+        builder = ColumnBuilder()
+        for value in [1, 2, 3]:
+            builder.append(value)
+        self.assertEqual(builder.kind, 'int')
+        self.assertEqual(builder.buffer, array('q', [1, 2, 3]))
+    
+    def test_promotion_to_float(self):
+        """Test promocji kolumny int do float"""
+        builder = ColumnBuilder()
+        for value in [1, 2.5]:
+            builder.append(value)
+        self.assertEqual(builder.kind, 'float')
+        self.assertEqual(builder.buffer.tolist(), [1.0, 2.5])
+    
+    def test_promotion_to_object(self):
+        """Test promocji do kolumny obiektowej"""
+        builder = ColumnBuilder()
+        for value in [1, 'tekst', 2 ** 70]:
+            builder.append(value)
+        self.assertEqual(builder.kind, 'object')
+        self.assertEqual(builder.buffer, [1, 'tekst', 2 ** 70])
+    
+    def test_bool_is_object(self):
+        """Test zachowania typu bool"""
+        builder = ColumnBuilder()
+        builder.append(True)
+        self.assertEqual(builder.kind, 'object')
+        self.assertIs(builder.buffer[0], True)
+
+
+class TestColumnStore(unittest.TestCase):
+    
+    def setUp(self):
+        """Przygotowanie danych testowych"""
+        self.rows = [
+            {'name': 'Jan', 'age': 25, 'score': 85.5},
+            {'name': 'Anna', 'age': 30, 'score': 92.0},
+            {'name': 'Piotr', 'age': 25, 'score': 78.5}
+        ]
+        self.store = ColumnStore.from_rows(self.rows)
+    
+    def test_from_rows_types(self):
+        """Test doboru typów buforów"""
+        self.assertEqual(len(self.store), 3)
+        self.assertEqual(self.store.columns, ['name', 'age', 'score'])
+        self.assertEqual(self.store.column_kind('age'), 'int')
+        self.assertEqual(self.store.column_kind('score'), 'float')
+        self.assertEqual(self.store.column_kind('name'), 'object')
+    
+    def test_round_trip(self):
+        """Test odtworzenia wierszy z kolumn"""
+        self.assertEqual(self.store.to_rows(), self.rows)
+        self.assertEqual(self.store.row(1), self.rows[1])
+    
+    def test_missing_keys(self):
+        """Test wierszy o różnych zestawach kluczy"""
+        rows = [{'a': 1}, {'a': 2, 'b': 'x'}, {'b': 'y'}]
+        store = ColumnStore.from_rows(rows)
+        self.assertEqual(store.to_rows(), rows)
+        self.assertEqual(store.column('a')[2], MISSING)
+        self.assertEqual(store.get_column_values('b'), ['x', 'y'])
+    
+    def test_find_equal_and_take(self):
+        """Test wyszukiwania i wybierania wierszy"""
+        positions = self.store.find_equal('age', 25)
+        self.assertEqual(positions, [0, 2])
+        self.assertEqual(self.store.find_equal('name', 'Jan', positions), [0])
+        self.assertEqual(self.store.find_equal('nonexistent', 1), [])
+        
+        subset = self.store.take(positions)
+        self.assertEqual(subset.get_column_values('name'), ['Jan', 'Piotr'])
+        self.assertEqual(subset.column_kind('age'), 'int')
+    
+    def test_column_nonexistent(self):
+        """Test pobierania nieistniejącej kolumny"""
+        with self.assertRaises(KeyError):
+            self.store.column('nonexistent')
+    
+    def test_different_lengths(self):
+        """Test kolumn o różnych długościach"""
+        with self.assertRaises(ValueError):
+            ColumnStore({'a': [1, 2], 'b': [1]})
+    
+    def test_memory_usage(self):
+        """Test szacowania zużycia pamięci"""
+        self.assertGreater(self.store.memory_usage(), 0)
+
+
+
+class TestDictionaryColumn(unittest.TestCase):
+    
+    def setUp(self):
+        """Przygotowanie danych testowych"""
+        self.cities = ['Warszawa', 'Kraków', 'Warszawa', 'Gdańsk', 'Kraków', 'Warszawa']
+        self.rows = [{'id': i, 'city': city} for i, city in enumerate(self.cities)]
+        self.store = ColumnStore.from_rows(self.rows)
+    
+    def test_encode(self):
+        """Test kodowania wartości"""
+        column = DictionaryColumn.encode(self.cities)
+        self.assertEqual(column.values, ['Warszawa', 'Kraków', 'Gdańsk'])
+        self.assertEqual(column.codes, array('B', [0, 1, 0, 2, 1, 0]))
+        self.assertEqual(list(column), self.cities)
+        self.assertEqual(column[3], 'Gdańsk')
+        self.assertEqual(column.code('Kraków'), 1)
+        self.assertIsNone(column.code('Poznań'))
+        self.assertIsNone(column.code(['lista']))
+    
+    def test_detection(self):
+        """Test wykrywania kolumn o małej liczbie wartości"""
+        self.assertEqual(self.store.column_kind('city'), 'dictionary')
+        self.assertEqual(self.store.column_kind('id'), 'int')
+        self.assertIsInstance(dictionary_encode(['a', 'a']), DictionaryColumn)
+        self.assertEqual(dictionary_encode(['a', 'b']), ['a', 'b'])
+        self.assertEqual(dictionary_encode(['a', 'a', 1, 1]), ['a', 'a', 1, 1])
+        plain = ColumnStore.from_rows(self.rows, dictionary=False)
+        self.assertEqual(plain.column_kind('city'), 'object')
+    
+    def test_shared_objects(self):
+        """Test współdzielenia obiektów napisów w odtworzonych wierszach"""
+        rows = self.store.to_rows()
+        self.assertEqual(rows, self.rows)
+        self.assertIs(rows[0]['city'], rows[2]['city'])
+    
+    def test_operations_on_codes(self):
+        """Test wyszukiwania, wybierania i filtrowania po kodach"""
+        self.assertEqual(self.store.find_equal('city', 'Warszawa'), [0, 2, 5])
+        self.assertEqual(self.store.find_equal('city', 'Kraków', [0, 1, 2, 4]), [1, 4])
+        self.assertEqual(self.store.find_equal('city', 'Poznań'), [])
+        
+        subset = self.store.take([1, 3])
+        self.assertEqual(subset.column_kind('city'), 'dictionary')
+        self.assertEqual(subset.column('city').unique(), ['Kraków', 'Gdańsk'])
+        
+        predicate = compile_conditions({'city': ('in', {'Kraków', 'Gdańsk'})})
+        self.assertEqual(predicate.select(self.store), [1, 3, 4])
+        self.assertEqual(predicate.select(self.store, [0, 3, 4]), [3, 4])
+    
+    def test_memory_usage(self):
+        """Test mniejszego zużycia pamięci"""
+        rows = [{'city': f"miasto {i % 10}"} for i in range(10000)]
+        encoded = ColumnStore.from_rows(rows)
+        plain = ColumnStore.from_rows(rows, dictionary=False)
+        self.assertLess(encoded.memory_usage() * 4, plain.memory_usage())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+"""
+Testy jednostkowe dla modułu columnfile
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from dataflow.columnfile import ColumnarFile, write_columnar
+from dataflow.columnar import ColumnStore
+from dataflow.predicates import compile_conditions
+from dataflow.data_utils import DataProcessor
+
+
+class TestColumnarFile(unittest.TestCase):
+
+    def setUp(self):
+        """Przygotowanie danych testowych i katalogu tymczasowego"""
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, 'dane.dfcol')
+        self.rows = [{'id': i, 'city': ['Warszawa', 'Kraków'][i % 2], 'score': i / 4}
+                     for i in range(100)]
+    
+    def test_roundtrip(self):
+        """Test zapisu i odczytu z magazynu kolumnowego i z wierszy"""
+        for source in (ColumnStore.from_rows(self.rows), iter(self.rows)):
+            self.assertEqual(write_columnar(self.path, source, chunk_size=30), 100)
+            columnar = ColumnarFile(self.path)
+            self.assertEqual(len(columnar), 100)
+            self.assertEqual(columnar.chunk_count, 4)
+            self.assertEqual(list(columnar.iter_rows()), self.rows)
+            self.assertEqual(columnar.zones('id'), [(0, 29), (30, 59), (60, 89), (90, 99)])
+    
+    def test_missing_and_mixed_values(self):
+        """Test kolumn z brakami i wartościami różnych typów"""
+        rows = [{'a': 1}, {'a': 'x', 'b': None}, {'b': 2.5}]
+        write_columnar(self.path, rows, chunk_size=2)
+        self.assertEqual(list(ColumnarFile(self.path).iter_rows()), rows)
+        self.assertEqual(ColumnarFile(self.path).column('b'), [None, 2.5])
+    
+    def test_chunk_skipping(self):
+        """Test pomijania porcji na podstawie statystyk min/max"""
+        write_columnar(self.path, self.rows, chunk_size=10)
+        columnar = ColumnarFile(self.path)
+        predicate = compile_conditions({'id': ('between', (35, 42)), 'city': 'Kraków'})
+        self.assertEqual(columnar.chunks_for(predicate), [3, 4])
+        self.assertEqual(columnar.chunks_for(compile_conditions({'id': ('in', [5, 95])})), [0, 9])
+        self.assertEqual(columnar.chunks_for(compile_conditions({'other': 1})), [])
+        
+        with mock.patch.object(ColumnarFile, '_read_chunk',
+                               autospec=True, side_effect=ColumnarFile._read_chunk) as read:
+            result = list(columnar.iter_rows(['id'], predicate))
+        self.assertEqual(result, [{'id': i} for i in (35, 37, 39, 41)])
+        # Kolumny warunku i pozostałe kolumny tylko dla dwóch porcji
+        self.assertEqual(sorted({call[0][2] for call in read.call_args_list}), [3, 4])
+        self.assertNotIn('score', [name for call in read.call_args_list for name in call[0][3]])
+    
+    def test_nan_values(self):
+        """Test statystyk porcji z wartościami NaN (wynik jak bez pomijania porcji)"""
+        nan = float('nan')
+        rows = [{'v': value, 'name': name} for value, name in
+                [(nan, 'a'), (5.0, 'b'), (1.0, 'c'), (nan, 'd'), (7.5, 'e'), (nan, 'f')]]
+        conditions = [{'v': 5.0}, {'v': ('>', 6)}, {'v': ('<=', 1)},
+                      {'v': ('between', (4, 8))}, {'v': ('in', [1.0, 7.5])}]
+        for storage in DataProcessor.STORAGE_TYPES:
+            for chunk_size in (2, 3, 6):
+                DataProcessor(rows, storage=storage).save_columnar(self.path, chunk_size=chunk_size)
+                self.assertNotIn(None, ColumnarFile(self.path).zones('v')[:2])
+                for condition in conditions:
+                    expected = DataProcessor(rows, storage=storage).filter(condition).data
+                    loaded = DataProcessor(storage=storage).load_columnar(self.path)
+                    self.assertEqual(loaded.filter(condition).data, expected)
+        self.assertEqual(ColumnarFile(self.path).zones('v'), [(1.0, 7.5)])
+    
+    def test_read_to_store(self):
+        """Test wczytania kolumn do magazynu kolumnowego"""
+        write_columnar(self.path, self.rows, chunk_size=30)
+        store = ColumnarFile(self.path).read(['id', 'city'],
+                                             compile_conditions({'id': ('>=', 95)}))
+        self.assertEqual(store.columns, ['id', 'city'])
+        self.assertEqual(store.column_kind('id'), 'int')
+        self.assertEqual(store.get_column_values('id'), [95, 96, 97, 98, 99])
+    
+    def test_invalid_file(self):
+        """Test odczytu pliku w innym formacie"""
+        with open(self.path, 'wb') as f:
+            f.write(b'id,name\n1,Jan\n')
+        with self.assertRaises(ValueError):
+            ColumnarFile(self.path)
+        with self.assertRaises(FileNotFoundError):
+            ColumnarFile(os.path.join(self.directory, 'brak.dfcol'))
+        with self.assertRaises(ValueError):
+            write_columnar(self.path, self.rows, chunk_size=0)
+    
+    def test_processor_save_and_load(self):
+        """Test save_columnar i load_columnar w DataProcessor"""
+        for storage in DataProcessor.STORAGE_TYPES:
+            DataProcessor(self.rows, storage=storage).save_columnar(self.path, chunk_size=16)
+            processor = DataProcessor(storage=storage).load_columnar(self.path)
+            self.assertTrue(processor.is_streaming)
+            self.assertEqual(processor.count_rows(), 100)
+            self.assertEqual(processor.range('id', 10, 12), self.rows[10:13])
+            self.assertEqual(processor.materialize().data, self.rows)
+            
+            processor.filter({'score': ('>', 24)})
+            self.assertEqual(processor.get_column_values('id'), [97, 98, 99])
+        
+        processor = DataProcessor().load_columnar(self.path).filter({'id': ('<', 3)})
+        self.assertEqual(processor.to_columnar().count_rows(), 3)
+        self.assertFalse(processor.is_streaming)
+        self.assertEqual(processor.data, self.rows[:3])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+Testy jednostkowe dla modułu compression
+"""
+
+import os
+import bz2
+import gzip
+import lzma
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from dataflow import compression, data_utils
+from dataflow.compression import detect_compression, open_text, read_bytes
+from dataflow.data_utils import load_csv_data, infer_csv_schema, DataProcessor
+
+
+class TestCompression(unittest.TestCase):
+
+    def setUp(self):
+        """Przygotowanie plików CSV: zwykłego i skompresowanych"""
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.text = 'id,name,note\n' + ''.join(
+            f'{i},Łukasz {i},"linia\ndruga ""{i}"""\n' for i in range(300))
+        self.plain = self._write('dane.csv', open, 'w')
+        self.compressed = {
+            'gzip': self._write('dane.csv.gz', gzip.open, 'wt'),
+            'bz2': self._write('dane.csv.bz2', bz2.open, 'wt'),
+            'xz': self._write('dane.csv.xz', lzma.open, 'wt'),
+        }
+    
+    def _write(self, name, opener, mode):
+        """Zapisuje treść testową podaną funkcją otwierającą"""
+        path = os.path.join(self.directory, name)
+        with opener(path, mode, encoding='utf-8', newline='') as f:
+            f.write(self.text)
+        return path
+    
+    def test_detect_compression(self):
+        """Test rozpoznawania formatu po sygnaturze"""
+        self.assertIsNone(detect_compression(self.plain))
+        for name, path in self.compressed.items():
+            self.assertEqual(detect_compression(path), name)
+        
+        renamed = os.path.join(self.directory, 'bez_rozszerzenia')
+        shutil.copy(self.compressed['gzip'], renamed)
+        self.assertEqual(detect_compression(renamed), 'gzip')
+        with open_text(renamed) as f:
+            self.assertEqual(f.read(), self.text)
+        self.assertEqual(read_bytes(renamed), self.text.encode('utf-8'))
+    
+    def test_zstd_without_package(self):
+        """Test komunikatu dla zstd bez pakietu zstandard"""
+        path = os.path.join(self.directory, 'dane.csv.zst')
+        with open(path, 'wb') as f:
+            f.write(b'\x28\xb5\x2f\xfd' + b'\x00' * 8)
+        with mock.patch.object(compression, 'zstandard', None):
+            with self.assertRaises(ValueError):
+                load_csv_data(path)
+    
+    def test_load_compressed(self):
+        """Test ładowania skompresowanych plików we wszystkich trybach"""
+        expected = load_csv_data(self.plain)
+        for path in self.compressed.values():
+            self.assertEqual(load_csv_data(path), expected)
+            self.assertEqual(infer_csv_schema(path)['id'], int)
+            with mock.patch.object(data_utils, 'MIN_PARALLEL_CHUNK', 1000):
+                self.assertEqual(load_csv_data(path, workers=2), expected)
+            
+            stream = DataProcessor().stream_csv(path).filter({'id': 7})
+            self.assertEqual(stream.data, [expected[7]])
+            self.assertEqual(DataProcessor().load_many([path]).count_rows(), 300)
+        
+        with self.assertRaises(ValueError):
+            DataProcessor().map_csv(self.compressed['gzip'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,13 +5,18 @@ Testy jednostkowe dla modułu data_utils
 import unittest
 import tempfile
 import os
+import shutil
+from unittest import mock
+from dataflow import data_utils
 from dataflow.data_utils import (
-    load_csv_data, filter_data, group_by_column, DataProcessor
+    load_csv_data, iter_csv_data, infer_csv_schema, filter_data, 
+    group_by_column, DataProcessor
 )
+from dataflow.indexes import HashIndex
 
 
 class TestDataUtils(unittest.TestCase):
-    
+
     def setUp(self):
         """Przygotowanie danych testowych"""
         self.sample_data = [
@@ -45,6 +50,110 @@ class TestDataUtils(unittest.TestCase):
         with self.assertRaises(FileNotFoundError):
             load_csv_data('nieistniejacy_plik.csv')
     
+    def _write_csv(self, content):
+        """Zapisuje tymczasowy plik CSV i zwraca jego ścieżkę"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write(content)
+        self.addCleanup(os.unlink, f.name)
+        return f.name
+    
+    def test_load_csv_data_negative_numbers(self):
+        """Test konwersji liczb ujemnych na int"""
+        path = self._write_csv('a,b\n-5,-1.5\n+3,2\n')
+        data = load_csv_data(path)
+        self.assertEqual(data[0]['a'], -5)
+        self.assertIsInstance(data[0]['a'], int)
+        self.assertEqual(data[1]['a'], 3)
+        self.assertEqual(data[1]['b'], 2.0)
+        
+        per_cell = load_csv_data(path, infer_schema=False)
+        self.assertIsInstance(per_cell[0]['a'], int)
+        self.assertIsInstance(per_cell[1]['b'], int)
+    
+    def test_infer_csv_schema(self):
+        """Test wnioskowania typów kolumn"""
+        path = self._write_csv('name,age,score,code\nJan,25,85.5,A1\nAnna,,92,7\n')
+        schema = infer_csv_schema(path)
+        self.assertEqual(schema, {'name': str, 'age': int, 'score': float, 'code': str})
+    
+    def test_load_csv_data_schema_fallback(self):
+        """Test wartości niepasujących do wywnioskowanego typu"""
+        path = self._write_csv('age\n25\n30\n\x20\nbrak\n')
+        data = load_csv_data(path, sample_size=2)
+        self.assertEqual([row['age'] for row in data], [25, 30, ' ', 'brak'])
+    
+    def test_load_csv_data_explicit_schema(self):
+        """Test jawnego schematu"""
+        path = self._write_csv('zip,age\n00123,25\n')
+        data = load_csv_data(path, schema={'zip': str})
+        self.assertEqual(data, [{'zip': '00123', 'age': 25}])
+    
+    def test_load_csv_data_ragged_row(self):
+        """Test wiersza z nieprawidłową liczbą pól"""
+        path = self._write_csv('a,b\n1,2\n3\n')
+        with self.assertRaises(ValueError):
+            load_csv_data(path)
+    
+    def test_load_csv_data_parallel(self):
+        """Test równoległego parsowania z polami zawierającymi nowe linie"""
+        lines = ['id,text,value']
+        for i in range(300):
+            if i % 3 == 0:
+                lines.append(f'{i},"linia {i}\nz ""cudzysłowem"", i przecinkiem",{i * 0.5}')
+            else:
+                lines.append(f'{i},zwykły tekst,{-i}')
+        path = self._write_csv('\n'.join(lines) + '\n')
+        
+        with mock.patch.object(data_utils, 'MIN_PARALLEL_CHUNK', 256):
+            self.assertGreater(len(data_utils._chunk_boundaries(path, 256)), 3)
+            parallel = load_csv_data(path, workers=2)
+        
+        self.assertEqual(parallel, load_csv_data(path))
+        self.assertEqual(parallel[3]['text'], 'linia 3\nz "cudzysłowem", i przecinkiem')
+    
+    def test_load_csv_data_parallel_ragged_row(self):
+        """Test błędu formatu w trybie równoległym"""
+        path = self._write_csv('a,b\n' + '1,2\n' * 200 + '3\n')
+        with mock.patch.object(data_utils, 'MIN_PARALLEL_CHUNK', 256):
+            with self.assertRaises(ValueError):
+                load_csv_data(path, workers=2)
+    
+    def test_iter_csv_data_lazy(self):
+        """Test leniwego odczytu wierszy z pliku CSV"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write('name,age,city\n')
+            f.write('Jan,25,Warszawa\n')
+            f.write('Anna,30,Kraków\n')
+            temp_file = f.name
+        
+        try:
+            rows = iter_csv_data(temp_file)
+            self.assertEqual(next(rows), {'name': 'Jan', 'age': 25, 'city': 'Warszawa'})
+            self.assertEqual(next(rows)['age'], 30)
+            with self.assertRaises(StopIteration):
+                next(rows)
+        finally:
+            os.unlink(temp_file)
+    
+    def test_iter_csv_data_columns(self):
+        """Test odczytu wybranych kolumn"""
+        path = self._write_csv('name,age,city\nJan,25,Warszawa\n')
+        rows = list(iter_csv_data(path, columns=['city', 'age']))
+        self.assertEqual(rows, [{'age': 25, 'city': 'Warszawa'}])
+    
+    def test_filter_data_iterator_is_lazy(self):
+        """Test filtrowania iteratora bez materializacji"""
+        result = filter_data(iter(self.sample_data), {'city': 'Warszawa'})
+        self.assertNotIsInstance(result, list)
+        self.assertEqual([row['name'] for row in result], ['Jan', 'Piotr'])
+    
+    def test_group_by_column_iterator(self):
+        """Test grupowania danych z iteratora"""
+        result = group_by_column(iter(self.sample_data), 'city')
+        self.assertEqual(len(result['Warszawa']), 2)
+        with self.assertRaises(KeyError):
+            group_by_column(iter(self.sample_data), 'nonexistent')
+    
     def test_filter_data_single_condition(self):
         """Test filtrowania z jednym warunkiem"""
         result = filter_data(self.sample_data, {'age': 25})
@@ -67,6 +176,25 @@ class TestDataUtils(unittest.TestCase):
         result = filter_data(self.sample_data, {})
         self.assertEqual(result, self.sample_data)
     
+    def test_filter_data_operators(self):
+        """Test filtrowania z operatorami"""
+        result = filter_data(self.sample_data, {'age': ('>', 25)})
+        self.assertEqual([row['name'] for row in result], ['Anna', 'Maria'])
+        
+        result = filter_data(self.sample_data, {'city': ('in', {'Kraków', 'Gdańsk'}),
+                                                'name': ('regex', '^M')})
+        self.assertEqual([row['name'] for row in result], ['Maria'])
+        
+        with self.assertRaises(ValueError):
+            filter_data(self.sample_data, {'age': ('between', 1)})
+    
+    def test_filter_data_with_index(self):
+        """Test filtrowania z użyciem indeksu"""
+        indexes = {'city': HashIndex.from_rows(self.sample_data, 'city')}
+        result = filter_data(self.sample_data, {'city': 'Warszawa', 'age': 25}, indexes)
+        self.assertEqual([row['name'] for row in result], ['Jan', 'Piotr'])
+        self.assertEqual(filter_data(self.sample_data, {'city': 'Łódź'}, indexes), [])
+    
     def test_group_by_column_success(self):
         """Test poprawnego grupowania danych"""
         result = group_by_column(self.sample_data, 'city')
@@ -87,7 +215,7 @@ class TestDataUtils(unittest.TestCase):
 
 
 class TestDataProcessor(unittest.TestCase):
-    
+
     def setUp(self):
         """Przygotowanie danych testowych"""
         self.sample_data = [
@@ -122,6 +250,37 @@ class TestDataProcessor(unittest.TestCase):
         with self.assertRaises(KeyError):
             self.processor.get_column_values('nonexistent')
     
+    def test_iter_column(self):
+        """Test leniwego odczytu kolumny (także porcjami i bez odtwarzania wierszy)"""
+        self.assertEqual(list(self.processor.iter_column('age')), [25, 30, 25])
+        self.assertEqual(list(self.processor.iter_column('age', chunk_size=2)), [[25, 30], [25]])
+        
+        rows = [{'name': f'n{i}', 'value': i} for i in range(10)] + [{'name': 'x'}]
+        columnar = DataProcessor(rows, storage='columnar')
+        with mock.patch.object(data_utils.ColumnStore, 'iter_rows') as iter_rows:
+            chunks = list(columnar.iter_column('value', chunk_size=4))
+            view = columnar.where({'value': ('>=', 7)})
+            self.assertEqual(list(view.iter_column('value')), [7, 8, 9])
+            self.assertEqual(list(columnar.iter_column('name'))[-2:], ['n9', 'x'])
+            iter_rows.assert_not_called()
+        self.assertEqual([list(chunk) for chunk in chunks], [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]])
+        self.assertEqual(list(DataProcessor(rows).iter_column('value')), list(range(10)))
+        
+        with self.assertRaises(KeyError):
+            columnar.iter_column('nonexistent')
+        with self.assertRaises(KeyError):
+            list(self.processor.iter_column('nonexistent'))
+        with self.assertRaises(ValueError):
+            self.processor.iter_column('age', chunk_size=0)
+    
+    def test_iter_rows(self):
+        """Test leniwego odczytu wierszy z wybranymi kolumnami"""
+        self.assertEqual(list(self.processor.iter_rows()), self.processor.data)
+        columnar = DataProcessor(self.processor.data, storage='columnar')
+        self.assertEqual(list(columnar.iter_rows(['age'])), [{'age': 25}, {'age': 30}, {'age': 25}])
+        view = columnar.where({'age': 30})
+        self.assertEqual([row['age'] for row in view.iter_rows(['age'])], [30])
+    
     def test_get_unique_values(self):
         """Test pobierania unikalnych wartości"""
         unique_ages = self.processor.get_unique_values('age')
@@ -134,6 +293,251 @@ class TestDataProcessor(unittest.TestCase):
         # Po filtrowaniu
         self.processor.filter({'age': 25})
         self.assertEqual(self.processor.count_rows(), 2)
+    
+    def test_columnar_storage(self):
+        """Test kolumnowego przechowywania danych"""
+        processor = DataProcessor(self.sample_data, storage='columnar')
+        self.assertEqual(processor.storage, 'columnar')
+        self.assertEqual(processor.data, self.sample_data)
+        self.assertEqual(processor.get_column_values('score'), [85.5, 92.0, 78.5])
+        self.assertEqual(sorted(processor.get_unique_values('age')), [25, 30])
+        
+        processor.filter({'age': 25})
+        self.assertEqual(processor.count_rows(), 2)
+        self.assertEqual(processor.get_column_values('name'), ['Jan', 'Piotr'])
+        
+        with self.assertRaises(KeyError):
+            processor.get_column_values('nonexistent')
+    
+    def test_columnar_dictionary_columns(self):
+        """Test kolumn kodowanych słownikowo w DataProcessor"""
+        rows = [{'city': city, 'age': age} for city, age in
+                [('Warszawa', 25), ('Kraków', 30), ('Warszawa', 35), ('Warszawa', 40)]]
+        processor = DataProcessor(rows, storage='columnar')
+        self.assertEqual(processor.get_unique_values('city'), ['Warszawa', 'Kraków'])
+        groups = processor.group_by('city')
+        self.assertEqual(groups, group_by_column(rows, 'city'))
+        self.assertEqual(list(groups), ['Warszawa', 'Kraków'])
+        self.assertEqual(DataProcessor(rows).group_by('city'), groups)
+        
+        processor.filter({'city': 'Warszawa', 'age': ('>', 30)})
+        self.assertEqual(processor.get_column_values('age'), [35, 40])
+        with self.assertRaises(KeyError):
+            processor.group_by('nonexistent')
+    
+    def test_columnar_filter_operators(self):
+        """Test filtrowania z operatorami w trybie kolumnowym"""
+        processor = DataProcessor(self.sample_data, storage='columnar')
+        processor.filter({'score': ('>=', 80), 'name': ('!=', 'Anna')})
+        self.assertEqual(processor.get_column_values('name'), ['Jan'])
+    
+    def test_storage_switching(self):
+        """Test przełączania sposobu przechowywania"""
+        self.processor.to_columnar().filter({'name': 'Anna'})
+        self.assertEqual(self.processor.count_rows(), 1)
+        self.processor.to_rows()
+        self.assertEqual(self.processor.storage, 'rows')
+        self.assertEqual(self.processor.data, [self.sample_data[1]])
+    
+    def test_invalid_storage(self):
+        """Test nieznanego sposobu przechowywania"""
+        with self.assertRaises(ValueError):
+            DataProcessor(storage='invalid')
+    
+    def test_create_index(self):
+        """Test indeksu używanego przez filter"""
+        self.processor.create_index('age')
+        self.assertEqual(self.processor.indexed_columns, ['age'])
+        self.processor.filter({'age': 25})
+        self.assertEqual([row['name'] for row in self.processor.data], ['Jan', 'Piotr'])
+        
+        # Indeks jest przebudowywany po zmianie danych
+        self.processor.data.append({'name': 'Ewa', 'age': 25, 'score': 60.0})
+        self.processor.filter({'age': 25})
+        self.assertEqual(self.processor.count_rows(), 3)
+        self.processor.filter({'name': 'Ewa', 'age': 25})
+        self.assertEqual(self.processor.count_rows(), 1)
+        
+        self.processor.drop_index('age')
+        self.assertEqual(self.processor.indexed_columns, [])
+    
+    def test_index_same_size_edit(self):
+        """Test przebudowy indeksu po zmianie wiersza w miejscu"""
+        processor = DataProcessor([{'x': 1}, {'x': 2}, {'x': 1}])
+        processor.create_index('x').create_sorted_index('x')
+        processor.data[0]['x'] = 9
+        self.assertEqual(processor.where({'x': 9}).count_rows(), 1)
+        self.assertEqual(processor.where({'x': 1}).count_rows(), 1)
+        self.assertEqual(processor.range('x', 5, 10), [{'x': 9}])
+        processor.filter({'x': 9})
+        self.assertEqual(processor.data, [{'x': 9}])
+    
+    def test_index_repeated_in_operand(self):
+        """Test powtórzonych wartości operatora 'in' na indeksowanej kolumnie"""
+        rows = [{'c': 'A', 'n': 1}, {'c': 'B', 'n': 2}, {'c': 'A', 'n': 3}]
+        for storage in DataProcessor.STORAGE_TYPES:
+            for create in ('create_index', 'create_sorted_index'):
+                processor = getattr(DataProcessor(rows, storage=storage), create)('c')
+                getattr(processor, create)('n')
+                self.assertEqual(processor.where({'c': ('in', ['A', 'A'])}).count_rows(), 2)
+                self.assertEqual(processor.where({'n': ('in', [1, 1])}).count_rows(), 1)
+                processor.filter({'c': ('in', ['A', 'B', 'A'])})
+                self.assertEqual(processor.data, rows)
+    
+    def test_create_index_columnar(self):
+        """Test indeksu w trybie kolumnowym"""
+        processor = DataProcessor(self.sample_data, storage='columnar')
+        processor.create_index('name').filter({'name': 'Anna', 'age': 30})
+        self.assertEqual(processor.data, [self.sample_data[1]])
+        processor.filter({'name': 'Jan'})
+        self.assertEqual(processor.count_rows(), 0)
+    
+    def test_sorted_index_range_and_top_k(self):
+        """Test zapytań zakresowych i top-k z indeksem i bez"""
+        rows = [{'name': name, 'age': age} for name, age in
+                [('Jan', 28), ('Anna', 25), ('Piotr', 35), ('Maria', 30), ('Ewa', 25)]]
+        for storage in DataProcessor.STORAGE_TYPES:
+            plain = DataProcessor(rows, storage=storage)
+            indexed = DataProcessor(rows, storage=storage).create_sorted_index('age')
+            for processor in (plain, indexed):
+                self.assertEqual([row['name'] for row in processor.range('age', 25, 30)],
+                                 ['Anna', 'Ewa', 'Jan', 'Maria'])
+                self.assertEqual([row['name'] for row in processor.top_k('age', 2)],
+                                 ['Piotr', 'Maria'])
+                self.assertEqual([row['name'] for row in processor.top_k('age', 2, largest=False)],
+                                 ['Anna', 'Ewa'])
+                self.assertEqual(processor.range('age', 40), [])
+            
+            indexed.filter({'age': ('>', 26)})
+            self.assertEqual([row['name'] for row in indexed.data], ['Jan', 'Piotr', 'Maria'])
+            self.assertEqual(indexed.top_k('age', 1), [{'name': 'Piotr', 'age': 35}])
+            self.assertEqual(indexed.indexed_columns, ['age'])
+        
+        with self.assertRaises(ValueError):
+            DataProcessor().stream_csv('nieistniejacy_plik.csv').create_sorted_index('age')
+        with self.assertRaises(TypeError):
+            DataProcessor([{'a': 1}, {'a': 'x'}]).top_k('a', 1)
+    
+    def test_create_index_errors(self):
+        """Test błędów tworzenia indeksu"""
+        with self.assertRaises(KeyError):
+            self.processor.create_index('nonexistent')
+        
+        processor = DataProcessor().stream_csv('nieistniejacy_plik.csv')
+        with self.assertRaises(ValueError):
+            processor.create_index('age')
+    
+    def test_where_views(self):
+        """Test widoków z wektorem selekcji"""
+        rows = [{'id': i, 'city': ['A', 'B', 'C'][i % 3], 'score': float(i)} for i in range(30)]
+        for storage in DataProcessor.STORAGE_TYPES:
+            processor = DataProcessor([dict(row) for row in rows], storage=storage)
+            processor.create_index('city')
+            view = processor.where({'city': 'A'})
+            nested = view.where({'id': ('>', 10)})
+            
+            self.assertTrue(nested.is_view)
+            self.assertFalse(nested.is_streaming)
+            self.assertEqual(list(nested._selection), [12, 15, 18, 21, 24, 27])
+            self.assertEqual(nested.get_column_values('id'), [12, 15, 18, 21, 24, 27])
+            self.assertEqual(nested.aggregate('city', {'score': 'sum'})['A']['score_sum'], 117.0)
+            self.assertEqual(nested.top_k('id', 1)[0]['id'], 27)
+            self.assertIn('view', nested.lazy().explain())
+            
+            # filter na widoku zawęża tylko ten widok
+            nested.filter({'id': ('<', 20)})
+            self.assertEqual((processor.count_rows(), view.count_rows(), nested.count_rows()),
+                             (30, 10, 3))
+            self.assertTrue(nested.is_view)
+            
+            copy = nested.materialize()
+            self.assertFalse(copy.is_view)
+            self.assertEqual(copy.storage, storage)
+            self.assertEqual(copy.data, nested.data)
+            with self.assertRaises(ValueError):
+                nested.create_index('id')
+        
+        # Widok danych w wierszach współdzieli słowniki z procesorem bazowym
+        processor = DataProcessor(rows)
+        self.assertIs(processor.where({'id': 0}).data[0], rows[0])
+        self.assertIsNot(processor.where({'id': 0}).materialize().data[0], rows[0])
+    
+    def test_where_stream(self):
+        """Test widoków na źródle strumieniowym i zmapowanym"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write('id,city\n')
+            for i in range(10):
+                f.write(f"{i},{'AB'[i % 2]}\n")
+            temp_file = f.name
+        
+        try:
+            stream = DataProcessor().stream_csv(temp_file)
+            view = stream.where({'city': 'A'})
+            self.assertTrue(view.is_streaming)
+            self.assertEqual((stream.count_rows(), view.count_rows()), (10, 5))
+            
+            mapped = DataProcessor().map_csv(temp_file)
+            view = mapped.where({'city': 'A'}).where({'id': ('>', 4)})
+            self.assertEqual(view.get_column_values('id'), [6, 8])
+            self.assertEqual(mapped.count_rows(), 10)
+        finally:
+            os.unlink(temp_file)
+    
+    def test_load_many(self):
+        """Test współbieżnego ładowania wielu plików z raportem błędów"""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        for hour in range(6):
+            with open(os.path.join(directory, f'godzina_{hour:02d}.csv'), 'w') as f:
+                f.write('hour,value\n')
+                f.write(f'{hour},{hour * 10}\n{hour},{hour * 10 + 1}\n')
+        with open(os.path.join(directory, 'godzina_03.csv'), 'w') as f:
+            f.write('hour,value\n3,30,extra\n')
+        
+        pattern = os.path.join(directory, '*.csv')
+        for workers, storage in ((1, 'rows'), (2, 'columnar')):
+            processor = DataProcessor(storage=storage).load_many(pattern, workers=workers)
+            self.assertEqual(processor.get_column_values('hour'), [0, 0, 1, 1, 2, 2, 4, 4, 5, 5])
+            self.assertEqual(list(processor.load_errors),
+                             [os.path.join(directory, 'godzina_03.csv')])
+            self.assertIsInstance(processor.load_errors[pattern.replace('*', 'godzina_03')],
+                                  ValueError)
+        
+        paths = [os.path.join(directory, 'godzina_05.csv'), 'brak.csv',
+                 os.path.join(directory, 'godzina_00.csv')]
+        processor = DataProcessor().load_many(paths, threads=2)
+        self.assertEqual(processor.get_column_values('value'), [50, 51, 0, 1])
+        self.assertIsInstance(processor.load_errors['brak.csv'], FileNotFoundError)
+        with self.assertRaises(FileNotFoundError):
+            DataProcessor().load_many(os.path.join(directory, '*.json'))
+    
+    def test_stream_csv(self):
+        """Test trybu strumieniowego z chainingiem"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write('name,age,score\n')
+            f.write('Jan,25,85.5\n')
+            f.write('Anna,30,92.0\n')
+            f.write('Piotr,25,78.5\n')
+            temp_file = f.name
+        
+        try:
+            processor = DataProcessor().stream_csv(temp_file).filter({'age': 25})
+            self.assertTrue(processor.is_streaming)
+            self.assertEqual(processor.count_rows(), 2)
+            self.assertEqual(processor.get_column_values('score'), [85.5, 78.5])
+            self.assertEqual(processor.get_unique_values('age'), [25])
+            
+            # Odczyt atrybutu data materializuje strumień
+            self.assertEqual(len(processor.data), 2)
+            self.assertFalse(processor.is_streaming)
+            
+            columnar = DataProcessor().stream_csv(temp_file).to_columnar()
+            self.assertEqual(columnar.count_rows(), 3)
+            
+            loaded = DataProcessor(storage='columnar').load_from_csv(temp_file)
+            self.assertEqual(loaded.get_column_values('age'), [25, 30, 25])
+        finally:
+            os.unlink(temp_file)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,87 @@
+"""
+Testy jednostkowe dla modułu indexes
+"""
+
+import unittest
+from dataflow.indexes import HashIndex, SortedIndex
+from dataflow.columnar import MISSING
+
+
+class TestHashIndex(unittest.TestCase):
+    
+    def setUp(self):
+        """Przygotowanie danych testowych"""
+        self.rows = [
+            {'name': 'Jan', 'city': 'Warszawa'},
+            {'name': 'Anna', 'city': 'Kraków'},
+            {'name': 'Piotr', 'city': 'Warszawa'},
+            {'name': 'Maria'}
+        ]
+        self.index = HashIndex.from_rows(self.rows, 'city')
+    
+    def test_lookup(self):
+        """Test wyszukiwania wartości"""
+        self.assertEqual(self.index.lookup('Warszawa'), [0, 2])
+        self.assertEqual(self.index.lookup('Kraków'), [1])
+        self.assertEqual(self.index.lookup('Gdańsk'), [])
+    
+    def test_lookup_unhashable(self):
+        """Test wyszukiwania wartości niehaszowalnej"""
+        self.assertEqual(self.index.lookup(['Warszawa']), [])
+    
+    def test_missing_values_not_indexed(self):
+        """Test pomijania brakujących wartości"""
+        self.assertEqual(self.index.size, 4)
+        self.assertEqual(sorted(self.index.values()), ['Kraków', 'Warszawa'])
+        self.assertEqual(len(HashIndex('a', [1, MISSING, 1])), 1)
+    
+    def test_count(self):
+        """Test liczenia wierszy z wartością"""
+        self.assertEqual(self.index.count('Warszawa'), 2)
+        self.assertEqual(self.index.count('Gdańsk'), 0)
+
+
+
+class TestSortedIndex(unittest.TestCase):
+    
+    def setUp(self):
+        """Przygotowanie danych testowych"""
+        self.ages = [30, 25, 40, 25, MISSING, 35]
+        self.index = SortedIndex('age', self.ages)
+    
+    def test_range(self):
+        """Test zapytań zakresowych"""
+        self.assertEqual(self.index.range(25, 30), [1, 3, 0])
+        self.assertEqual(self.index.range(26, 39), [0, 5])
+        self.assertEqual(self.index.range(low=35), [5, 2])
+        self.assertEqual(self.index.range(high=30, include_high=False), [1, 3])
+        self.assertEqual(self.index.range(50, 60), [])
+        self.assertEqual(self.index.range('a', 'b'), [])
+        self.assertEqual(len(self.index), 5)
+        self.assertEqual(self.index.size, 6)
+    
+    def test_positions_for(self):
+        """Test warunków obsługiwanych przez indeks"""
+        self.assertEqual(self.index.positions_for('==', 25), [1, 3])
+        self.assertEqual(self.index.positions_for('>', 30), [2, 5])
+        self.assertEqual(self.index.positions_for('<=', 30), [0, 1, 3])
+        self.assertEqual(self.index.positions_for('between', (30, 35)), [0, 5])
+        self.assertIsNone(self.index.positions_for('!=', 30))
+    
+    def test_smallest_largest(self):
+        """Test k najmniejszych i największych wartości"""
+        self.assertEqual(self.index.smallest(3), [1, 3, 0])
+        self.assertEqual(self.index.largest(2), [2, 5])
+        values = [5, 3, 5, 1, 5]
+        self.assertEqual(SortedIndex('v', values).largest(2), [0, 2])
+        self.assertEqual(SortedIndex('v', values).largest(10), [0, 2, 4, 1, 3])
+        self.assertEqual(self.index.largest(0), [])
+    
+    def test_not_comparable(self):
+        """Test kolumny z wartościami nieporównywalnymi"""
+        with self.assertRaises(TypeError):
+            SortedIndex('x', [1, 'a'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+Testy jednostkowe dla modułu joins
+"""
+
+import os
+import tempfile
+import unittest
+from dataflow.joins import join_data, HashTable
+from dataflow.data_utils import DataProcessor
+
+
+class TestJoins(unittest.TestCase):
+
+    def setUp(self):
+        """Przygotowanie danych testowych"""
+        self.people = [
+            {'id': 1, 'name': 'Jan', 'city': 'Warszawa'},
+            {'id': 2, 'name': 'Anna', 'city': 'Kraków'},
+            {'id': 3, 'name': 'Piotr', 'city': 'Gdańsk'}
+        ]
+        self.orders = [
+            {'id': 1, 'amount': 100, 'city': 'Poznań'},
+            {'id': 1, 'amount': 250, 'city': 'Poznań'},
+            {'id': 2, 'amount': 80, 'city': 'Kraków'},
+            {'id': 9, 'amount': 10, 'city': 'Łódź'}
+        ]
+    
+    def test_inner_join(self):
+        """Test złączenia wewnętrznego"""
+        result = join_data(self.people, self.orders, on='id')
+        self.assertEqual([(row['name'], row['amount']) for row in result],
+                         [('Jan', 100), ('Jan', 250), ('Anna', 80)])
+        self.assertEqual(result[0]['city'], 'Warszawa')
+        self.assertEqual(result[0]['city_right'], 'Poznań')
+    
+    def test_left_join(self):
+        """Test złączenia lewostronnego"""
+        result = join_data(self.people, self.orders, on='id', how='left')
+        self.assertEqual(len(result), 4)
+        self.assertEqual(result[-1], self.people[2])
+    
+    def test_multi_column_join(self):
+        """Test złączenia według wielu kolumn"""
+        result = join_data(self.people, self.orders, on=['id', 'city'])
+        self.assertEqual(result, [{'id': 2, 'name': 'Anna', 'city': 'Kraków', 'amount': 80}])
+    
+    def test_join_iterator_and_errors(self):
+        """Test leniwego złączenia i obsługi błędów"""
+        result = join_data(iter(self.people), self.orders, on='id')
+        self.assertNotIsInstance(result, list)
+        self.assertEqual(len(list(result)), 3)
+        with self.assertRaises(ValueError):
+            join_data(self.people, self.orders, on='id', how='outer')
+    
+    def test_hash_table_unkeyed(self):
+        """Test wierszy bez klucza złączenia"""
+        table = HashTable([{'id': 1}, {'name': 'x'}, {'id': [1]}], 'id')
+        self.assertEqual(len(table), 1)
+        self.assertEqual(len(table.unkeyed), 2)
+        self.assertEqual(table.lookup({'id': [1]})[1], [])
+    
+    def test_processor_join_build_side(self):
+        """Test złączenia procesorów niezależnie od strony budującej"""
+        expected = join_data(self.people, self.orders, on='id', how='left')
+        key = lambda row: (row['id'], row.get('amount', 0))
+        for storage in DataProcessor.STORAGE_TYPES:
+            people = DataProcessor(self.people, storage=storage)
+            orders = DataProcessor(self.orders, storage=storage)
+            result = people.join(orders, on='id', how='left')
+            self.assertEqual(result.storage, storage)
+            self.assertEqual(sorted(result.data, key=key), sorted(expected, key=key))
+            
+            more_people = DataProcessor(self.people * 3, storage=storage)
+            self.assertEqual(more_people.join(orders, on='id').count_rows(), 9)
+    
+    def test_processor_join_stream(self):
+        """Test złączenia ze strumieniem CSV"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write('id,amount,city\n')
+            for row in self.orders:
+                f.write(f"{row['id']},{row['amount']},{row['city']}\n")
+            temp_file = f.name
+        
+        try:
+            people = DataProcessor(self.people)
+            result = people.join(DataProcessor().stream_csv(temp_file), on='id', how='left')
+            self.assertTrue(result.is_streaming)
+            self.assertEqual(result.count_rows(), 4)
+            self.assertEqual(sorted(result.get_column_values('amount')), [80, 100, 250])
+            self.assertEqual(result.aggregate('name', {'amount': 'sum'})['Jan']['amount_sum'], 350)
+            
+            orders = DataProcessor().map_csv(temp_file)
+            result = orders.join(people, on='id')
+            self.assertEqual([row['name'] for row in result.data], ['Jan', 'Jan', 'Anna'])
+        finally:
+            os.unlink(temp_file)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+"""
+Testy jednostkowe dla modułu mapped
+"""
+
+import gc
+import os
+import tempfile
+import unittest
+import warnings
+from dataflow.mapped import MappedCSV
+from dataflow.data_utils import DataProcessor, load_csv_data
+from dataflow.predicates import compile_conditions
+
+
+class TestMappedCSV(unittest.TestCase):
+
+    def setUp(self):
+        """Przygotowanie pliku testowego"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False,
+                                         encoding='utf-8', newline='') as f:
+            f.write('name,age,city,note\r\n')
+            f.write('Jan,25,Warszawa,brak\r\n')
+            f.write('Anna,30,Kraków,"dwie\nlinie, ""cytat"""\r\n')
+            f.write('\r\n')
+            f.write('Piotr,35,Warszawa,-\r\n')
+            self.path = f.name
+        self.mapped = MappedCSV(self.path)
+    
+    def tearDown(self):
+        """Zamknięcie i usunięcie pliku"""
+        self.mapped.close()
+        os.unlink(self.path)
+    
+    def test_index(self):
+        """Test indeksowania rekordów"""
+        self.assertEqual(self.mapped.header, ['name', 'age', 'city', 'note'])
+        self.assertEqual(len(self.mapped), 3)
+    
+    def test_row_and_column(self):
+        """Test odczytu wiersza i kolumny"""
+        self.assertEqual(self.mapped.row(1, ['note']), {'note': 'dwie\nlinie, "cytat"'})
+        self.assertEqual(self.mapped.column('age'), [25, 30, 35])
+        with self.assertRaises(KeyError):
+            self.mapped.column('nonexistent')
+    
+    def test_matches_load_csv_data(self):
+        """Test zgodności z load_csv_data"""
+        self.assertEqual(list(self.mapped.iter_rows()), load_csv_data(self.path))
+    
+    def test_iter_rows_predicate(self):
+        """Test odczytu z warunkiem i projekcją"""
+        predicate = compile_conditions({'city': 'Warszawa', 'age': ('>', 30)})
+        rows = list(self.mapped.iter_rows(['name'], predicate))
+        self.assertEqual(rows, [{'name': 'Piotr'}])
+        self.assertEqual(list(self.mapped.iter_rows(predicate=compile_conditions({'x': 1}))), [])
+    
+    def test_ragged_record(self):
+        """Test rekordu z nieprawidłową liczbą pól"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write('a,b\n1,2\n3\n')
+        try:
+            with MappedCSV(f.name, infer_schema=False) as mapped:
+                with self.assertRaises(ValueError):
+                    mapped.row(1)
+        finally:
+            os.unlink(f.name)
+    
+    def test_empty_file(self):
+        """Test pustego pliku"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            pass
+        try:
+            with MappedCSV(f.name) as mapped:
+                self.assertEqual(len(mapped), 0)
+                self.assertEqual(mapped.header, [])
+        finally:
+            os.unlink(f.name)
+    
+    def test_processor_map_csv(self):
+        """Test DataProcessor.map_csv"""
+        processor = DataProcessor().map_csv(self.path)
+        self.assertTrue(processor.is_streaming)
+        self.assertEqual(processor.count_rows(), 3)
+        self.assertEqual(processor.get_column_values('name'), ['Jan', 'Anna', 'Piotr'])
+        
+        processor.filter({'city': 'Warszawa'}).filter({'age': ('>', 30)})
+        self.assertEqual(processor.count_rows(), 1)
+        self.assertEqual(processor.lazy().select(['name']).collect(), [{'name': 'Piotr'}])
+        self.assertEqual(processor.data[0]['note'], '-')
+        self.assertFalse(processor.is_streaming)
+        
+        with self.assertRaises(FileNotFoundError):
+            DataProcessor().map_csv('nieistniejacy_plik.csv')
+    
+    def test_processor_releases_mapping(self):
+        """Test zwalniania mapowania przy zmianie źródła i close()"""
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', ResourceWarning)
+            processor = DataProcessor().map_csv(self.path)
+            first = processor._mapped
+            processor.map_csv(self.path)
+            self.assertTrue(first.closed)
+            
+            second = processor._mapped
+            processor.load_from_csv(self.path)
+            self.assertTrue(second.closed)
+            self.assertEqual(processor.count_rows(), 3)
+            
+            with DataProcessor().map_csv(self.path) as mapped:
+                third = mapped._mapped
+                self.assertEqual(mapped.count_rows(), 3)
+            self.assertTrue(third.closed)
+            self.assertEqual(mapped.count_rows(), 0)
+            
+            # Wczytanie danych z własnego mapowania zamyka je dopiero po odczycie
+            processor = DataProcessor().map_csv(self.path)
+            fourth = processor._mapped
+            self.assertEqual(len(processor.data), 3)
+            self.assertTrue(fourth.closed)
+            gc.collect()
+
+
+if __name__ == '__main__':
+    unittest.main()
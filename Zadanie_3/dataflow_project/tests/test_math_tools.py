@@ -4,13 +4,30 @@ Testy jednostkowe dla modułu math_tools
 
 import unittest
 import math
+import os
+import pickle
+import tempfile
+import random
+import statistics
+from array import array
+from unittest import mock
+from dataflow import math_tools
+from dataflow.data_utils import DataProcessor
+from dataflow.columnar import ColumnStore
 from dataflow.math_tools import (
-    calculate_statistics, normalize_data, calculate_correlation, MathCalculator
+    calculate_statistics, normalize_data, calculate_correlation, MathCalculator,
+    RunningStatistics, VECTOR_RTOL, calculate_quantiles, approximate_quantiles,
+    correlation_matrix, normalize_stream
 )
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class TestMathTools(unittest.TestCase):
-    
+
     def setUp(self):
         """Przygotowanie danych testowych"""
         self.sample_data = [1, 2, 3, 4, 5]
@@ -121,8 +138,357 @@ class TestMathTools(unittest.TestCase):
             calculate_correlation(x, y)
 
 
-class TestMathCalculator(unittest.TestCase):
+class TestQuantiles(unittest.TestCase):
+
+    def test_exact_quantiles(self):
+        """Test dokładnych kwantyli przez selekcję"""
+        generator = random.Random(11)
+        for size in [1, 2, 7, 100, 5001]:
+            data = [generator.randint(0, 50) for _ in range(size)]
+            ordered = sorted(data)
+            low, middle, high = calculate_quantiles(data, [0, 0.5, 1])
+            self.assertEqual((low, high), (ordered[0], ordered[-1]))
+            self.assertEqual(middle, statistics.median(data))
+            self.assertEqual(calculate_statistics(data)['median'], statistics.median(data))
+        
+        self.assertEqual(calculate_quantiles([5, 1, 4, 2, 3], [0.25, 0.5, 1]), [2, 3, 5])
+        self.assertEqual(calculate_quantiles([1, 2, 3, 4], [0.5, 0.25]), [2.5, 1.75])
+        self.assertEqual(calculate_quantiles(array('d', [3.0, 1.0]), [0.5]), [2.0])
+        self.assertEqual(calculate_quantiles(list(range(1000)), []), [])
+        
+        with self.assertRaises(ValueError):
+            calculate_quantiles([], [0.5])
+        with self.assertRaises(ValueError):
+            calculate_quantiles([1, 2], [1.5])
+        with self.assertRaises(ValueError):
+            calculate_quantiles([1, 'a'], [0.5])
+    
+    @unittest.skipIf(np is None, "NumPy nie jest zainstalowany")
+    def test_exact_quantiles_vectorized(self):
+        """Test zgodności kwantyli z numpy.quantile"""
+        data = [random.Random(2).random() for _ in range(3000)]
+        qs = [0.05, 0.5, 0.95]
+        expected = np.quantile(data, qs).tolist()
+        for result in (calculate_quantiles(np.array(data), qs), calculate_quantiles(data, qs)):
+            for value, reference in zip(result, expected):
+                self.assertTrue(math.isclose(value, reference, rel_tol=VECTOR_RTOL))
     
+    def test_approximate_quantiles(self):
+        """Test przybliżonych kwantyli strumienia"""
+        stream = (value for value in range(100000))
+        median, p99 = approximate_quantiles(stream, [0.5, 0.99], seed=3)
+        self.assertLessEqual(abs(median - 50000), 2000)
+        self.assertLessEqual(abs(p99 - 99000), 2000)
+        self.assertEqual(approximate_quantiles([4, 2, 9], [0, 1]), [2, 9])
+        
+        with self.assertRaises(ValueError):
+            approximate_quantiles([], [0.5])
+        with self.assertRaises(ValueError):
+            approximate_quantiles([1, None], [0.5])
+        with self.assertRaises(ValueError):
+            approximate_quantiles([1, 2], [-0.1])
+
+
+class TestNormalizeOutOfCore(unittest.TestCase):
+
+    def setUp(self):
+        """Przygotowanie danych testowych"""
+        generator = random.Random(4)
+        self.data = [generator.gauss(50, 10) for _ in range(3000)]
+        self.chunks = [self.data[i:i + 700] for i in range(0, len(self.data), 700)]
+    
+    def test_out_buffer(self):
+        """Test zapisu wyniku do bufora i normalizacji w miejscu"""
+        values = array('d', [1.0, 2.0, 3.0])
+        self.assertIs(normalize_data(values, out=values), values)
+        self.assertEqual(values, array('d', [0.0, 0.5, 1.0]))
+        
+        out = [None] * 3
+        self.assertIs(normalize_data([1, 2, 3], 'z-score', out=out), out)
+        self.assertEqual(out, [-1.0, 0.0, 1.0])
+        buffer = array('d', bytes(8 * len(self.data)))
+        normalize_data(self.data, 'z-score', out=buffer)
+        for value, expected in zip(buffer, normalize_data(self.data, 'z-score')):
+            self.assertAlmostEqual(value, expected, places=12)
+        
+        with self.assertRaises(ValueError):
+            normalize_data([1, 2], out=array('q', [0, 0]))
+        with self.assertRaises(ValueError):
+            normalize_data([1, 2], out=[0.0])
+        with self.assertRaises(ValueError):
+            normalize_data([1, 2], out=(0.0, 0.0))
+    
+    @unittest.skipIf(np is None, "NumPy nie jest zainstalowany")
+    def test_out_buffer_vectorized(self):
+        """Test normalizacji tablic NumPy w miejscu"""
+        vector = np.array(self.data)
+        expected = normalize_data(vector, 'z-score')
+        self.assertIs(normalize_data(vector, 'z-score', out=vector), vector)
+        self.assertTrue(np.allclose(vector, expected, rtol=VECTOR_RTOL))
+        narrow = np.empty(4, dtype=np.float32)
+        normalize_data(np.arange(4), out=narrow)
+        self.assertTrue(np.allclose(narrow, [0.0, 1 / 3, 2 / 3, 1.0]))
+        with self.assertRaises(ValueError):
+            normalize_data(np.arange(4), out=np.empty(4, dtype=np.int64))
+    
+    def test_stream_chunks(self):
+        """Test dwuprzebiegowej normalizacji porcji"""
+        for method in ('min-max', 'z-score'):
+            expected = normalize_data(self.data, method)
+            for source in (self.chunks, lambda: iter(self.chunks)):
+                result = [value for chunk in normalize_stream(source, method) for value in chunk]
+                self.assertEqual(len(result), len(expected))
+                for value, reference in zip(result, expected):
+                    self.assertAlmostEqual(value, reference, places=9)
+        
+        with self.assertRaises(ValueError):
+            normalize_stream(iter(self.chunks))
+        with self.assertRaises(ValueError):
+            normalize_stream([[]])
+        with self.assertRaises(ValueError):
+            normalize_stream(self.chunks, 'invalid_method')
+    
+    def test_stream_processor_column(self):
+        """Test normalizacji kolumny pliku czytanego strumieniowo"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write('value,name\n')
+            for i, value in enumerate(self.data):
+                f.write(f"{value!r},n{i}\n")
+            temp_file = f.name
+        try:
+            processor = DataProcessor().stream_csv(temp_file)
+            chunks = list(normalize_stream(processor, 'min-max', column='value', chunk_size=500))
+            self.assertEqual([len(chunk) for chunk in chunks], [500] * 6)
+            result = [value for chunk in chunks for value in chunk]
+            self.assertEqual(result, normalize_data(self.data, 'min-max'))
+            with self.assertRaises(KeyError):
+                normalize_stream(processor, column='missing')
+            with self.assertRaises(ValueError):
+                normalize_stream(processor, column='name')
+        finally:
+            os.unlink(temp_file)
+    
+    def test_columnar_processor_column(self):
+        """Test normalizacji kolumny danych kolumnowych bez odtwarzania wierszy"""
+        processor = DataProcessor([{'value': value} for value in self.data], storage='columnar')
+        with mock.patch.object(ColumnStore, 'iter_rows') as iter_rows:
+            chunks = list(normalize_stream(processor, 'z-score', column='value', chunk_size=1000))
+            iter_rows.assert_not_called()
+        self.assertEqual([len(chunk) for chunk in chunks], [1000] * 3)
+        expected = normalize_data(self.data, 'z-score')
+        result = [value for chunk in chunks for value in chunk]
+        for actual, value in zip(result, expected):
+            self.assertAlmostEqual(actual, value, places=9)
+
+
+class TestCorrelationMatrix(unittest.TestCase):
+
+    def setUp(self):
+        """Przygotowanie danych testowych"""
+        generator = random.Random(8)
+        self.columns = ['a', 'b', 'c', 'd']
+        self.rows = []
+        for i in range(5000):
+            base = generator.gauss(0, 1)
+            self.rows.append({'a': base, 'b': 2 * base + generator.gauss(0, 0.5),
+                              'c': generator.randint(0, 100), 'd': 1e6 - base, 'name': str(i)})
+    
+    def assertMatrixClose(self, matrix):
+        """Porównuje macierz z korelacjami par liczonymi na wartościach centrowanych"""
+        centered = {}
+        for column in self.columns:
+            values = [row[column] for row in self.rows]
+            column_mean = statistics.mean(values)
+            centered[column] = [value - column_mean for value in values]
+        for i, first in enumerate(self.columns):
+            for j, second in enumerate(self.columns):
+                x, y = centered[first], centered[second]
+                expected = math.fsum(a * b for a, b in zip(x, y)) / math.sqrt(
+                    math.fsum(a * a for a in x) * math.fsum(b * b for b in y))
+                self.assertAlmostEqual(matrix[i][j], expected, places=7)
+    
+    def test_storages(self):
+        """Test macierzy dla danych w pamięci, widoków i strumienia"""
+        for storage in DataProcessor.STORAGE_TYPES:
+            processor = DataProcessor(self.rows, storage=storage)
+            self.assertMatrixClose(correlation_matrix(processor, self.columns))
+            self.assertMatrixClose(correlation_matrix(processor.where(), self.columns))
+            with mock.patch.object(math_tools, 'np', None):
+                self.assertMatrixClose(correlation_matrix(processor, self.columns))
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write('a,b,c,d,name\n')
+            for row in self.rows:
+                f.write(f"{row['a']!r},{row['b']!r},{row['c']},{row['d']!r},{row['name']}\n")
+            temp_file = f.name
+        try:
+            processor = DataProcessor().stream_csv(temp_file)
+            self.assertMatrixClose(correlation_matrix(processor, self.columns))
+            self.assertTrue(processor.is_streaming)
+        finally:
+            os.unlink(temp_file)
+    
+    def test_constant_and_errors(self):
+        """Test kolumny stałej i błędnych danych"""
+        processor = DataProcessor([{'x': i, 'y': 5, 's': 'a'} for i in range(10)])
+        self.assertEqual(correlation_matrix(processor, ['x', 'y']), [[1.0, 0.0], [0.0, 0.0]])
+        
+        with self.assertRaises(KeyError):
+            correlation_matrix(processor, ['x', 'z'])
+        with self.assertRaises(ValueError):
+            correlation_matrix(processor, ['x', 's'])
+        with self.assertRaises(ValueError):
+            correlation_matrix(processor, ['x', 'x'])
+        with self.assertRaises(ValueError):
+            correlation_matrix(DataProcessor([{'x': 1, 'y': 2}]), ['x', 'y'])
+    
+    def test_missing_and_non_numeric_cells(self):
+        """Test brakujących i nieliczbowych komórek we wszystkich ścieżkach"""
+        rows = [{'x': i, 'y': 2 * i} for i in range(10)]
+        for bad in ({'x': 3}, {'x': 3, 'y': None}, {'x': 3, 'y': 'a'}, {'x': 3, 'y': [1]}):
+            data = rows[:5] + [bad] + rows[5:]
+            for storage in DataProcessor.STORAGE_TYPES:
+                processor = DataProcessor(data, storage=storage)
+                for source in (processor, processor.where()):
+                    with self.assertRaisesRegex(ValueError, "Kolumna 'y' zawiera wartości"):
+                        correlation_matrix(source, ['x', 'y'])
+                    with mock.patch.object(math_tools, 'np', None):
+                        with self.assertRaisesRegex(ValueError, "Kolumna 'y' zawiera wartości"):
+                            correlation_matrix(source, ['x', 'y'])
+
+
+class TestRunningStatistics(unittest.TestCase):
+
+    def setUp(self):
+        """Przygotowanie danych testowych"""
+        self.data = [3.5, 1.25, 10.0, -2.0, 7.75, 4.0, 4.0, 0.5]
+    
+    def test_single_pass_statistics(self):
+        """Test statystyk zgodnych z modułem statistics"""
+        stats = RunningStatistics(self.data)
+        self.assertEqual(stats.count, 8)
+        self.assertEqual(stats.total, sum(self.data))
+        self.assertEqual((stats.minimum, stats.maximum), (-2.0, 10.0))
+        self.assertAlmostEqual(stats.mean, statistics.mean(self.data), places=12)
+        self.assertAlmostEqual(stats.variance, statistics.variance(self.data), places=12)
+        self.assertAlmostEqual(stats.std, statistics.stdev(self.data), places=12)
+    
+    def test_chunks_and_merge(self):
+        """Test dodawania porcjami i łączenia akumulatorów"""
+        chunked = RunningStatistics()
+        for start in range(0, len(self.data), 3):
+            chunked.update(iter(self.data[start:start + 3]))
+        merged = RunningStatistics(self.data[:5]) + RunningStatistics(self.data[5:])
+        whole = RunningStatistics(self.data)
+        for stats in (chunked, merged, RunningStatistics().merge(whole)):
+            self.assertEqual(stats.count, whole.count)
+            self.assertAlmostEqual(stats.mean, whole.mean, places=12)
+            self.assertAlmostEqual(stats.variance, whole.variance, places=12)
+            self.assertEqual(stats.maximum, whole.maximum)
+        
+        restored = pickle.loads(pickle.dumps(merged))
+        self.assertEqual(restored.to_dict(), merged.to_dict())
+    
+    def test_numerical_stability(self):
+        """Test wariancji dla dużych wartości o małym rozrzucie"""
+        data = [1e9 + x for x in (4, 7, 13, 16)]
+        self.assertAlmostEqual(RunningStatistics(data).variance, 30.0, places=6)
+    
+    def test_empty_and_invalid(self):
+        """Test pustego akumulatora i nieprawidłowych danych"""
+        stats = RunningStatistics()
+        self.assertEqual(len(stats), 0)
+        self.assertEqual(stats.variance, 0.0)
+        with self.assertRaises(ValueError):
+            stats.mean
+        with self.assertRaises(ValueError):
+            stats.update([1, 'x'])
+        self.assertEqual(stats.count, 1)
+    
+    @unittest.skipIf(np is None, "NumPy nie jest zainstalowany")
+    def test_numpy_values(self):
+        """Test tablic i skalarów NumPy"""
+        stats = RunningStatistics(np.arange(5))
+        stats.update([np.int64(2 ** 62), np.float32(0.5)])
+        stats.add(np.uint8(255))
+        self.assertEqual(stats.count, 8)
+        self.assertEqual(stats.total, 10 + 2 ** 62 + 0.5 + 255)
+        self.assertEqual((stats.minimum, stats.maximum), (0, 2 ** 62))
+        merged = RunningStatistics([np.float64(x) for x in self.data]).merge(
+            RunningStatistics(np.array(self.data)))
+        self.assertAlmostEqual(merged.mean, statistics.mean(self.data), places=12)
+        self.assertEqual(approximate_quantiles(np.arange(1, 6), [0, 1]), [1, 5])
+        self.assertEqual(approximate_quantiles([np.int32(4), np.int32(2)], [0]), [2])
+        with self.assertRaises(ValueError):
+            RunningStatistics(np.array(['a', 'b']))
+
+
+class TestTypedInputs(unittest.TestCase):
+
+    def setUp(self):
+        """Przygotowanie danych testowych"""
+        generator = random.Random(3)
+        self.ints = [generator.randint(-500, 500) for _ in range(2001)]
+        self.floats = [generator.gauss(10, 3) for _ in range(2001)]
+    
+    def assertStatsClose(self, actual, expected):
+        """Porównuje słowniki statystyk z dokładnością VECTOR_RTOL"""
+        self.assertEqual(list(actual), list(expected))
+        for key, value in expected.items():
+            self.assertTrue(math.isclose(actual[key], value, rel_tol=VECTOR_RTOL),
+                            f"{key}: {actual[key]} != {value}")
+    
+    def test_array_inputs(self):
+        """Test buforów array.array z kolumn DataProcessor"""
+        processor = DataProcessor([{'a': x, 'b': y} for x, y in zip(self.ints, self.floats)],
+                                  storage='columnar')
+        column = processor.get_column_array('a')
+        self.assertIsInstance(column, array)
+        self.assertStatsClose(calculate_statistics(column), calculate_statistics(self.ints))
+        self.assertEqual(normalize_data(array('d', [1.0, 3.0])), [0.0, 1.0])
+        self.assertAlmostEqual(calculate_correlation(column, array('q', self.ints)), 1.0)
+        
+        self.assertEqual(DataProcessor([{'a': 1}, {'a': 2.5}]).get_column_array('a'),
+                         array('d', [1.0, 2.5]))
+        with self.assertRaises(ValueError):
+            DataProcessor([{'a': 'x'}]).get_column_array('a')
+        with self.assertRaises(ValueError):
+            calculate_statistics(array('u', 'abc'))
+    
+    @unittest.skipIf(np is None, "NumPy nie jest zainstalowany")
+    def test_vectorized_matches_python(self):
+        """Test zgodności ścieżki wektorowej z czystym Pythonem"""
+        for data in (self.ints, self.floats):
+            vectorized = calculate_statistics(np.array(data))
+            with mock.patch.object(math_tools, 'np', None):
+                expected = calculate_statistics(data)
+                expected_z = normalize_data(data, 'z-score')
+                expected_r = calculate_correlation(data, data[::-1])
+            self.assertStatsClose(vectorized, expected)
+            self.assertStatsClose(calculate_statistics(data), expected)
+            
+            normalized = normalize_data(np.array(data), 'z-score')
+            self.assertIsInstance(normalized, np.ndarray)
+            self.assertTrue(np.allclose(normalized, expected_z, rtol=VECTOR_RTOL))
+            self.assertIsInstance(normalize_data(data), list)
+            self.assertTrue(math.isclose(calculate_correlation(np.array(data), data[::-1]),
+                                         expected_r, rel_tol=VECTOR_RTOL))
+    
+    @unittest.skipIf(np is None, "NumPy nie jest zainstalowany")
+    def test_vectorized_validation(self):
+        """Test sprawdzania typu tablic NumPy"""
+        with self.assertRaises(ValueError):
+            calculate_statistics(np.array(['a', 'b']))
+        with self.assertRaises(ValueError):
+            normalize_data(np.ones((2, 2)))
+        self.assertEqual(calculate_statistics(np.array([7]))['std'], 0.0)
+        # Duże liczby całkowite - dokładna suma bez przepełnienia int64
+        big = np.array([2 ** 62, 2 ** 62, 1], dtype=np.int64)
+        self.assertEqual(calculate_statistics(big)['sum'], 2 ** 63 + 1)
+
+
+class TestMathCalculator(unittest.TestCase):
+
     def test_factorial(self):
         """Test obliczania silni"""
         self.assertEqual(MathCalculator.factorial(0), 1)
@@ -169,6 +535,62 @@ class TestMathCalculator(unittest.TestCase):
         self.assertFalse(MathCalculator.is_prime(1))
         self.assertFalse(MathCalculator.is_prime(-5))
     
+    def test_is_prime_large(self):
+        """Test testu Millera-Rabina dla dużych liczb"""
+        self.assertTrue(MathCalculator.is_prime(2 ** 61 - 1))
+        self.assertTrue(MathCalculator.is_prime(2 ** 64 - 59))
+        self.assertTrue(MathCalculator.is_prime(2 ** 89 - 1))
+        self.assertFalse(MathCalculator.is_prime((2 ** 31 - 1) * (2 ** 61 - 1)))
+        # Liczby Carmichaela i silne pseudopierwsze dla kolejnych zestawów podstaw
+        for composite in [561, 3215031751, 3825123056546413051,
+                          318665857834031151167461, 3317044064679887385961981]:
+            self.assertFalse(MathCalculator.is_prime(composite))
+        self.assertFalse(MathCalculator.is_prime(7.0))
+    
+    def test_primes_in_range(self):
+        """Test segmentowego sita"""
+        def trial_division(n):
+            return n > 1 and all(n % d for d in range(2, int(math.sqrt(n)) + 1))
+        
+        self.assertEqual(MathCalculator.primes_in_range(10, 30), [11, 13, 17, 19, 23, 29])
+        expected = [n for n in range(300000) if trial_division(n)]
+        # Kilka segmentów sita
+        self.assertEqual(MathCalculator.primes_in_range(-10, 300000), expected)
+        self.assertEqual(MathCalculator.primes_in_range(299000, 300000),
+                         [n for n in expected if n >= 299000])
+        self.assertEqual(MathCalculator.primes_in_range(10 ** 15, 10 ** 15 + 100),
+                         [10 ** 15 + 37, 10 ** 15 + 91])
+        self.assertEqual(MathCalculator.primes_in_range(20, 10), [])
+        
+        # Granice poza zakresem float i z dużym błędem zaokrąglenia sqrt
+        self.assertEqual(MathCalculator.primes_in_range(10 ** 400, 10 ** 400 + 69), [])
+        self.assertEqual(MathCalculator.primes_in_range(10 ** 60, 10 ** 60 + 70), [10 ** 60 + 7, 10 ** 60 + 67])
+        self.assertEqual(MathCalculator.primes_in_range(2 ** 89 - 1, 2 ** 89), [2 ** 89 - 1])
+        with self.assertRaises(ValueError):
+            MathCalculator.primes_in_range(0, 10.5)
+    
+    def test_isqrt(self):
+        """Test całkowitego pierwiastka dużych liczb (także bez math.isqrt)"""
+        values = [0, 1, 15, 16, 17, 2 ** 52 + 1, 3 ** 100, 10 ** 60 - 1, 10 ** 400 + 12345]
+        for use_builtin in (True, False):
+            with mock.patch.object(math_tools, 'math', math if use_builtin else
+                                   mock.Mock(spec=['sqrt', 'log'])):
+                for value in values:
+                    root = math_tools._isqrt(value)
+                    self.assertTrue(root * root <= value < (root + 1) ** 2, value)
+    
+    def test_is_prime_many(self):
+        """Test sprawdzania wielu liczb"""
+        generator = random.Random(6)
+        values = [generator.randrange(2 ** 20) for _ in range(5000)]
+        values += [generator.randrange(2 ** 62) for _ in range(200)]
+        values += [0, 1, -7, 2, 3.0, None, True]
+        expected = [MathCalculator.is_prime(value) for value in values]
+        self.assertEqual(MathCalculator.is_prime_many(values), expected)
+        self.assertEqual(MathCalculator.is_prime_many(iter(values)), expected)
+        self.assertEqual(MathCalculator.is_prime_many(array('q', [5, 6, 7])), [True, False, True])
+        self.assertEqual(MathCalculator.is_prime_many([]), [])
+    
     def test_gcd(self):
         """Test największego wspólnego dzielnika"""
         self.assertEqual(MathCalculator.gcd(12, 8), 4)
@@ -0,0 +1,105 @@
+"""
+Testy jednostkowe dla modułu predicates
+"""
+
+import unittest
+from dataflow.predicates import compile_conditions, Condition, Predicate
+from dataflow.columnar import ColumnStore
+from dataflow.indexes import HashIndex
+
+
+class TestCondition(unittest.TestCase):
+    
+    def test_comparisons(self):
+        """Test operatorów porównania"""
+        self.assertTrue(Condition('a', '>', 30).matches(31))
+        self.assertFalse(Condition('a', '>', 30).matches(30))
+        self.assertTrue(Condition('a', '>=', 30).matches(30))
+        self.assertTrue(Condition('a', '<', 30).matches(29))
+        self.assertTrue(Condition('a', '<=', 30).matches(30))
+        self.assertTrue(Condition('a', '!=', 30).matches(29))
+    
+    def test_membership_and_range(self):
+        """Test operatorów in, not in i between"""
+        self.assertTrue(Condition('a', 'in', {1, 2}).matches(2))
+        self.assertTrue(Condition('a', 'not in', [1, 2]).matches(3))
+        self.assertTrue(Condition('a', 'between', (1, 3)).matches(3))
+        self.assertFalse(Condition('a', 'between', (1, 3)).matches(4))
+    
+    def test_regex(self):
+        """Test operatora regex"""
+        condition = Condition('name', 'regex', r'^J')
+        self.assertTrue(condition.matches('Jan'))
+        self.assertFalse(condition.matches('Anna'))
+        self.assertFalse(condition.matches(25))
+    
+    def test_incomparable_values(self):
+        """Test wartości nieporównywalnych"""
+        self.assertFalse(Condition('a', '>', 30).matches('tekst'))
+    
+    def test_invalid_operator(self):
+        """Test nieprawidłowych argumentów"""
+        with self.assertRaises(ValueError):
+            Condition('a', '~', 1)
+        with self.assertRaises(ValueError):
+            Condition('a', 'between', 5)
+
+
+class TestPredicate(unittest.TestCase):
+    
+    def setUp(self):
+        """Przygotowanie danych testowych"""
+        self.rows = [
+            {'name': 'Jan', 'age': 25, 'city': 'Warszawa'},
+            {'name': 'Anna', 'age': 30, 'city': 'Kraków'},
+            {'name': 'Piotr', 'age': 35, 'city': 'Warszawa'},
+            {'name': 'Maria', 'age': 40}
+        ]
+    
+    def test_call(self):
+        """Test sprawdzania wierszy"""
+        predicate = compile_conditions({'age': ('>', 26), 'city': 'Warszawa'})
+        self.assertEqual([row['name'] for row in self.rows if predicate(row)], ['Piotr'])
+    
+    def test_multiple_conditions_per_column(self):
+        """Test listy warunków dla jednej kolumny"""
+        predicate = compile_conditions({'age': [('>=', 30), ('<', 40)]})
+        self.assertEqual(len(predicate), 2)
+        self.assertEqual([row['name'] for row in self.rows if predicate(row)], 
+                         ['Anna', 'Piotr'])
+    
+    def test_selectivity_order(self):
+        """Test porządkowania warunków według selektywności"""
+        predicate = compile_conditions({'age': ('!=', 1), 'city': 'Warszawa'})
+        self.assertEqual([c.op for c in predicate.conditions], ['==', '!='])
+        
+        # Indeks daje dokładną selektywność
+        indexes = {'city': HashIndex.from_rows(self.rows, 'city')}
+        predicate = compile_conditions({'city': 'Warszawa', 'name': ('in', {'Jan'})}, indexes)
+        self.assertEqual(predicate.conditions[0].column, 'name')
+    
+    def test_index_candidates(self):
+        """Test kandydatów z indeksu dla '==' i 'in'"""
+        indexes = {'city': HashIndex.from_rows(self.rows, 'city')}
+        predicate = compile_conditions({'city': ('in', ['Kraków', 'Warszawa'])})
+        self.assertEqual(predicate.index_candidates(indexes), [0, 1, 2])
+        self.assertIsNone(compile_conditions({'age': 25}).index_candidates(indexes))
+    
+    def test_select_columnar(self):
+        """Test wyznaczania wierszy na kolumnach"""
+        store = ColumnStore.from_rows(self.rows)
+        predicate = compile_conditions({'age': ('between', (30, 40)), 'city': ('!=', 'Kraków')})
+        self.assertEqual(predicate.select(store), [2])
+        self.assertEqual(compile_conditions({'age': ('>', 'x')}).select(store), [])
+        self.assertEqual(compile_conditions({'city': ('not in', ['Kraków'])}).select(store), [0, 2])
+        self.assertEqual(compile_conditions({'nonexistent': 1}).select(store), [])
+    
+    def test_compile_reuses_predicate(self):
+        """Test ponownego użycia skompilowanego warunku"""
+        predicate = compile_conditions({'age': 25})
+        self.assertIs(compile_conditions(predicate), predicate)
+        self.assertIsInstance(predicate, Predicate)
+
+
+if __name__ == '__main__':
+    unittest.main()
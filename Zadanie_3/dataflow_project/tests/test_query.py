@@ -0,0 +1,96 @@
+"""
+Testy jednostkowe dla modułu query
+"""
+
+import os
+import tempfile
+import unittest
+from dataflow.data_utils import DataProcessor
+from dataflow.query import LazyQuery
+
+
+class TestLazyQuery(unittest.TestCase):
+    
+    def setUp(self):
+        """Przygotowanie danych testowych"""
+        self.sample_data = [
+            {'name': 'Jan', 'age': 25, 'city': 'Warszawa'},
+            {'name': 'Anna', 'age': 30, 'city': 'Kraków'},
+            {'name': 'Piotr', 'age': 35, 'city': 'Warszawa'},
+            {'name': 'Maria', 'age': 40, 'city': 'Gdańsk'}
+        ]
+        self.processor = DataProcessor(self.sample_data)
+    
+    def test_filter_chain(self):
+        """Test łączenia kolejnych filtrów"""
+        query = self.processor.lazy().filter({'age': ('>', 26)}).filter({'city': 'Warszawa'})
+        self.assertIsInstance(query, LazyQuery)
+        self.assertEqual(query.collect(), [self.sample_data[2]])
+        self.assertEqual(query.count(), 1)
+        
+        # Dane procesora pozostają niezmienione
+        self.assertEqual(self.processor.count_rows(), 4)
+    
+    def test_select(self):
+        """Test projekcji kolumn"""
+        query = self.processor.lazy().select(['name', 'age']).filter({'age': ('<', 30)})
+        self.assertEqual(query.collect(), [{'name': 'Jan', 'age': 25}])
+        self.assertEqual(query.select(['name']).collect(), [{'name': 'Jan'}])
+        self.assertEqual(self.processor.lazy().get_column_values('age'), [25, 30, 35, 40])
+    
+    def test_filter_on_removed_column(self):
+        """Test filtra na kolumnie usuniętej projekcją"""
+        query = self.processor.lazy().select(['name']).filter({'city': 'Warszawa'})
+        self.assertEqual(query.collect(), [])
+        self.assertEqual(query.count(), 0)
+        self.assertIn('Empty', query.explain())
+    
+    def test_group_by(self):
+        """Test grupowania i liczenia grup"""
+        query = self.processor.lazy().filter({'age': ('>=', 30)}).group_by('city')
+        self.assertEqual(query.count(), {'Kraków': 1, 'Warszawa': 1, 'Gdańsk': 1})
+        
+        groups = self.processor.lazy().select(['name']).group_by('city').collect()
+        self.assertEqual(groups['Warszawa'], [{'name': 'Jan'}, {'name': 'Piotr'}])
+        
+        with self.assertRaises(ValueError):
+            query.filter({'age': 30})
+        with self.assertRaises(KeyError):
+            self.processor.lazy().group_by('nonexistent').count()
+    
+    def test_columnar(self):
+        """Test zapytania na danych kolumnowych"""
+        processor = DataProcessor(self.sample_data, storage='columnar')
+        query = processor.lazy().filter({'city': ('in', {'Warszawa', 'Gdańsk'})}).select(['name'])
+        self.assertEqual(query.collect(), [{'name': 'Jan'}, {'name': 'Piotr'}, {'name': 'Maria'}])
+    
+    def test_explain(self):
+        """Test opisu planu"""
+        query = (self.processor.lazy().filter({'age': ('>', 26)})
+                 .filter({'city': 'Warszawa'}).select(['name']))
+        plan = query.explain()
+        self.assertIn('Plan logiczny', plan)
+        self.assertIn("Filter city == 'Warszawa' AND age > 26", plan)
+        self.assertIn('Project [name]', plan)
+    
+    def test_stream_projection_pushdown(self):
+        """Test zawężania kolumn odczytywanych z CSV"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write('name,age,city\n')
+            for row in self.sample_data:
+                f.write(f"{row['name']},{row['age']},{row['city']}\n")
+            temp_file = f.name
+        
+        try:
+            processor = DataProcessor().stream_csv(temp_file).filter({'city': 'Warszawa'})
+            query = processor.lazy().filter({'age': ('>', 30)}).select(['name'])
+            self.assertEqual(query.collect(), [{'name': 'Piotr'}])
+            self.assertEqual(query.count(), 1)
+            self.assertIn('Scan stream kolumny: [name, age]', query.explain())
+            self.assertTrue(processor.is_streaming)
+        finally:
+            os.unlink(temp_file)
+
+
+if __name__ == '__main__':
+    unittest.main()
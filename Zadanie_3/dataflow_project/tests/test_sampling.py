@@ -0,0 +1,90 @@
+"""
+Testy jednostkowe dla modułu sampling
+"""
+
+import os
+import tempfile
+import unittest
+from collections import Counter
+from dataflow.sampling import reservoir_sample, stratified_sample
+from dataflow.data_utils import DataProcessor
+
+
+class TestSampling(unittest.TestCase):
+
+    def test_reservoir_sample(self):
+        """Test rozmiaru, kolejności i powtarzalności próbki"""
+        sample = reservoir_sample(iter(range(100000)), 50, seed=1)
+        self.assertEqual(len(sample), 50)
+        self.assertEqual(sample, sorted(set(sample)))
+        self.assertEqual(sample, reservoir_sample(range(100000), 50, seed=1))
+        self.assertEqual(reservoir_sample(range(3), 5), [0, 1, 2])
+        self.assertEqual(reservoir_sample(range(3), 0), [])
+        with self.assertRaises(ValueError):
+            reservoir_sample(range(3), -1)
+    
+    def test_reservoir_uniform(self):
+        """Test jednakowego prawdopodobieństwa wyboru elementów"""
+        counts = Counter()
+        for seed in range(4000):
+            counts.update(reservoir_sample(range(10), 3, seed=seed))
+        # Oczekiwana liczba wyborów każdego elementu: 4000 * 3 / 10 = 1200
+        self.assertEqual(len(counts), 10)
+        for count in counts.values():
+            self.assertAlmostEqual(count, 1200, delta=120)
+    
+    def test_stratified_sample(self):
+        """Test osobnych rezerwuarów dla warstw"""
+        strata = stratified_sample(range(1000), 4, key=lambda x: x < 10, seed=2)
+        self.assertEqual(list(strata), [True, False])
+        self.assertEqual(len(strata[True]), 4)
+        self.assertTrue(all(x < 10 for x in strata[True]))
+        self.assertEqual(strata[False], sorted(strata[False]))
+        self.assertEqual(stratified_sample(range(5), 3, key=lambda x: x % 2),
+                         {0: [0, 2, 4], 1: [1, 3]})
+    
+    def test_processor_sample(self):
+        """Test próbkowania w DataProcessor"""
+        rows = [{'id': i, 'city': 'ABC'[i % 3] if i < 95 else 'D'} for i in range(100)]
+        for storage in DataProcessor.STORAGE_TYPES:
+            processor = DataProcessor(rows, storage=storage)
+            sample = processor.sample(10, seed=5)
+            self.assertEqual(sample.storage, storage)
+            self.assertEqual(sample.count_rows(), 10)
+            self.assertEqual(processor.count_rows(), 100)
+            
+            stratified = processor.sample(2, stratify_by='city', seed=5)
+            ids = stratified.get_column_values('id')
+            self.assertEqual(ids, sorted(ids))
+            self.assertEqual(Counter(stratified.get_column_values('city')),
+                             {'A': 2, 'B': 2, 'C': 2, 'D': 2})
+            
+            view_sample = processor.where({'city': 'D'}).sample(3, seed=5)
+            self.assertEqual(set(view_sample.get_column_values('city')), {'D'})
+        
+        with self.assertRaises(KeyError):
+            DataProcessor(rows).sample(2, stratify_by='brak')
+    
+    def test_processor_sample_stream(self):
+        """Test próbkowania pliku czytanego strumieniowo"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write('id,city\n')
+            for i in range(500):
+                f.write(f"{i},{'AB'[i % 2]}\n")
+            temp_file = f.name
+        
+        try:
+            stream = DataProcessor().stream_csv(temp_file)
+            sample = stream.sample(20, seed=11)
+            self.assertTrue(stream.is_streaming)
+            self.assertFalse(sample.is_streaming)
+            # Ta sama próbka co dla danych w pamięci
+            in_memory = DataProcessor().load_from_csv(temp_file).sample(20, seed=11)
+            self.assertEqual(sample.data, in_memory.data)
+            self.assertEqual(stream.sample(5, stratify_by='city', seed=11).count_rows(), 10)
+        finally:
+            os.unlink(temp_file)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+"""
+Testy jednostkowe dla modułu sketches
+"""
+
+import os
+import pickle
+import tempfile
+import unittest
+import random
+from bisect import bisect_left
+from dataflow.sketches import HyperLogLog, QuantileSketch
+from dataflow.data_utils import DataProcessor
+
+
+class TestHyperLogLog(unittest.TestCase):
+
+    def test_estimate(self):
+        """Test dokładności oszacowania"""
+        for n in [0, 10, 1000, 50000]:
+            sketch = HyperLogLog(error=0.02).update(range(n))
+            self.assertLessEqual(abs(sketch.count() - n), max(2, n * 0.06))
+    
+    def test_duplicates(self):
+        """Test ignorowania powtórzeń"""
+        sketch = HyperLogLog().update(['a', 'b', 'a', 1, 1.0, 'b'])
+        self.assertEqual(sketch.count(), 3)
+        self.assertEqual(len(sketch), 3)
+    
+    def test_merge(self):
+        """Test łączenia szkiców"""
+        first = HyperLogLog().update(range(0, 6000))
+        second = HyperLogLog().update(range(4000, 10000))
+        merged = first | second
+        whole = HyperLogLog().update(range(10000))
+        self.assertEqual(merged.count(), whole.count())
+        self.assertEqual(first.count(), HyperLogLog().update(range(6000)).count())
+        with self.assertRaises(ValueError):
+            first.merge(HyperLogLog(precision=8))
+    
+    def test_serialization(self):
+        """Test serializacji do bajtów i pickle"""
+        sketch = HyperLogLog(precision=10).update(map(str, range(500)))
+        restored = HyperLogLog.from_bytes(sketch.to_bytes())
+        self.assertEqual(restored.count(), sketch.count())
+        self.assertEqual(pickle.loads(pickle.dumps(sketch)).count(), sketch.count())
+        with self.assertRaises(ValueError):
+            HyperLogLog.from_bytes(b'\x0a\x00')
+    
+    def test_parameters(self):
+        """Test doboru precyzji"""
+        self.assertEqual(HyperLogLog(error=0.01).precision, 14)
+        self.assertLessEqual(HyperLogLog(error=0.05).error, 0.05)
+        with self.assertRaises(ValueError):
+            HyperLogLog(error=0)
+        with self.assertRaises(ValueError):
+            HyperLogLog(precision=30)
+    
+    def test_processor_approx_unique(self):
+        """Test przybliżonej liczby unikalnych wartości w DataProcessor"""
+        rows = [{'id': i, 'city': f"miasto {i % 7}"} for i in range(3000)]
+        for storage in DataProcessor.STORAGE_TYPES:
+            processor = DataProcessor(rows, storage=storage)
+            self.assertEqual(processor.get_unique_values('city', approx=True).count(), 7)
+            estimate = processor.get_unique_values('id', approx=True).count()
+            self.assertLessEqual(abs(estimate - 3000), 100)
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write('id,city\n')
+            for row in rows:
+                f.write(f"{row['id']},{row['city']}\n")
+            temp_file = f.name
+        try:
+            processor = DataProcessor().stream_csv(temp_file)
+            sketch = processor.get_unique_values('city', approx=True)
+            self.assertIsInstance(sketch, HyperLogLog)
+            self.assertEqual(sketch.count(), 7)
+        finally:
+            os.unlink(temp_file)
+
+
+
+class TestQuantileSketch(unittest.TestCase):
+
+    def setUp(self):
+        """Przygotowanie danych testowych"""
+        generator = random.Random(5)
+        self.data = [generator.gauss(0, 1) for _ in range(60000)]
+        self.ordered = sorted(self.data)
+    
+    def assertRankClose(self, sketch, tolerance=0.02):
+        """Sprawdza błąd rangi kwantyli względem posortowanych danych"""
+        qs = [0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99]
+        for q, value in zip(qs, sketch.quantiles(qs)):
+            rank = bisect_left(self.ordered, value) / len(self.ordered)
+            self.assertLessEqual(abs(rank - q), tolerance, f"q={q}")
+    
+    def test_quantiles(self):
+        """Test dokładności i ograniczonej pamięci"""
+        sketch = QuantileSketch(k=200, seed=1).update(self.data)
+        self.assertEqual(len(sketch), 60000)
+        self.assertLess(sketch._size, 3 * 200 + 100)
+        self.assertRankClose(sketch)
+        self.assertEqual(sketch.quantiles([0, 1]), [self.ordered[0], self.ordered[-1]])
+        self.assertLessEqual(abs(sketch.rank(0.0) / 60000 - 0.5), 0.02)
+        
+        small = QuantileSketch()
+        for value in [3, 1, 2]:
+            small.add(value)
+        self.assertEqual(small.quantiles([0, 0.5, 1]), [1, 2, 3])
+    
+    def test_merge(self):
+        """Test łączenia szkiców z fragmentów danych"""
+        parts = [QuantileSketch(seed=i).update(self.data[i::3]) for i in range(3)]
+        merged = parts[0] | parts[1] | parts[2]
+        self.assertEqual(merged.count, 60000)
+        self.assertEqual(parts[0].count, 20000)
+        self.assertRankClose(merged)
+        with self.assertRaises(ValueError):
+            merged.merge(QuantileSketch(k=100))
+    
+    def test_determinism_and_pickle(self):
+        """Test powtarzalności przy tym samym ziarnie i serializacji"""
+        first = QuantileSketch(seed=7).update(self.data)
+        second = QuantileSketch(seed=7).update(self.data)
+        self.assertEqual(first.quantiles([0.3, 0.6]), second.quantiles([0.3, 0.6]))
+        restored = pickle.loads(pickle.dumps(first))
+        self.assertEqual(restored.quantiles([0.3, 0.6]), first.quantiles([0.3, 0.6]))
+    
+    def test_errors(self):
+        """Test błędnych parametrów"""
+        with self.assertRaises(ValueError):
+            QuantileSketch(k=2)
+        with self.assertRaises(ValueError):
+            QuantileSketch().quantile(0.5)
+        with self.assertRaises(ValueError):
+            QuantileSketch().update([1]).quantile(1.5)
+
+
+if __name__ == '__main__':
+    unittest.main()